@@ -0,0 +1,1904 @@
+"""
+A module with utilty classes and functions for AoC.
+"""
+
+import atexit
+import functools
+import inspect
+import mmap
+import os
+import re
+import sys
+from array import array
+from collections import Counter, OrderedDict, defaultdict, deque
+from contextlib import AbstractContextManager, contextmanager
+from heapq import heapify, heappop, heappush
+from itertools import accumulate, chain, compress, count
+from pathlib import Path
+from typing import Any, Callable, Generator, Hashable, Iterable, Iterator, Literal, NamedTuple, Protocol, TextIO, cast, overload
+
+import __main__
+
+from aoc.store import MEMO_STORE_ENV, MemoStore, table_name
+
+type file_content = list[str]
+
+type text_data = str | bytes | bytearray | mmap.mmap
+"""Text given as a string or as bytes, possibly mapped from a file with `mapfile`."""
+
+counters: Counter[str] = Counter()
+"""
+Counters of the operations performed by the search algorithms. They are only updated when
+counting is enabled, either with `enable_counters` or with the `AOC_COUNTERS` environment
+variable. When counting is disabled, the search algorithms run their uninstrumented code.
+"""
+
+_counting: bool = bool(os.environ.get("AOC_COUNTERS"))
+
+
+def enable_counters(enabled: bool = True):
+    """
+    Enable or disable counting of the operations performed by the search algorithms.
+    """
+    global _counting
+    _counting = enabled
+
+
+def counters_enabled() -> bool:
+    """
+    Return whether counting is enabled.
+    """
+    return _counting
+
+
+def dump_counters(file: TextIO = sys.stderr):
+    """
+    Print the values of the counters, followed by the statistics of the memoized functions.
+    """
+    for name, value in sorted((counters + memo_counters()).items()):
+        print(f"{name}: {value}", file=file)
+
+
+@atexit.register
+def _dump_counters_at_exit():
+    """
+    Print the counters at exit, if counting is enabled and something has been counted.
+    """
+    if _counting and (counters or memo_counters()):
+        dump_counters()
+
+
+def _input_path(filename: str) -> Path:
+    """
+    Return the path of an input file. A relative name is taken in the directory of the main
+    script, if there is one (there is none in an interactive session), and an absolute path
+    is used as it is.
+    """
+    path = Path(filename)
+    if path.is_absolute() or not hasattr(__main__, "__file__"):
+        return path
+    return Path(__main__.__file__).parent / path
+
+
+def readfile(filename: str) -> file_content:
+    """
+    Read an entire file.
+    """
+    with open(_input_path(filename)) as f:
+        return f.read().splitlines()
+
+
+def openfile(filename: str) -> TextIO:
+    """
+    Open a file in the correct directory.
+    """
+    return open(_input_path(filename))
+
+
+@overload
+def iterlines(filename: str, chunk_size: int = ..., binary: Literal[False] = ...) -> Iterator[str]: ...
+@overload
+def iterlines(filename: str, chunk_size: int, binary: Literal[True]) -> Iterator[bytes]: ...
+@overload
+def iterlines(filename: str, *, binary: Literal[True]) -> Iterator[bytes]: ...
+
+
+def iterlines(filename: str, chunk_size: int = 1 << 16, binary: bool = False) -> Iterator[str] | Iterator[bytes]:
+    """
+    Iterate over the lines of a file (without the newlines, which may be `\n` or `\r\n`),
+    reading it in chunks of `chunk_size` bytes, so that a large file is processed in constant
+    memory and while it is being read. If `binary` is true, the lines are returned as bytes
+    instead of being decoded.
+    """
+    lines = _iterlines(filename, chunk_size)
+    return lines if binary else (line.decode() for line in lines)
+
+
+def _iterlines(filename: str, chunk_size: int) -> Iterator[bytes]:
+    """
+    Iterate over the lines of a file as bytes, as described in `iterlines`.
+    """
+    with open(_input_path(filename), "rb", buffering=0) as f:
+        # the chunks read since the last newline, joined only once a newline is found, so that
+        # lines longer than a chunk are not copied again for each chunk
+        pending: list[bytes] = []
+        while chunk := f.read(chunk_size):
+            pending.append(chunk)
+            if b"\n" not in chunk:
+                continue
+            data = b"".join(pending)
+            lines = data.split(b"\n")
+            pending = [lines.pop()]
+            if b"\r" in data:
+                yield from (line.removesuffix(b"\r") for line in lines)
+            else:
+                yield from lines
+        if rest := b"".join(pending):
+            yield rest.removesuffix(b"\r")
+
+
+def mapfile(filename: str) -> bytes | mmap.mmap:
+    """
+    Map a file in memory, read-only. The content of the file is read lazily by the operating
+    system when accessed, and it is not copied in the memory of the process.
+    """
+    with open(_input_path(filename), "rb") as f:
+        try:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # empty files cannot be mapped
+            return b""
+
+
+INT_PATTERN = re.compile(rb"-?\d+")
+"""Regular expression matching a signed integer."""
+
+_INT_BYTES = bytes(c if c in b"0123456789-\n" else ord(" ") for c in range(256))
+"""Translation table replacing with spaces all the bytes which cannot occur in integers or newlines."""
+
+
+def _chunks(data: text_data, size: int = 1 << 20) -> Iterator[bytes | bytearray]:
+    """
+    Split `data` in chunks of about `size` bytes, ending with a newline (except the last one),
+    so that a large file is processed in constant memory.
+    """
+    if isinstance(data, str):
+        data = data.encode()
+    start = 0
+    while start < len(data):
+        end = data.find(b"\n", start + size) + 1 or len(data)
+        yield data[start:end]
+        start = end
+
+
+def _int_tokens(data: text_data) -> Iterator[list[bytes]]:
+    """
+    Yield, for each line of `data`, the list of the tokens of the signed integers it contains.
+    Translating all the other characters to spaces and splitting the result is much faster
+    than finding the integers with a regular expression, but it only works if all the dashes
+    are minus signs: this is checked when converting the tokens to integers.
+    """
+    for chunk in _chunks(data):
+        for line in bytes(chunk).translate(_INT_BYTES).split(b"\n"):
+            yield line.split()
+
+
+def _int_tokens_slow(data: text_data) -> Iterator[list[bytes]]:
+    """
+    Same as `_int_tokens`, but works when some dashes are not minus signs.
+    """
+    for chunk in _chunks(data):
+        for line in bytes(chunk).split(b"\n"):
+            yield INT_PATTERN.findall(line)
+
+
+def _to_ints(tokens: Iterable[bytes], typecode: str | None) -> array[int] | list[int]:
+    """
+    Convert tokens to integers, stored in an array with the given typecode, or in a list if
+    `typecode` is None.
+    """
+    return list(map(int, tokens)) if typecode is None else array(typecode, map(int, tokens))
+
+
+@overload
+def parse_ints(data: text_data, typecode: str = "q") -> array[int]: ...
+@overload
+def parse_ints(data: text_data, typecode: None) -> list[int]: ...
+
+
+def parse_ints(data: text_data, typecode: str | None = "q") -> array[int] | list[int]:
+    """
+    Return all the signed integers in `data` as an array with the given typecode (by default,
+    signed 64-bit integers), or as a list if `typecode` is None, which is needed for integers
+    which do not fit in 64 bits.
+    """
+    try:
+        return _to_ints(chain.from_iterable(_int_tokens(data)), typecode)
+    except ValueError:
+        # some dash is not a minus sign
+        return _to_ints(chain.from_iterable(_int_tokens_slow(data)), typecode)
+
+
+def _check_records(count: int, columns: int):
+    """
+    Check that `count` integers can be split in records of `columns` integers.
+    """
+    if count % columns != 0:
+        raise ValueError(f"{count} integers cannot be split in records of {columns}")
+
+
+@overload
+def parse_int_matrix(data: text_data, columns: int | None = None, typecode: str = "q") -> list[array[int]]: ...
+@overload
+def parse_int_matrix(data: text_data, columns: int | None = None, *, typecode: None) -> list[list[int]]: ...
+
+
+def parse_int_matrix(data: text_data, columns: int | None = None,
+                     typecode: str | None = "q") -> list[array[int]] | list[list[int]]:
+    """
+    Return the signed integers in `data` as a list of arrays (or of lists, if `typecode` is
+    None). If `columns` is None, there is one array for each line containing some integer.
+    Otherwise, there is one array for each record of `columns` integers, regardless of the
+    lines.
+    """
+    if columns is not None:
+        if typecode is None:
+            int_list = parse_ints(data, None)
+            _check_records(len(int_list), columns)
+            return [int_list[i:i + columns] for i in range(0, len(int_list), columns)]
+        int_array = parse_ints(data, typecode)
+        _check_records(len(int_array), columns)
+        return [int_array[i:i + columns] for i in range(0, len(int_array), columns)]
+    if typecode is None:
+        try:
+            return [list(map(int, tokens)) for tokens in _int_tokens(data) if tokens]
+        except ValueError:
+            # some dash is not a minus sign
+            return [list(map(int, tokens)) for tokens in _int_tokens_slow(data) if tokens]
+    try:
+        return [array(typecode, map(int, tokens)) for tokens in _int_tokens(data) if tokens]
+    except ValueError:
+        return [array(typecode, map(int, tokens)) for tokens in _int_tokens_slow(data) if tokens]
+
+
+class Grid:
+    """
+    A rectangular grid of characters, stored in a flat byte buffer exactly as in the input
+    file: each row is followed by a line terminator (`\n` or `\r\n`), hence the cell (i, j) is
+    the byte at position `i * stride + j`, where `stride = ncol + len(newline)`. Cells are
+    bytes, i.e. integers, hence they should be compared with `ord(ch)`.
+
+    For speed, indices are not checked: out of range columns give the line terminators, or
+    the cells of other rows.
+    """
+
+    def __init__(self, buffer: bytearray | mmap.mmap, ncol: int, end: int | None = None,
+                 newline: bytes = b"\n"):
+        """
+        Initialize the grid from the given buffer, whose rows have `ncol` cells followed by
+        `newline`, and which ends at position `end` (by default, at the end of the buffer).
+        The grid is mutable if the buffer is.
+        """
+        self.buffer = buffer
+        self.ncol = ncol
+        self.newline = newline
+        self.stride = ncol + len(newline)
+        self.end = len(buffer) if end is None else end
+        self.nrow = (self.end + self.stride - 1) // self.stride
+
+    @staticmethod
+    def from_lines(lines: Iterable[str]) -> 'Grid':
+        """
+        Return a mutable grid with the given rows, which must have the same length.
+        """
+        lines = list(lines)
+        buffer = bytearray("".join(line + "\n" for line in lines).encode())
+        return Grid(buffer, len(lines[0]) if lines else 0)
+
+    def __getitem__(self, index: tuple[int, int]) -> int:
+        i, j = index
+        return self.buffer[i * self.stride + j]
+
+    def __setitem__(self, index: tuple[int, int], value: int):
+        i, j = index
+        self.buffer[i * self.stride + j] = value
+
+    def row(self, i: int) -> memoryview:
+        """
+        Return the row `i` as a memoryview over the buffer, without copying it.
+        """
+        start = i * self.stride
+        return memoryview(self.buffer)[start:start + self.ncol]
+
+    def rows(self) -> list[bytes] | list[memoryview]:
+        """
+        Return the list of the rows, to be indexed as `rows[i][j]`, which is much faster than
+        indexing the grid with a pair of indices. If the grid is mutable, the rows are
+        memoryviews over the buffer, so that changes go through. Otherwise, they are copies
+        of the rows as `bytes`, which are faster to index than memoryviews.
+        """
+        if isinstance(self.buffer, bytearray):
+            view = memoryview(self.buffer)
+            return [view[i * self.stride:i * self.stride + self.ncol] for i in range(self.nrow)]
+        return [self.buffer[i * self.stride:i * self.stride + self.ncol] for i in range(self.nrow)]
+
+    def find(self, ch: str | bytes | int, start: int = 0) -> tuple[int, int] | None:
+        """
+        Return the position of the first occurrence of the character `ch` after the position
+        `start` of the buffer, or None if there is none.
+        """
+        if isinstance(ch, str):
+            ch = ch.encode()
+        elif isinstance(ch, int):
+            ch = bytes((ch,))
+        index = self.buffer.find(ch, start, self.end)
+        return divmod(index, self.stride) if index >= 0 else None
+
+    def copy(self) -> 'Grid':
+        """
+        Return a mutable copy of the grid.
+        """
+        return Grid(bytearray(self.buffer[:self.end]), self.ncol, newline=self.newline)
+
+    def __str__(self):
+        return "\n".join(bytes(row).decode() for row in self.rows())
+
+    def __reduce__(self):
+        # a memory mapped file cannot be pickled, hence its content is copied in a bytearray
+        return Grid, (bytearray(self.buffer[:self.end]), self.ncol, None, self.newline)
+
+
+def readgrid(filename: str) -> Grid:
+    """
+    Read a grid from a file, which is mapped in memory instead of being read and split into
+    lines. The lines may end with `\n` or `\r\n`. The grid ends at the first empty line, or
+    at the end of the file. The grid is read-only: use `Grid.copy` to get a mutable one.
+    """
+    mapped = mapfile(filename)
+    # an empty file is not mapped
+    buffer = mapped if isinstance(mapped, mmap.mmap) else bytearray(mapped)
+    ncol = buffer.find(b"\n")
+    if ncol < 0:
+        ncol, newline = len(buffer), b"\n"
+    elif ncol > 0 and buffer[ncol - 1] == ord("\r"):
+        ncol, newline = ncol - 1, b"\r\n"
+    else:
+        newline = b"\n"
+    end = buffer.find(newline * 2)
+    return Grid(buffer, ncol, end + len(newline) if end >= 0 else len(buffer), newline)
+
+
+class Variant(NamedTuple):
+    """
+    A solution for the puzzle of a day. It is made of a function which parses the input file
+    and of the functions which compute the answers of the two parts from the parsed data.
+    """
+    day: int
+    name: str
+    parse: Callable[[str], Any]
+    part1: Callable[[Any], Any] | None
+    part2: Callable[[Any], Any] | None
+    description: str
+
+
+variant_registry: dict[int, dict[str, Variant]] = defaultdict(dict)
+"""The registered solutions, indexed by day and name."""
+
+
+def register_variant(day: int, name: str, parse: Callable[[str], Any], part1: Callable[[Any], Any] | None,
+                     part2: Callable[[Any], Any] | None = None, description: str = "") -> Variant:
+    """
+    Register a solution for the puzzle of a day. Different solutions of the same puzzle should
+    give the same answers.
+    """
+    v = Variant(day, name, parse, part1, part2, description)
+    variant_registry[day][name] = v
+    return v
+
+
+class MemoInfo(NamedTuple):
+    """
+    Statistics of a memoized function, extending those of `functools.cache`.
+    """
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int | None
+    maxbytes: int | None
+    currsize: int
+    currbytes: int
+    store_hits: int = 0
+
+
+memos: list["memoized[..., Any]"] = []
+"""The functions memoized with `memo`, whose statistics are dumped with the counters."""
+
+_memo_store: MemoStore | None = MemoStore(os.environ[MEMO_STORE_ENV]) if os.environ.get(MEMO_STORE_ENV) else None
+
+
+def use_memo_store(path: str | Path | None):
+    """
+    Use the persistent memo store at `path` for the functions memoized with `persist`, or
+    stop using a persistent store if `path` is None. The store may also be selected with the
+    `AOC_MEMO_STORE` environment variable.
+    """
+    global _memo_store
+    if _memo_store is not None:
+        _memo_store.close()
+    _memo_store = MemoStore(path) if path is not None else None
+    for m in memos:
+        m.clear()
+
+
+def flush_memo_store():
+    """
+    Write the new entries of the memoized functions to the persistent memo store, if any.
+    """
+    if _memo_store is not None:
+        _memo_store.flush()
+
+
+atexit.register(flush_memo_store)
+
+
+def _source(function: Callable[..., Any]) -> str:
+    """
+    Return the source of a function, or its bytecode if the source is not available.
+    """
+    try:
+        return inspect.getsource(function)
+    except (OSError, TypeError):
+        return function.__code__.co_code.hex()
+
+
+def _approximate_size(key: Any, value: Any) -> int:
+    """
+    Return the approximate number of bytes used by a cache entry.
+    """
+    size = sys.getsizeof(key) + sys.getsizeof(value)
+    if isinstance(key, tuple):
+        size += sum(sys.getsizeof(k) for k in cast(tuple[Any, ...], key))
+    return size
+
+
+class _KwargsMark:
+    """
+    The separator between the positional and the keyword arguments in the default key of a
+    memoized function, so that `f(1, ("a", 2))` and `f(1, a=2)` have different keys. It is
+    pickled by name, so that keys of persisted tables are equal across processes.
+    """
+
+    def __reduce__(self) -> str:
+        return "_KWARGS_MARK"
+
+
+_KWARGS_MARK = _KwargsMark()
+
+
+class memoized[**P, R](Protocol):
+    """
+    The type of the functions memoized with `memo`, which have the following additional methods:
+    - `cache_info()` returns the statistics as a `MemoInfo`;
+    - `cache_clear()` removes all the entries and resets the statistics;
+    - `clear()` removes all the entries (including the table loaded from the store), keeping
+      the statistics;
+    - `reset_stats()` resets the statistics, keeping the entries;
+    - `scope()` returns a context manager which calls `clear()` on exit.
+    """
+
+    __wrapped__: Callable[P, R]
+    __module__: str
+    __qualname__: str
+
+    def __call__(self, *args: P.args, **kwargs: P.kwargs) -> R: ...
+    def cache_info(self) -> MemoInfo: ...
+    def cache_clear(self) -> None: ...
+    def clear(self) -> None: ...
+    def reset_stats(self) -> None: ...
+    def scope(self) -> AbstractContextManager[None]: ...
+
+
+@overload
+def memo[**P, R](function: Callable[P, R], /) -> memoized[P, R]: ...
+@overload
+def memo[**P, R](function: None = None, /, *, maxsize: int | None = None, maxbytes: int | None = None,
+                 policy: Literal["lru", "fifo"] = "lru", key: Callable[P, Hashable] | None = None,
+                 persist: str | None = None) -> Callable[[Callable[P, R]], memoized[P, R]]: ...
+
+
+def memo[**P, R](function: Callable[P, R] | None = None, /, *, maxsize: int | None = None,
+                 maxbytes: int | None = None, policy: Literal["lru", "fifo"] = "lru",
+                 key: Callable[P, Hashable] | None = None,
+                 persist: str | None = None) -> memoized[P, R] | Callable[[Callable[P, R]], memoized[P, R]]:
+    """
+    Decorator which memoizes a function, like `functools.cache`, returning a `memoized`
+    function. It may be used either as `@memo` or with arguments, as in `@memo(maxsize=1000)`.
+
+    The cache is unbounded, unless `maxsize` (a number of entries) or `maxbytes` (an
+    approximate number of bytes, as computed by `sys.getsizeof`) is given. When the cache is
+    full, entries are evicted according to `policy`: "lru" evicts the least recently used
+    entry, "fifo" the least recently added one. By default, the cache key is the tuple of the
+    arguments; otherwise, it is computed by calling `key` with the arguments, so that arguments
+    which do not change in a `scope` may be left out of the key.
+
+    If `persist` is a name, and a persistent memo store is in use (see `use_memo_store`),
+    the table of the function is also kept in the store, identified by the name and by the
+    source of the function. On the first miss, the whole table is loaded from the store, and
+    the entries it contains are returned without calling the function; new entries are added
+    to the store. Only pure functions of their (picklable) arguments may be persisted, and
+    the table loaded from the store is not bounded.
+    """
+    if policy not in ("lru", "fifo"):
+        raise ValueError(f"unknown eviction policy {policy}")
+    if function is None:
+        def decorator(f: Callable[P, R]) -> memoized[P, R]:
+            return _memoize(f, maxsize, maxbytes, policy, key, persist)
+        return decorator
+    return _memoize(function, maxsize, maxbytes, policy, key, persist)
+
+
+def _memoize[**P, R](f: Callable[P, R], maxsize: int | None, maxbytes: int | None, policy: Literal["lru", "fifo"],
+                     key: Callable[P, Hashable] | None, persist: str | None) -> memoized[P, R]:
+    """
+    Return the function `f` memoized with the given options, as described in `memo`.
+    """
+    bounded = maxsize is not None or maxbytes is not None
+    cache: OrderedDict[Hashable, R] | dict[Hashable, R] = OrderedDict() if bounded else {}
+    # the cache ordered by recency of use, if it is needed by the eviction policy
+    recency = cache if isinstance(cache, OrderedDict) and policy == "lru" else None
+    sizes: dict[Hashable, int] = {}
+    hits = misses = evictions = currbytes = store_hits = 0
+    table = table_name(persist, _source(f)) if persist is not None else None
+    persisted: dict[Hashable, R] | None = None
+
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        nonlocal hits, misses, evictions, currbytes, store_hits, persisted
+        k: Hashable
+        if key is not None:
+            k = key(*args, **kwargs)
+        elif kwargs:
+            k = (*args, _KWARGS_MARK, *sorted(kwargs.items()))
+        else:
+            k = args
+        try:
+            result = cache[k]
+        except KeyError:
+            pass
+        else:
+            hits += 1
+            if recency is not None:
+                recency.move_to_end(k)
+            return result
+        store = _memo_store if table is not None else None
+        if store is not None and table is not None:
+            if persisted is None:
+                persisted = store.load(table)
+            if k in persisted:
+                store_hits += 1
+                result = persisted[k]
+            else:
+                misses += 1
+                result = f(*args, **kwargs)
+                store.add(table, k, result)
+        else:
+            misses += 1
+            result = f(*args, **kwargs)
+        if not isinstance(cache, OrderedDict):
+            cache[k] = result
+            return result
+        if k in cache:
+            # the entry has been added by a recursive call
+            return result
+        cache[k] = result
+        if maxbytes is not None:
+            sizes[k] = _approximate_size(k, result)
+            currbytes += sizes[k]
+        while cache and ((maxsize is not None and len(cache) > maxsize) or
+                         (maxbytes is not None and currbytes > maxbytes)):
+            old, _ = cache.popitem(last=False)
+            evictions += 1
+            if maxbytes is not None:
+                currbytes -= sizes.pop(old)
+        return result
+
+    def cache_info() -> MemoInfo:
+        return MemoInfo(hits, misses, evictions, maxsize, maxbytes, len(cache), currbytes, store_hits)
+
+    def clear():
+        nonlocal currbytes, persisted
+        cache.clear()
+        sizes.clear()
+        currbytes = 0
+        persisted = None
+
+    def reset_stats():
+        nonlocal hits, misses, evictions, store_hits
+        hits = misses = evictions = store_hits = 0
+
+    def cache_clear():
+        clear()
+        reset_stats()
+
+    @contextmanager
+    def scope() -> Generator[None, None, None]:
+        try:
+            yield
+        finally:
+            clear()
+
+    functools.update_wrapper(wrapper, f)
+    # a closure is faster to call than an instance of a class with a `__call__` method
+    vars(wrapper).update(cache_info=cache_info, cache_clear=cache_clear, clear=clear,
+                         reset_stats=reset_stats, scope=scope)
+    memoized_wrapper = cast(memoized[P, R], wrapper)
+    memos.append(memoized_wrapper)
+    return memoized_wrapper
+
+
+def memo_counters() -> Counter[str]:
+    """
+    Return the hits, misses, evictions and hits in the persistent store of the memoized
+    functions as counters named `memo.<module>.<function>.<statistic>`. Only nonzero
+    statistics are included.
+    """
+    result: Counter[str] = Counter()
+    for m in memos:
+        info = m.cache_info()
+        name = f"memo.{m.__module__}.{m.__qualname__}"
+        for stat in ("hits", "misses", "evictions", "store_hits"):
+            if value := getattr(info, stat):
+                result[f"{name}.{stat}"] = value
+    return result
+
+
+def reset_memo_stats():
+    """
+    Reset the statistics of all the memoized functions.
+    """
+    for m in memos:
+        m.reset_stats()
+
+
+class multidict[K, V]:
+    def __init__(self):
+        """
+        Initialize the multi dictionary.
+        """
+        self._dict: dict[K, set[V]] = defaultdict(set)
+
+    def add(self, key: K, value: V):
+        """
+        Add value V to key K.
+        """
+        self._dict[key].add(value)
+
+    def check(self, key: K, value: V) -> bool:
+        """
+        Check if V is associated to K
+        """
+        return value in self._dict.get(key, set())
+
+    def __getitem__(self, key: K) -> set[V]:
+        return self._dict.get(key, set())
+
+    def items(self) -> Iterator[tuple[K, V]]:
+        for k, values in self._dict.items():
+            for v in values:
+                yield k, v
+
+
+_REMOVED: Any = object()
+"""Marker of the entries of a `priority_queue` whose value has been re-added or removed."""
+
+
+class priority_queue[V]:
+    """
+    A priority queue for elements of type V. Its implementation in terms of heaps is
+    taken from the online Python reference manual: entries are lists `[priority, seq, value]`,
+    where `seq` is a sequence number breaking ties in insertion order, so that values are never
+    compared. Updating the priority of a value marks its old entry as removed, and the heap is
+    rebuilt without the removed entries when they exceed a fraction of the heap.
+    """
+
+    MIN_COMPACT_SIZE = 64
+    """Size of the heap under which the removed entries are never compacted."""
+
+    def __init__(self, compact_fraction: float = 0.5):
+        """
+        Initialize an empty priority queue, which is compacted when the fraction of removed
+        entries in the heap is greater than `compact_fraction`.
+        """
+        self.entry_finder: dict[V, list[Any]] = {}
+        self.heap: list[list[Any]] = []
+        self.removed: int = 0
+        self.compact_fraction = compact_fraction
+        self._seq = count()
+
+    def __len__(self) -> int:
+        return len(self.entry_finder)
+
+    def add(self, value: V, priority: int):
+        """
+        Add an element to the priority queue or update its priority.
+        """
+        if value in self.entry_finder:
+            self.remove(value)
+        entry = [priority, next(self._seq), value]
+        self.entry_finder[value] = entry
+        heappush(self.heap, entry)
+
+    def remove(self, value: V):
+        """
+        Remove an element from the priority queue, by marking its entry as removed. Raise
+        `KeyError` if it is not in the queue.
+        """
+        self.entry_finder.pop(value)[2] = _REMOVED
+        self.removed += 1
+        if self.removed > self.compact_fraction * len(self.heap) and len(self.heap) >= self.MIN_COMPACT_SIZE:
+            self.compact()
+
+    def pop(self) -> V | None:
+        """
+        Extract the element with lowest priority.
+        """
+        heap = self.heap
+        while heap:
+            value = heappop(heap)[2]
+            if value is not _REMOVED:
+                del self.entry_finder[value]
+                return value
+            self.removed -= 1
+        return None
+
+    def compact(self):
+        """
+        Rebuild the heap without the removed entries.
+        """
+        self.heap = [entry for entry in self.heap if entry[2] is not _REMOVED]
+        heapify(self.heap)
+        self.removed = 0
+
+
+class _counting_priority_queue[V](priority_queue[V]):
+    """
+    A priority queue which updates the `counters` of pushes, pops, tombstones and compactions.
+    """
+
+    def add(self, value: V, priority: int):
+        counters["priority_queue.pushes"] += 1
+        super().add(value, priority)
+
+    def remove(self, value: V):
+        counters["priority_queue.tombstones"] += 1
+        super().remove(value)
+
+    def pop(self) -> V | None:
+        heap = self.heap
+        while heap:
+            value = heappop(heap)[2]
+            counters["priority_queue.pops"] += 1
+            if value is not _REMOVED:
+                del self.entry_finder[value]
+                return value
+            counters["priority_queue.stale_pops"] += 1
+            self.removed -= 1
+        return None
+
+    def compact(self):
+        counters["priority_queue.compactions"] += 1
+        counters["priority_queue.compacted_entries"] += self.removed
+        super().compact()
+
+
+class indexed_heap[V]:
+    """
+    A priority queue for elements of type V, implemented as a binary heap of pairs
+    `(priority, value)` together with the position of each value in the heap. Updating the
+    priority of a value moves its entry in the heap in O(log n), hence the heap never contains
+    stale entries and its size is the number of elements in the queue.
+    """
+
+    def __init__(self):
+        """
+        Initialize an empty priority queue.
+        """
+        self.heap: list[tuple[int, V]] = []
+        self.position: dict[V, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.heap)
+
+    def add(self, value: V, priority: int):
+        """
+        Add an element to the priority queue or update its priority.
+        """
+        if value in self.position:
+            i = self.position[value]
+            old_priority = self.heap[i][0]
+            self.heap[i] = (priority, value)
+            if priority < old_priority:
+                self._sift_up(i)
+            else:
+                self._sift_down(i)
+        else:
+            self.heap.append((priority, value))
+            self.position[value] = len(self.heap) - 1
+            self._sift_up(len(self.heap) - 1)
+
+    def decrease_key(self, value: V, priority: int):
+        """
+        Decrease the priority of an element in the priority queue.
+        """
+        i = self.position[value]
+        if priority > self.heap[i][0]:
+            raise ValueError(f"priority {priority} is greater than the current one {self.heap[i][0]}")
+        self.heap[i] = (priority, value)
+        self._sift_up(i)
+
+    def pop(self) -> V | None:
+        """
+        Extract the element with lowest priority.
+        """
+        heap = self.heap
+        if not heap:
+            return None
+        last = heap.pop()
+        if not heap:
+            del self.position[last[1]]
+            return last[1]
+        value = heap[0][1]
+        del self.position[value]
+        heap[0] = last
+        self.position[last[1]] = 0
+        self._sift_down(0)
+        return value
+
+    def _sift_up(self, i: int):
+        """
+        Move the entry at position `i` towards the root, until its parent has a lower priority.
+        """
+        heap, position = self.heap, self.position
+        entry = heap[i]
+        priority = entry[0]
+        while i > 0:
+            parent = (i - 1) >> 1
+            parent_entry = heap[parent]
+            if parent_entry[0] <= priority:
+                break
+            heap[i] = parent_entry
+            position[parent_entry[1]] = i
+            i = parent
+        heap[i] = entry
+        position[entry[1]] = i
+
+    def _sift_down(self, i: int):
+        """
+        Move the entry at position `i` towards the leaves, until its children have a greater
+        priority.
+        """
+        heap, position = self.heap, self.position
+        size = len(heap)
+        entry = heap[i]
+        priority = entry[0]
+        while (child := 2 * i + 1) < size:
+            if child + 1 < size and heap[child + 1][0] < heap[child][0]:
+                child += 1
+            child_entry = heap[child]
+            if priority <= child_entry[0]:
+                break
+            heap[i] = child_entry
+            position[child_entry[1]] = i
+            i = child
+        heap[i] = entry
+        position[entry[1]] = i
+
+
+class _counting_indexed_heap[V](indexed_heap[V]):
+    """
+    An indexed heap which updates the `counters` of pushes, priority updates and pops.
+    """
+
+    def add(self, value: V, priority: int):
+        if value in self.position:
+            counters["indexed_heap.updates"] += 1
+        else:
+            counters["indexed_heap.pushes"] += 1
+        super().add(value, priority)
+
+    def pop(self) -> V | None:
+        counters["indexed_heap.pops"] += 1
+        return super().pop()
+
+
+class bucket_queue[V]:
+    """
+    A priority queue for elements of type V with integer priorities, for the Dijkstra algorithm
+    on graphs whose weights are at most `max_weight` (Dial's algorithm). The elements are stored
+    in a circular array of `max_weight + 1` buckets, indexed by their priority modulo the number
+    of buckets: this is correct since the priorities of the elements in the queue are always
+    between the last extracted priority and that priority plus `max_weight`. Elements with the
+    same priority are extracted in insertion order, like in `priority_queue`. Updating the
+    priority of a value leaves its old entry in its bucket, which is skipped when extracted.
+    """
+
+    def __init__(self, max_weight: int):
+        """
+        Initialize an empty priority queue for a graph whose weights are at most `max_weight`.
+        """
+        if max_weight < 0:
+            raise ValueError(f"negative maximum weight {max_weight}")
+        self.max_weight = max_weight
+        self.buckets: list[deque[V]] = [deque() for _ in range(max_weight + 1)]
+        self.priority: dict[V, int] = {}
+        self.current = 0
+
+    def __len__(self) -> int:
+        return len(self.priority)
+
+    def add(self, value: V, priority: int):
+        """
+        Add an element to the priority queue or update its priority, which must be between the
+        last extracted priority and that priority plus `max_weight`.
+        """
+        if not self.current <= priority <= self.current + self.max_weight:
+            raise ValueError(f"priority {priority} out of the range [{self.current}, {self.current + self.max_weight}]")
+        self.priority[value] = priority
+        self.buckets[priority % len(self.buckets)].append(value)
+
+    def pop(self) -> V | None:
+        """
+        Extract the element with lowest priority.
+        """
+        priority = self.priority
+        if not priority:
+            return None
+        buckets, current = self.buckets, self.current
+        size = len(buckets)
+        while True:
+            bucket = buckets[current % size]
+            while bucket:
+                value = bucket.popleft()
+                if priority.get(value) == current:
+                    del priority[value]
+                    self.current = current
+                    return value
+            current += 1
+
+
+class _counting_bucket_queue[V](bucket_queue[V]):
+    """
+    A bucket queue which updates the `counters` of pushes, pops, stale entries and scanned buckets.
+    """
+
+    def add(self, value: V, priority: int):
+        counters["bucket_queue.pushes"] += 1
+        super().add(value, priority)
+
+    def pop(self) -> V | None:
+        priority = self.priority
+        if not priority:
+            return None
+        buckets, current = self.buckets, self.current
+        size = len(buckets)
+        while True:
+            counters["bucket_queue.buckets_scanned"] += 1
+            bucket = buckets[current % size]
+            while bucket:
+                value = bucket.popleft()
+                counters["bucket_queue.pops"] += 1
+                if priority.get(value) == current:
+                    del priority[value]
+                    self.current = current
+                    return value
+                counters["bucket_queue.stale_pops"] += 1
+            current += 1
+
+
+class Queue[V](Protocol):
+    """
+    The interface of the priority queues used by `Dijkstra`.
+    """
+
+    def add(self, value: V, priority: int): ...
+    def pop(self) -> V | None: ...
+
+
+_COUNTING_QUEUES: dict[Callable[..., Queue[Any]], Callable[..., Queue[Any]]] = {
+    priority_queue: _counting_priority_queue,
+    indexed_heap: _counting_indexed_heap,
+    bucket_queue: _counting_bucket_queue,
+}
+"""The counting versions of the priority queues."""
+
+
+def _queue_factory[V](queue: Callable[..., Queue[V]] | None, max_weight: int | None) -> Callable[..., Queue[V]]:
+    """
+    Return the class of the priority queues to create for `queue` and `max_weight`: by default, a
+    `bucket_queue` if `max_weight` is given, and a `priority_queue` otherwise, replaced by its
+    counting version when the counters are enabled.
+    """
+    if queue is None:
+        queue = priority_queue if max_weight is None else bucket_queue
+    if _counting:
+        return _COUNTING_QUEUES.get(queue, queue)
+    return queue
+
+
+def _is_bucket_queue(factory: Callable[..., object]) -> bool:
+    """
+    Whether the priority queues created by `factory` are bucket queues, which need the maximum
+    weight of the graph.
+    """
+    return isinstance(factory, type) and issubclass(factory, bucket_queue)
+
+
+def _new_queue[V](queue: Callable[..., Queue[V]] | None, max_weight: int | None) -> Queue[V]:
+    """
+    Return a new priority queue of class `queue` for a graph whose weights are at most
+    `max_weight`, if known. By default, it is a `bucket_queue` if `max_weight` is given, and a
+    `priority_queue` otherwise.
+    """
+    factory = _queue_factory(queue, max_weight)
+    if not _is_bucket_queue(factory):
+        return factory()
+    if max_weight is None:
+        raise ValueError("a bucket queue needs the maximum weight of the graph")
+    return factory(max_weight)
+
+
+def _csr_weights(targets: array[int], weights: array[int] | None,
+                 max_weight: int | None) -> tuple[array[int], int | None]:
+    """
+    Return the weights of the edges of a graph in compressed sparse row format, all equal to 1 by
+    default, and the maximum weight, which is then 1 unless given.
+    """
+    if weights is None:
+        return array("i", [1]) * len(targets), 1 if max_weight is None else max_weight
+    return weights, max_weight
+
+
+def _csr_moves(offsets: array[int], targets: array[int], weights: array[int]) -> Callable[[int], list[tuple[int, int]]]:
+    """
+    Return the `moves` function of a graph in compressed sparse row format.
+    """
+    def moves(node: int) -> list[tuple[int, int]]:
+        return [(targets[k], weights[k]) for k in range(offsets[node], offsets[node + 1])]
+    return moves
+
+
+def _counting_moves[V](moves: Callable[[V], Iterable[tuple[V, int]]]) -> Callable[[V], list[tuple[V, int]]]:
+    """
+    Wrap the `moves` function of a graph so that it updates the `counters` of expanded nodes
+    and scanned edges.
+    """
+    def counted(node: V) -> list[tuple[V, int]]:
+        edges = list(moves(node))
+        counters["dijkstra.expansions"] += 1
+        counters["dijkstra.edges_scanned"] += len(edges)
+        return edges
+    return counted
+
+
+def _dense_sources(start: int | dict[int, int], max_weight: int | None) -> tuple[dict[int, int], int | None]:
+    """
+    Return the start nodes of a search over integer nodes with their initial distances, and
+    the maximum weight to give to a bucket queue, which must also cover the initial distances
+    since they are in the queue at the same time as the first moves.
+    """
+    sources = {start: 0} if isinstance(start, int) else start
+    if any(offset < 0 for offset in sources.values()):
+        raise ValueError("negative initial distance")
+    if max_weight is not None and sources:
+        max_weight = max(max_weight, *sources.values())
+    return sources, max_weight
+
+
+def _dense_start(start: int | dict[int, int], size: int, queue: Callable[..., Queue[int]] | None,
+                 max_weight: int | None) -> tuple[array[int], Queue[int]]:
+    """
+    Return the distance array of a search over the integer nodes in `range(size)`, and its
+    priority queue, both initialized with the start nodes.
+    """
+    sources, max_weight = _dense_sources(start, max_weight)
+    pq = _new_queue(queue, max_weight)
+    distance = array("q", [Dijkstra.UNREACHABLE]) * size
+    for source, offset in sources.items():
+        distance[source] = offset
+        pq.add(source, offset)
+    return distance, pq
+
+
+class _target_stop[V]:
+    """
+    The early exit of a search which stops once the given targets are settled. The nodes at
+    the same distance as the farthest target are still settled after it, so that the
+    predecessors of the targets are complete even with edges of weight 0. The nodes left in
+    the queue are then dropped from the result, since their distance may not be the shortest
+    one.
+    """
+
+    def __init__(self, targets: Iterable[V]):
+        self.remaining = set(targets)
+        self.bound: int | None = None
+
+    def done(self, node: V, dist: int) -> bool:
+        """
+        Return whether the search must stop instead of expanding `node`, extracted from the
+        queue at distance `dist`.
+        """
+        if self.bound is not None:
+            return dist > self.bound
+        self.remaining.discard(node)
+        if not self.remaining:
+            self.bound = dist
+        return False
+
+    def trim(self, prev: dict[V, list[V]], distance: dict[V, int]) -> tuple[dict[V, list[V]], dict[V, int]]:
+        """
+        Return the predecessors and distances of the nodes not farther than the farthest target.
+        """
+        if self.bound is None:
+            return prev, distance
+        distance = {n: d for n, d in distance.items() if d <= self.bound}
+        return defaultdict(list, {n: p for n, p in prev.items() if n in distance}), distance
+
+
+def _count_settled[V](prev: dict[V, list[V]], distance: dict[V, int]):
+    """
+    Update the `counters` of settled nodes and equal cost predecessors in the result of a
+    search: each reachable node is settled exactly once, and improving the distance of a node
+    discards its predecessors, so these are the predecessors in the final result.
+    """
+    counters["dijkstra.nodes_settled"] += len(distance)
+    counters["dijkstra.equal_cost_predecessors"] += sum(len(p) - 1 for p in prev.values())
+
+
+def _count_csr_expansions(offsets: array[int], nodes: Iterable[int]):
+    """
+    Update the `counters` of expanded nodes and scanned edges for the expansion of `nodes` in a
+    graph in compressed sparse row format, whose searches do not call `_counting_moves`.
+    """
+    nodes = list(nodes)
+    counters["dijkstra.expansions"] += len(nodes)
+    counters["dijkstra.edges_scanned"] += sum(offsets[node + 1] - offsets[node] for node in nodes)
+
+
+def _astar_scale(queue: Callable[..., Queue[Any]], bound: int | None) -> tuple[int, int]:
+    """
+    Check the queue and the bound of an A* search, and return the factors `(scale, tie)` of
+    its priorities `f * scale - tie * g`: with a bound of the distances g from start, ties
+    are broken in favor of the farthest nodes from start.
+    """
+    if _is_bucket_queue(queue):
+        raise ValueError("A* needs a priority queue accepting any integer priority")
+    if bound is not None and bound < 0:
+        raise ValueError(f"negative bound {bound}")
+    return (1, 0) if bound is None else (bound + 1, 1)
+
+
+class Dijkstra[V]:
+    """
+    A class representing the set of shortests path in a graph from a given starting node, computed
+    using the Dijkstra algorithm.
+    """
+
+    UNREACHABLE = -1
+    """Distance of the nodes which are not reachable, in the result of `dense_distances`."""
+
+    def __init__(self, start: V, moves: Callable[[V], Iterable[tuple[V, int]]],
+                 queue: Callable[..., Queue[V]] | None = None, targets: Iterable[V] | None = None,
+                 max_weight: int | None = None):
+        """
+        Execute the Dijkstra algorithm.
+
+        Parameters:
+        - `start` is the start node
+        - `moves` returns, for each node src, a list of pairs (dst, w) such that dst is reachable from src with weight w
+        - `queue` is the class of the priority queue: `priority_queue` leaves stale entries in the
+          heap when the distance of a node decreases, `indexed_heap` moves them, and `bucket_queue`
+          avoids heaps altogether for small integer weights; by default, it is `bucket_queue` if
+          `max_weight` is given and `priority_queue` otherwise
+        - `targets`, if given, are the nodes of interest: the search stops once all of them are
+          settled, and the result only contains the nodes not farther than the farthest target
+        - `max_weight`, if given, is the maximum weight of the edges of the graph
+        Returns:
+        - a map from a node to all the predecessors in the shortest paths from start.
+        - a map from a node n to the shortest distance from start to n.
+        """
+        self.start = start
+        self.moves = moves
+        self.prevs, self.dists = self.__dijkstra__(start, moves, queue, targets, max_weight)
+
+    @staticmethod
+    def __dijkstra__(start: V, moves: Callable[[V], Iterable[tuple[V, int]]],
+                     queue: Callable[..., Queue[V]] | None = None, targets: Iterable[V] | None = None,
+                     max_weight: int | None = None) -> tuple[dict[V, list[V]], dict[V, int]]:
+        """
+        Actually perform the algorithm, stopping early with `targets` as described in
+        `_target_stop`.
+        """
+        pq = _new_queue(queue, max_weight)
+        if _counting:
+            moves = _counting_moves(moves)
+        distance: dict[V, int] = {}
+        prev: dict[V, list[V]] = defaultdict(list)
+        stop = _target_stop(targets) if targets is not None else None
+
+        distance[start] = 0
+        prev[start] = [start]
+        pq.add(start, 0)
+        while True:
+            node = pq.pop()
+            if node is None:
+                break
+            dist = distance[node]
+            if stop is not None and stop.done(node, dist):
+                break
+            for node_new, cost in moves(node):
+                dist_update = dist + cost
+                if node_new in distance:
+                    dist_new = distance[node_new]
+                    if dist_update < dist_new:
+                        pq.add(node_new, dist_update)
+                        distance[node_new] = dist_update
+                        prev[node_new] = [node]
+                    elif dist_update == dist_new:
+                        prev[node_new].append(node)
+
+                else:
+                    distance[node_new] = dist_update
+                    pq.add(node_new, dist_update)
+                    prev[node_new] = [node]
+
+        if stop is not None:
+            prev, distance = stop.trim(prev, distance)
+        if _counting:
+            _count_settled(prev, distance)
+        return prev, distance
+
+    @staticmethod
+    def dense_distances(start: int | dict[int, int], moves: Callable[[int], Iterable[tuple[int, int]]], size: int,
+                        queue: Callable[..., Queue[int]] | None = None, max_weight: int | None = None) -> array[int]:
+        """
+        Compute the shortest distances from `start` in a graph whose nodes are the integers in
+        `range(size)`, without the predecessors. The distances are stored in an array of 64-bit
+        integers indexed by the nodes, which takes much less memory than the dictionaries of
+        `Dijkstra` on large graphs.
+
+        Parameters:
+        - `start` is the start node, or a map from several start nodes to their initial
+          distances, which must not be negative: the distance to a node is then the shortest
+          distance from any start node, plus its initial distance
+        - `moves` returns, for each node src, a list of pairs (dst, w) such that dst is reachable from src with weight w
+        - `size` is the number of nodes
+        - `queue` and `max_weight` select the class of the priority queue, as in `Dijkstra`
+        Returns:
+        - an array mapping a node n to the shortest distance from start to n, or `UNREACHABLE`.
+        """
+        distance, pq = _dense_start(start, size, queue, max_weight)
+        if _counting:
+            moves = _counting_moves(moves)
+        unreachable = Dijkstra.UNREACHABLE
+
+        while (node := pq.pop()) is not None:
+            dist = distance[node]
+            for node_new, cost in moves(node):
+                dist_update = dist + cost
+                dist_new = distance[node_new]
+                if dist_new == unreachable or dist_update < dist_new:
+                    distance[node_new] = dist_update
+                    pq.add(node_new, dist_update)
+
+        if _counting:
+            counters["dijkstra.nodes_settled"] += size - distance.count(unreachable)
+        return distance
+
+    @staticmethod
+    def csr_distances(start: int | dict[int, int], offsets: array[int], targets: array[int],
+                      weights: array[int] | None = None, queue: Callable[..., Queue[int]] | None = None,
+                      max_weight: int | None = None) -> array[int]:
+        """
+        Compute the shortest distances from `start` like `dense_distances`, in a graph given in
+        compressed sparse row format: the edges from node n go to the nodes
+        `targets[offsets[n]:offsets[n + 1]]`, with the corresponding `weights` (by default, all
+        the weights are 1). The edges are scanned by index, without calling a function or
+        building a list for each node.
+        """
+        weights, max_weight = _csr_weights(targets, weights, max_weight)
+        distance, pq = _dense_start(start, len(offsets) - 1, queue, max_weight)
+        unreachable = Dijkstra.UNREACHABLE
+
+        while (node := pq.pop()) is not None:
+            dist = distance[node]
+            for k in range(offsets[node], offsets[node + 1]):
+                node_new = targets[k]
+                dist_update = dist + weights[k]
+                dist_new = distance[node_new]
+                if dist_new == unreachable or dist_update < dist_new:
+                    distance[node_new] = dist_update
+                    pq.add(node_new, dist_update)
+
+        if _counting:
+            counters["dijkstra.nodes_settled"] += len(distance) - distance.count(unreachable)
+            _count_csr_expansions(offsets, (node for node, dist in enumerate(distance) if dist != unreachable))
+        return distance
+
+    @staticmethod
+    def from_csr(start: int, offsets: array[int], targets: array[int], weights: array[int] | None = None,
+                 queue: Callable[..., Queue[int]] | None = None, ends: Iterable[int] | None = None,
+                 max_weight: int | None = None) -> "Dijkstra[int]":
+        """
+        Execute the Dijkstra algorithm like the constructor, in a graph given in compressed sparse
+        row format as in `csr_distances`, `ends` being the nodes of interest (the `targets` of the
+        constructor). The edges are scanned by index, without calling `moves` on each node.
+        """
+        weights, max_weight = _csr_weights(targets, weights, max_weight)
+        pq = _new_queue(queue, max_weight)
+        distance: dict[int, int] = {}
+        prev: dict[int, list[int]] = defaultdict(list)
+        stop = _target_stop(ends) if ends is not None else None
+
+        distance[start] = 0
+        prev[start] = [start]
+        pq.add(start, 0)
+        while (node := pq.pop()) is not None:
+            dist = distance[node]
+            if stop is not None and stop.done(node, dist):
+                break
+            for k in range(offsets[node], offsets[node + 1]):
+                node_new = targets[k]
+                dist_update = dist + weights[k]
+                dist_new = distance.get(node_new)
+                if dist_new is None or dist_update < dist_new:
+                    distance[node_new] = dist_update
+                    pq.add(node_new, dist_update)
+                    prev[node_new] = [node]
+                elif dist_update == dist_new:
+                    prev[node_new].append(node)
+
+        if stop is not None:
+            prev, distance = stop.trim(prev, distance)
+        if _counting:
+            _count_settled(prev, distance)
+            _count_csr_expansions(offsets, distance)
+        dijkstra = cast(Dijkstra[int], Dijkstra.__new__(Dijkstra))
+        dijkstra.start = start
+        dijkstra.moves = _csr_moves(offsets, targets, weights)
+        dijkstra.prevs, dijkstra.dists = prev, distance
+        return dijkstra
+
+    @staticmethod
+    def bidirectional[N](start: N, target: N, moves: Callable[[N], Iterable[tuple[N, int]]],
+                         reverse_moves: Callable[[N], Iterable[tuple[N, int]]],
+                         queue: Callable[..., Queue[N]] | None = None,
+                         max_weight: int | None = None) -> tuple[int, list[N]] | None:
+        """
+        Compute a shortest path from `start` to `target` with the bidirectional Dijkstra algorithm,
+        which searches forward from `start` and backward from `target` until the two searches meet.
+
+        Parameters:
+        - `start` is the start node
+        - `target` is the target node
+        - `moves` returns, for each node src, a list of pairs (dst, w) such that dst is reachable from src with weight w
+        - `reverse_moves` returns, for each node dst, a list of pairs (src, w) such that dst is reachable from src with weight w
+        - `queue` and `max_weight` select the class of the priority queues, as in `Dijkstra`
+        Returns:
+        - the distance from start to target and one of the shortest paths, or None if target is not reachable.
+        """
+        queues = (_new_queue(queue, max_weight), _new_queue(queue, max_weight))
+        if _counting:
+            edges = (_counting_moves(moves), _counting_moves(reverse_moves))
+        else:
+            edges = (moves, reverse_moves)
+        distances: tuple[dict[N, int], dict[N, int]] = ({start: 0}, {target: 0})
+        prevs: tuple[dict[N, N], dict[N, N]] = ({start: start}, {target: target})
+        radius = [0, 0]
+        queues[0].add(start, 0)
+        queues[1].add(target, 0)
+        best, meet = (0, start) if start == target else (None, None)
+
+        while True:
+            # extend the search whose radius is the smallest, so that both grow at the same pace
+            side = 0 if radius[0] <= radius[1] else 1
+            node = queues[side].pop()
+            if node is None:
+                break
+            distance, distance_other, prev = distances[side], distances[1 - side], prevs[side]
+            dist = radius[side] = distance[node]
+            # any path shorter than best would contain a node which is not settled by either search
+            if best is not None and radius[0] + radius[1] >= best:
+                break
+            for node_new, cost in edges[side](node):
+                dist_update = dist + cost
+                if node_new not in distance or dist_update < distance[node_new]:
+                    distance[node_new] = dist_update
+                    prev[node_new] = node
+                    queues[side].add(node_new, dist_update)
+                    if node_new in distance_other and (best is None or dist_update + distance_other[node_new] < best):
+                        best, meet = dist_update + distance_other[node_new], node_new
+
+        if best is None or meet is None:
+            return None
+        path = [meet]
+        current = meet
+        while (p := prevs[0][current]) != current:
+            path.append(p)
+            current = p
+        path.reverse()
+        current = meet
+        while (p := prevs[1][current]) != current:
+            path.append(p)
+            current = p
+        return best, path
+
+    def path_compute(self, end: V) -> list[V] | None:
+        """
+        Return one of the shortest paths leading to `end`, or None is such a path does not exist.
+        """
+        if end not in self.prevs:
+            return None
+        current = end
+        path = [current]
+        while (p := self.prevs[current][0]) != current:
+            path.append(p)
+            current = p
+        path.reverse()
+        return path
+
+    @functools.cached_property
+    def dag(self) -> "ShortestPathDAG[V]":
+        """
+        The graph of all the shortest paths from start.
+        """
+        return ShortestPathDAG(self.start, self.prevs)
+
+    def nodes_in_path(self, *ends: V) -> set[V]:
+        """
+        Return the set of all nodes in the shortest paths leading to the given ends.
+        """
+        return self.dag.nodes(*ends)
+
+
+class ShortestPathDAG[V]:
+    """
+    The directed acyclic graph of all the shortest paths from a starting node, given by the
+    predecessors of each node in these paths, as computed by `Dijkstra`. All the operations are
+    iterative, hence they work on arbitrarily long paths, and visit each node at most once.
+    The predecessors of the starting node are ignored. With edges of weight 0, the graph may
+    have cycles, which are never followed.
+    """
+
+    def __init__(self, start: V, prevs: dict[V, list[V]]):
+        """
+        Initialize the graph from the starting node and the predecessors of the nodes.
+        """
+        self.start = start
+        self.prevs = prevs
+        self._counts: dict[V, int] = {start: 1}
+
+    def nodes(self, *ends: V) -> set[V]:
+        """
+        Return the set of all nodes in the shortest paths leading to the given ends. Ends which
+        are not reachable are ignored.
+        """
+        prevs = self.prevs
+        nodes: set[V] = set()
+        stack = [end for end in ends if end in prevs]
+        while stack:
+            node = stack.pop()
+            if node not in nodes:
+                nodes.add(node)
+                if node != self.start:
+                    stack.extend(prevs[node])
+        return nodes
+
+    def count_paths(self, end: V) -> int:
+        """
+        Return the number of distinct shortest paths leading to `end`. The counts are memoized,
+        so that counting the paths to other ends only visits the nodes not counted yet. Raise
+        `ValueError` if the paths go through a cycle of weight 0, since their number is infinite.
+        """
+        if end not in self.prevs:
+            return 0
+        prevs, counts = self.prevs, self._counts
+        visiting: set[V] = set()
+        stack = [end]
+        while stack:
+            node = stack[-1]
+            if node in counts:
+                stack.pop()
+                continue
+            pending = [p for p in prevs[node] if p not in counts]
+            if pending and node not in visiting:
+                visiting.add(node)
+                for p in pending:
+                    if p in visiting:
+                        raise ValueError(f"cycle of weight 0 through {p!r}")
+                stack.extend(pending)
+            else:
+                # the pending predecessors of a visited node are all counted by now
+                counts[node] = sum(counts[p] for p in prevs[node])
+                visiting.discard(node)
+                stack.pop()
+        return counts[end]
+
+    def paths(self, end: V) -> Iterator[list[V]]:
+        """
+        Enumerate lazily the shortest paths leading to `end`, each one from start to end.
+        """
+        if end not in self.prevs:
+            return
+        prevs, start = self.prevs, self.start
+        if end == start:
+            yield [start]
+            return
+        # path from end backwards, and the iterators over the remaining predecessors of its nodes
+        path = [end]
+        on_path = {end}
+        choices = [iter(prevs[end])]
+        while choices:
+            for p in choices[-1]:
+                if p not in on_path:
+                    break
+            else:
+                on_path.discard(path.pop())
+                choices.pop()
+                continue
+            if p == start:
+                yield [start] + path[::-1]
+            else:
+                path.append(p)
+                on_path.add(p)
+                choices.append(iter(prevs[p]))
+
+
+class AStar[V]:
+    """
+    A class representing a shortest path in a graph from a given starting node to a given target
+    node, computed using the A* algorithm.
+    """
+
+    def __init__(self, start: V, target: V, moves: Callable[[V], Iterable[tuple[V, int]]],
+                 heuristic: Callable[[V], int], queue: Callable[..., Queue[V]] = priority_queue,
+                 bound: int | None = None):
+        """
+        Execute the A* algorithm.
+
+        Parameters:
+        - `start` is the start node
+        - `target` is the target node
+        - `moves` returns, for each node src, a list of pairs (dst, w) such that dst is reachable from src with weight w
+        - `heuristic` returns, for each node, a lower bound of its distance to target: the result
+          is a shortest path only if the heuristic is admissible, i.e. never overestimates it
+        - `queue` is the class of the priority queue, which must accept any integer priority:
+          `priority_queue` or `indexed_heap`, but not `bucket_queue`, since the priorities
+          of A* are not within a window of the last extracted priority
+        - `bound` is an upper bound of the lengths of the paths from start, if known: ties
+          between nodes are then broken in favor of the farthest nodes from start
+        Returns:
+        - a map from a node to its predecessor in the shortest path from start found so far.
+        - a map from a node n to the shortest distance from start to n found so far.
+        """
+        scale, tie = _astar_scale(queue, bound)
+        self.start = start
+        self.target = target
+        self.moves = moves
+        self.heuristic = heuristic
+        self.prevs, self.dists = self.__astar__(start, target, moves, heuristic, queue, scale, tie)
+
+    @staticmethod
+    def __astar__(start: V, target: V, moves: Callable[[V], Iterable[tuple[V, int]]],
+                  heuristic: Callable[[V], int], queue: Callable[..., Queue[V]],
+                  scale: int, tie: int) -> tuple[dict[V, V], dict[V, int]]:
+        """
+        Actually perform the algorithm. Nodes are extracted by increasing estimated length f of
+        the path through them, and the search stops when the target is extracted. The priority
+        is `f * scale - tie * g`, as returned by `_astar_scale`: given a bound of the distances
+        g from start, `scale` is the bound plus 1 and `tie` is 1, so that the ties are broken
+        in favor of the farthest nodes from start and the priority is still an integer. A node
+        whose distance is improved after its extraction is added to the queue again, so that
+        the result is correct with any admissible heuristic, even an inconsistent one.
+        """
+        pq = _new_queue(queue, None)
+        if _counting:
+            moves = _counting_moves(moves)
+        distance: dict[V, int] = {start: 0}
+        prev: dict[V, V] = {start: start}
+
+        pq.add(start, heuristic(start) * scale)
+        while (node := pq.pop()) is not None and node != target:
+            dist = distance[node]
+            for node_new, cost in moves(node):
+                dist_update = dist + cost
+                if node_new not in distance or dist_update < distance[node_new]:
+                    distance[node_new] = dist_update
+                    prev[node_new] = node
+                    pq.add(node_new, (dist_update + heuristic(node_new)) * scale - tie * dist_update)
+        return prev, distance
+
+    @staticmethod
+    def from_csr(start: int, target: int, offsets: array[int], targets: array[int],
+                 heuristic: Callable[[int], int], weights: array[int] | None = None,
+                 queue: Callable[..., Queue[int]] = priority_queue, bound: int | None = None) -> "AStar[int]":
+        """
+        Execute the A* algorithm like the constructor, in a graph given in compressed sparse row
+        format as in `Dijkstra.csr_distances`. The edges are scanned by index, without calling
+        `moves` on each node.
+        """
+        scale, tie = _astar_scale(queue, bound)
+        weights, _ = _csr_weights(targets, weights, None)
+        pq = _new_queue(queue, None)
+        distance: dict[int, int] = {start: 0}
+        prev: dict[int, int] = {start: start}
+        expanded: list[int] | None = [] if _counting else None
+
+        pq.add(start, heuristic(start) * scale)
+        while (node := pq.pop()) is not None and node != target:
+            dist = distance[node]
+            if expanded is not None:
+                expanded.append(node)
+            for k in range(offsets[node], offsets[node + 1]):
+                node_new = targets[k]
+                dist_update = dist + weights[k]
+                dist_new = distance.get(node_new)
+                if dist_new is None or dist_update < dist_new:
+                    distance[node_new] = dist_update
+                    prev[node_new] = node
+                    pq.add(node_new, (dist_update + heuristic(node_new)) * scale - tie * dist_update)
+
+        if expanded is not None:
+            _count_csr_expansions(offsets, expanded)
+        astar = cast(AStar[int], AStar.__new__(AStar))
+        astar.start, astar.target = start, target
+        astar.moves = _csr_moves(offsets, targets, weights)
+        astar.heuristic = heuristic
+        astar.prevs, astar.dists = prev, distance
+        return astar
+
+    @property
+    def distance(self) -> int | None:
+        """
+        The length of the shortest path from start to target, or None if target is not reachable.
+        """
+        return self.dists.get(self.target)
+
+    def path_compute(self) -> list[V] | None:
+        """
+        Return the shortest path from start to target, or None is such a path does not exist.
+        """
+        if self.target not in self.prevs:
+            return None
+        current = self.target
+        path = [current]
+        while (p := self.prevs[current]) != current:
+            path.append(p)
+            current = p
+        path.reverse()
+        return path
+
+
+WALL = ord("#")
+"""The cell of a wall in a `Grid`."""
+
+_OPEN_CELLS = bytes(0 if cell == WALL else 1 for cell in range(256))
+"""The translation table of the cells to 1 for open cells and 0 for walls."""
+
+
+class Maze:
+    """
+    Class modeling a maze. The cells are stored in one flat bytearray `cells`, the cell `(i, j)`
+    being at index `i * ncol + j`, hence cells are integers. The map is the list of the rows of
+    `cells` as memoryviews, so that `map[i][j]` reads and writes the same cells.
+
+    The searches run on the open cells, numbered in row-major order: `node` and `position`
+    convert between positions and these numbers, and `adjacency` is the table of the open cells
+    adjacent to each open cell. It is computed once, hence `cache_clear` must be called after a
+    change of the cells.
+    """
+
+    type position = tuple[int, int]
+
+    def __init__(self, map: list[str] | Grid):
+        """
+        Initialize the maze from the map given as a grid or as a list of strings.
+        """
+        grid = map if isinstance(map, Grid) else Grid.from_lines(map)
+        self.i_start, self.j_start = self._find_char(grid, "S")
+        self.i_end, self.j_end = self._find_char(grid, "E")
+        self._set_cells(bytearray().join(grid.rows()), grid.nrow, grid.ncol)
+
+    def _set_cells(self, cells: bytearray, nrow: int, ncol: int):
+        """
+        Replace the cells of the maze by `cells`, made of `nrow` rows of `ncol` cells.
+        """
+        self.cells = cells
+        self.nrow = nrow
+        self.ncol = ncol
+        view = memoryview(cells)
+        self.map = [view[i * ncol:(i + 1) * ncol] for i in range(nrow)]
+        self.cache_clear()
+
+    def __getstate__(self) -> dict[str, Any]:
+        # the rows are memoryviews, which cannot be pickled
+        state = self.__dict__.copy()
+        del state["map"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]):
+        self.__dict__.update(state)
+        view = memoryview(self.cells)
+        self.map = [view[i * self.ncol:(i + 1) * self.ncol] for i in range(self.nrow)]
+
+    @staticmethod
+    def _find_char(grid: Grid, ch: str) -> position:
+        """
+        Return the position of a given character in a grid.
+        """
+        pos = grid.find(ch)
+        if pos is None:
+            raise ValueError(f"no {ch} in the maze")
+        return pos
+
+    @functools.cached_property
+    def open_cells(self) -> array[int]:
+        """
+        The indices in `cells` of the open cells, i.e. the cells which are not walls, the open
+        cell numbered n being at index n.
+        """
+        return array("i", compress(range(len(self.cells)), self.cells.translate(_OPEN_CELLS)))
+
+    @functools.cached_property
+    def node_ids(self) -> array[int]:
+        """
+        The number of each cell of `cells` among the open cells, or -1 for walls.
+        """
+        ids = array("i", [-1]) * len(self.cells)
+        open_cells = self.open_cells
+        deque(map(ids.__setitem__, open_cells, range(len(open_cells))), maxlen=0)
+        return ids
+
+    def node(self, pos: position) -> int:
+        """
+        Return the number of the open cell at `pos`. Raise a ValueError if it is a wall or if
+        it is outside the maze.
+        """
+        i, j = pos
+        if not (0 <= i < self.nrow and 0 <= j < self.ncol) or (node := self.node_ids[i * self.ncol + j]) < 0:
+            raise ValueError(f"no open cell at {pos}")
+        return node
+
+    def node_position(self, node: int) -> position:
+        """
+        Return the position of the open cell numbered `node`.
+        """
+        return divmod(self.open_cells[node], self.ncol)
+
+    @functools.cached_property
+    def adjacency(self) -> tuple[array[int], array[int]]:
+        """
+        The adjacency of the open cells in compressed sparse row format, as a pair
+        `(offsets, targets)` of arrays: the open cells adjacent to the open cell n are the slice
+        of `targets` from `offsets[n]` to `offsets[n + 1]`, in the order up, down, left, right.
+        """
+        nrow, ncol = self.nrow, self.ncol
+        size, node_ids = nrow * ncol, self.node_ids
+        is_open = self.cells.translate(_OPEN_CELLS)
+        # masks with one byte per cell, set for the open cells whose neighbour in a direction is
+        # open: shifting the bytes of the open cells moves each cell to its neighbour
+        cells = int.from_bytes(is_open)
+        inside = (1 << 8 * size) - 1
+        not_first = int.from_bytes((b"\0" + b"\1" * (ncol - 1)) * nrow)
+        not_last = int.from_bytes((b"\1" * (ncol - 1) + b"\0") * nrow)
+        masks = [cells >> 8 * ncol & cells, cells << 8 * ncol & inside & cells,
+                 cells >> 8 & not_first & cells, cells << 8 & not_last & cells]
+        degrees = sum(masks).to_bytes(size)
+        offsets = array("i", accumulate(compress(degrees, is_open), initial=0))
+        # the numbers of the neighbours in the four directions, interleaved, and selected by the masks
+        border = array("i", [-1])
+        neighbours = (border * ncol + node_ids[:size - ncol], node_ids[ncol:] + border * ncol,
+                      border + node_ids[:-1], node_ids[1:] + border)
+        edges = array("i", [-1]) * (4 * size)
+        selected = bytearray(4 * size)
+        for k, (direction, mask) in enumerate(zip(neighbours, masks)):
+            edges[k::4] = direction
+            selected[k::4] = mask.to_bytes(size)
+        targets = array("i", compress(edges, selected))
+        return offsets, targets
+
+    def adjacent_positions(self, pos: position) -> list[position]:
+        """
+        Return the list of the open positions adjacent to the open position `pos`.
+        """
+        offsets, targets = self.adjacency
+        node = self.node(pos)
+        return [self.node_position(node_new) for node_new in targets[offsets[node]:offsets[node + 1]]]
+
+    def dijkstra(self, start: position | None = None,
+                 targets: Iterable[position] | None = None) -> Dijkstra[int]:
+        """
+        Apply Dijikstra shortes path algorith to the maze, with the given starting node (by default,
+        it is the starting node of the maze), stopping once the `targets` are reached if given.
+        The nodes of the result are the numbers of the open cells.
+        """
+        if start is None:
+            start = (self.i_start, self.j_start)
+        ends = None if targets is None else [self.node(pos) for pos in targets]
+        offsets, csr_targets = self.adjacency
+        return Dijkstra.from_csr(self.node(start), offsets, csr_targets, ends=ends)
+
+    def distances(self, start: position | None = None) -> array[int]:
+        """
+        Return the shortest distances from the given starting node (by default, the starting
+        node of the maze) to all the open cells, as computed by `Dijkstra.csr_distances`: the
+        distance to the open cell numbered n is at index n, and is `Dijkstra.UNREACHABLE` for
+        unreachable cells.
+        """
+        if start is None:
+            start = (self.i_start, self.j_start)
+        return self.multi_source_distances({start: 0})
+
+    def multi_source_distances(self, sources: Iterable[position] | dict[position, int]) -> array[int]:
+        """
+        Return the shortest distances from the nearest of several starting nodes to all the
+        open cells, laid out as in `distances`. The starting nodes are given either as an iterable,
+        or as a map to their initial distances, which are added to the distances from them.
+        """
+        if isinstance(sources, dict):
+            initial = cast(dict[Maze.position, int], sources)
+        else:
+            initial = dict.fromkeys(sources, 0)
+        offsets, targets = self.adjacency
+        return Dijkstra.csr_distances({self.node(pos): offset for pos, offset in initial.items()},
+                                      offsets, targets)
+
+    @functools.cached_property
+    def _distance_fields(self) -> dict[position, array[int]]:
+        return {}
+
+    def distance_field(self, source: position) -> array[int]:
+        """
+        Return the shortest distances from `source` to all the open cells, laid out as in
+        `distances`. The result is cached on the maze and shared by all the callers, hence it
+        must not be modified, and `cache_clear` must be called when the maze changes.
+        """
+        field = self._distance_fields.get(source)
+        if field is None:
+            field = self._distance_fields[source] = self.distances(source)
+        return field
+
+    def cache_clear(self):
+        """
+        Forget the cached numbering, adjacency and distance fields, after a change of the cells.
+        """
+        for name in ("open_cells", "node_ids", "adjacency", "_distance_fields"):
+            self.__dict__.pop(name, None)
+
+    def astar(self, start: position | None = None, end: position | None = None) -> AStar[int]:
+        """
+        Apply the A* algorithm to the maze from the given starting node to the given ending node
+        (by default, the starting and ending nodes of the maze), with the Manhattan distance to the
+        ending node as heuristic. The nodes of the result are the numbers of the open cells.
+        """
+        if start is None:
+            start = (self.i_start, self.j_start)
+        if end is None:
+            end = (self.i_end, self.j_end)
+        i_end, j_end = end
+        ncol = self.ncol
+        heuristic = array("i", [abs(cell // ncol - i_end) + abs(cell % ncol - j_end) for cell in self.open_cells])
+        offsets, targets = self.adjacency
+        return AStar.from_csr(self.node(start), self.node(end), offsets, targets, heuristic.__getitem__,
+                              bound=len(heuristic))
+
+    def shortest_path(self) -> int | None:
+        """
+        Return the length of the shortest path from the start to the end of the maze, or None if
+        the end is not reachable (in particular if the start or the end is a wall).
+        """
+        node_ids = self.node_ids
+        if node_ids[self.i_start * self.ncol + self.j_start] < 0 or node_ids[self.i_end * self.ncol + self.j_end] < 0:
+            return None
+        return self.astar().distance
+
+    def __str__(self):
+        return "\n".join(bytes(row).decode() for row in self.map)
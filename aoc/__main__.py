@@ -0,0 +1,169 @@
+"""
+Command line interface for running the AoC solutions.
+
+Usage:
+    python -m aoc run --day N [--variant NAME] [--input PATH] [--memory] [--counters] [--cache]
+        [--snapshot] [--memo-store PATH] [--profile PHASE [--profile-output PREFIX]]
+    python -m aoc run --all [--jobs N] [--memory] [--counters] [--cache] [--snapshot] [--memo-store PATH]
+    python -m aoc bench (--day N [--variant NAME] [--input PATH] | --all) [--warmup N] [--repeat N]
+        [--output FILE] [--baseline FILE] [--threshold FRACTION] [--expected FILE [--update-expected]]
+    python -m aoc compare --day N [--input PATH] [--warmup N] [--repeat N]
+    python -m aoc gen --day N --size N [--seed N] [--output FILE]
+    python -m aoc scale --day N --sizes N,N,... [--variant NAME] [--seed N] [--memory]
+"""
+
+import argparse
+import json
+import os
+import sys
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any
+
+import aoc
+from aoc import bench, gen
+from aoc.profiling import PROFILE_ENV
+from aoc.store import MEMO_STORE_ENV
+from aoc.runner import run_all, run_day
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(prog="python -m aoc", description="Run the AoC 2024 solutions.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="run solutions and print a JSON timing record")
+    which = run.add_mutually_exclusive_group(required=True)
+    which.add_argument("--day", type=int, help="day of the puzzle")
+    which.add_argument("--all", action="store_true", help="run all the variants of all the days")
+    run.add_argument("--variant", help="variant of the solution (default: all)")
+    run.add_argument("--input", help="input file (default: the input file of the day)")
+    run.add_argument("--jobs", type=int, help="number of parallel processes for --all (default: one per CPU)")
+    run.add_argument("--memory", action="store_true", help="measure peak memory and allocations of each phase")
+    run.add_argument("--counters", action="store_true", help="count the operations of the search algorithms")
+    run.add_argument("--cache", action="store_true",
+                     help="reuse the results of previous runs on the same input with the same sources")
+    run.add_argument("--snapshot", action="store_true",
+                     help="load the parsed input from a snapshot next to the input file, saving it if missing")
+    run.add_argument("--memo-store", default=os.environ.get(MEMO_STORE_ENV) or None,
+                     help=f"persistent store of the memoized functions (default: ${MEMO_STORE_ENV})")
+    run.add_argument("--profile", choices=("parse", "part1", "part2"), default=os.environ.get(PROFILE_ENV) or None,
+                     help=f"profile a phase, writing .pstats and .collapsed files (default: ${PROFILE_ENV})")
+    run.add_argument("--profile-output", help="prefix of the profile files (default: profile_day<N>_<variant>_<phase>)")
+
+    bench_parser = commands.add_parser("bench", help="benchmark solutions and check for regressions")
+    which = bench_parser.add_mutually_exclusive_group(required=True)
+    which.add_argument("--day", type=int, help="day of the puzzle")
+    which.add_argument("--all", action="store_true", help="benchmark all the variants of all the days")
+    bench_parser.add_argument("--variant", help="variant of the solution (default: all)")
+    bench_parser.add_argument("--input", help="input file (default: the input file of the day)")
+    bench_parser.add_argument("--warmup", type=int, default=1, help="number of warm-up executions (default: 1)")
+    bench_parser.add_argument("--repeat", type=int, default=5, help="number of measured executions (default: 5)")
+    bench_parser.add_argument("--output", help="write the JSON report to this file")
+    bench_parser.add_argument("--baseline", help="JSON report to compare timings with")
+    bench_parser.add_argument("--threshold", type=float, default=0.1,
+                              help="maximum allowed slowdown w.r.t. the baseline, as a fraction (default: 0.1)")
+    bench_parser.add_argument("--expected", help="JSON file with the expected answers")
+    bench_parser.add_argument("--update-expected", action="store_true",
+                              help="write the answers to the --expected file instead of checking them")
+
+    compare_parser = commands.add_parser("compare", help="run all the variants of a day and compare them")
+    compare_parser.add_argument("--day", type=int, required=True, help="day of the puzzle")
+    compare_parser.add_argument("--input", help="input file (default: the input file of the day)")
+    compare_parser.add_argument("--warmup", type=int, default=1, help="number of warm-up executions (default: 1)")
+    compare_parser.add_argument("--repeat", type=int, default=5, help="number of measured executions (default: 5)")
+
+    gen_parser = commands.add_parser("gen", help="generate a synthetic input")
+    gen_parser.add_argument("--day", type=int, required=True, help="day of the puzzle")
+    gen_parser.add_argument("--size", type=int, required=True, help="size of the input (its meaning depends on the day)")
+    gen_parser.add_argument("--seed", type=int, default=0, help="seed of the random number generator (default: 0)")
+    gen_parser.add_argument("--output", help="write the input to this file instead of standard output")
+
+    scale_parser = commands.add_parser("scale", help="run a solution on synthetic inputs of increasing size")
+    scale_parser.add_argument("--day", type=int, required=True, help="day of the puzzle")
+    scale_parser.add_argument("--sizes", required=True, help="comma separated list of sizes")
+    scale_parser.add_argument("--variant", help="variant of the solution (default: all)")
+    scale_parser.add_argument("--seed", type=int, default=0, help="seed of the random number generator (default: 0)")
+    scale_parser.add_argument("--memory", action="store_true", help="measure peak memory and allocations of each phase")
+
+    args = parser.parse_args(argv)
+    if args.command in ("run", "bench") and args.all and (args.variant is not None or args.input is not None):
+        parser.error("--variant and --input cannot be used with --all")
+    if args.command == "run" and args.all and args.profile is not None:
+        parser.error("--profile cannot be used with --all")
+    if args.command == "run":
+        if args.all:
+            print(run_all(args.jobs, memory=args.memory, counters=args.counters, cache=args.cache,
+                          memo_store=args.memo_store, snapshot=args.snapshot).to_json())
+        else:
+            if args.memo_store is not None:
+                aoc.use_memo_store(args.memo_store)
+            print(run_day(args.day, args.variant, args.input, args.memory,
+                          args.profile, args.profile_output, args.counters, args.cache,
+                          args.snapshot).to_json())
+    elif args.command == "bench":
+        sys.exit(bench_command(args))
+    elif args.command == "compare":
+        sys.exit(compare_command(args))
+    elif args.command == "gen":
+        content = gen.generate(args.day, args.size, args.seed)
+        if args.output is not None:
+            Path(args.output).write_text(content)
+        else:
+            sys.stdout.write(content)
+    elif args.command == "scale":
+        sizes = [int(size) for size in args.sizes.split(",")]
+        for size, record in gen.scale(args.day, sizes, args.variant, args.seed, args.memory):
+            print(json.dumps({"size": size} | asdict(record)), flush=True)
+
+
+def bench_command(args: argparse.Namespace) -> int:
+    """
+    Execute the bench command, returning the exit status: 1 if some answer is wrong or some
+    phase is slower than in the baseline, 0 otherwise.
+    """
+    if args.repeat < 1:
+        raise SystemExit("--repeat must be at least 1")
+    if args.all:
+        report = bench.bench_all(warmup=args.warmup, repeat=args.repeat)
+    else:
+        record = bench.bench_day(args.day, args.variant, args.input, args.warmup, args.repeat)
+        report = bench.BenchReport(args.warmup, args.repeat, [record])
+    print(bench.format_report(report))
+    if args.output is not None:
+        Path(args.output).write_text(report.to_json())
+
+    problems: list[str] = []
+    if args.expected is not None:
+        expected_file = Path(args.expected)
+        expected: dict[str, dict[str, Any]] = json.loads(expected_file.read_text()) if expected_file.exists() else {}
+        if args.update_expected:
+            for day, answers in bench.expected_answers(report).items():
+                expected.setdefault(day, {}).update(answers)
+            expected_file.write_text(json.dumps(expected, indent=1))
+        else:
+            problems += bench.check_answers(report, expected)
+    if args.baseline is not None:
+        baseline = json.loads(Path(args.baseline).read_text())
+        problems += bench.compare(report, baseline, args.threshold)
+    for problem in problems:
+        print(problem, file=sys.stderr)
+    return 1 if problems else 0
+
+
+def compare_command(args: argparse.Namespace) -> int:
+    """
+    Execute the compare command, returning the exit status: 1 if the variants do not agree on
+    the answers, 0 otherwise.
+    """
+    if args.repeat < 1:
+        raise SystemExit("--repeat must be at least 1")
+    report = bench.bench_variants(args.day, args.input, args.warmup, args.repeat)
+    print(bench.format_speedups(report))
+    problems = bench.disagreements(report)
+    for problem in problems:
+        print(problem, file=sys.stderr)
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    main()
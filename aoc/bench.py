@@ -0,0 +1,237 @@
+"""
+Benchmark the solutions, comparing their timings with a stored baseline and their answers
+with the expected ones.
+
+Each phase (parse, part 1 and part 2) is executed a number of times for warming up and a
+number of measured times. Module-level caches of the solution (such as those created by
+`functools.cache`) are cleared before each execution, so that all executions do the same work.
+"""
+
+import json
+import statistics
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+from aoc import Variant
+from aoc.runner import DAYS, PARTS, default_input, default_variant, load, variants
+
+
+@dataclass
+class PhaseStats:
+    """
+    Statistics of the wall time (in seconds) of several executions of a phase.
+    """
+    median: float
+    min: float
+    stddev: float
+    runs: int
+
+    @staticmethod
+    def of(samples: list[float]) -> 'PhaseStats':
+        """
+        Compute the statistics of the given samples.
+        """
+        stddev = statistics.stdev(samples) if len(samples) > 1 else 0.0
+        return PhaseStats(statistics.median(samples), min(samples), stddev, len(samples))
+
+
+@dataclass
+class BenchRecord:
+    """
+    The result of benchmarking a solution.
+    """
+    day: int
+    variant: str
+    input: str
+    answers: dict[str, Any] = field(default_factory=dict[str, Any])
+    stats: dict[str, PhaseStats] = field(default_factory=dict[str, PhaseStats])
+    error: str | None = None
+
+
+@dataclass
+class BenchReport:
+    """
+    The result of benchmarking several solutions.
+    """
+    warmup: int
+    repeat: int
+    records: list[BenchRecord]
+
+    def to_json(self) -> str:
+        """
+        Return the report as JSON.
+        """
+        return json.dumps(asdict(self), indent=1)
+
+
+def _clear_caches(solution: Variant, arg: Any = None):
+    """
+    Clear the caches of the module-level functions of the module defining `solution`, and the
+    caches of the argument of the function, such as the distance fields of a `Maze`.
+    """
+    for obj in [*vars(sys.modules[solution.parse.__module__]).values(), arg]:
+        # classes such as `Maze` have an unbound `cache_clear` method
+        if not isinstance(obj, type) and callable(cache_clear := getattr(obj, "cache_clear", None)):
+            cache_clear()
+
+
+def _measure[T](solution: Variant, function: Callable[..., T], arg: Any, warmup: int, repeat: int) -> tuple[T, PhaseStats]:
+    """
+    Execute `function(arg)` for `warmup` + `repeat` times, and return the result of the last
+    execution with the statistics of the measured ones. `repeat` must be at least 1.
+    """
+    for _ in range(warmup):
+        _clear_caches(solution, arg)
+        function(arg)
+    samples: list[float] = []
+    while True:
+        _clear_caches(solution, arg)
+        start = time.perf_counter()
+        result = function(arg)
+        samples.append(time.perf_counter() - start)
+        if len(samples) >= repeat:
+            return result, PhaseStats.of(samples)
+
+
+def bench_day(day: int, variant: str | None = None, input: str | Path | None = None,
+              warmup: int = 1, repeat: int = 5) -> BenchRecord:
+    """
+    Benchmark the given variant of the solution of a day (by default, the main one) on an input
+    file (by default, the `input` file in the directory of the day). `repeat` must be at least 1.
+    """
+    if repeat < 1:
+        raise ValueError(f"the number of measured executions must be at least 1, not {repeat}")
+    if variant is None:
+        variant = default_variant(day)
+    filename = str(Path(input).resolve() if input is not None else default_input(day))
+    record = BenchRecord(day, variant, filename)
+    try:
+        solution = load(day, variant)
+        data, record.stats["parse"] = _measure(solution, solution.parse, filename, warmup, repeat)
+        for part in PARTS:
+            solver = getattr(solution, part)
+            if solver is not None:
+                record.answers[part], record.stats[part] = _measure(solution, solver, data, warmup, repeat)
+    except Exception as e:
+        record.error = f"{type(e).__name__}: {e}"
+    return record
+
+
+def bench_all(days: Iterable[int] = DAYS, warmup: int = 1, repeat: int = 5) -> BenchReport:
+    """
+    Benchmark all the variants of the solutions of the given days (by default, all of them) on
+    their default input. Solutions are run one at a time, so that they do not compete for the CPU.
+    """
+    records = [bench_day(day, variant, None, warmup, repeat)
+               for day in days for variant in variants(day)]
+    return BenchReport(warmup, repeat, records)
+
+
+def bench_variants(day: int, input: str | Path | None = None, warmup: int = 1, repeat: int = 5) -> BenchReport:
+    """
+    Benchmark all the variants of the solution of a day on the same input file (by default,
+    the `input` file in the directory of the day). The main variant comes first.
+    """
+    names = variants(day)
+    main = default_variant(day)
+    names.remove(main)
+    records = [bench_day(day, name, input, warmup, repeat) for name in [main] + names]
+    return BenchReport(warmup, repeat, records)
+
+
+def disagreements(report: BenchReport) -> list[str]:
+    """
+    Return the list of answers in `report` which differ from the answer given by the first
+    variant which solves the same part, and the list of errors.
+    """
+    reference: dict[str, tuple[str, Any]] = {}
+    wrong: list[str] = []
+    for r in report.records:
+        if r.error is not None:
+            wrong.append(f"day {r.day} {r.variant}: {r.error}")
+        for part, answer in r.answers.items():
+            ref_variant, ref_answer = reference.setdefault(part, (r.variant, answer))
+            if answer != ref_answer:
+                wrong.append(f"day {r.day} {r.variant} {part}: got {answer!r}, {ref_variant} got {ref_answer!r}")
+    return wrong
+
+
+def format_speedups(report: BenchReport) -> str:
+    """
+    Return a human readable table with the median times of each variant in `report`, and
+    their speedup w.r.t. the first variant. The total time is only compared between variants
+    which execute the same phases.
+    """
+    phases = ["parse", *PARTS, "total"]
+    medians = [{phase: s.median for phase, s in r.stats.items()} for r in report.records]
+    for r, m in zip(report.records, medians):
+        if r.stats:
+            m["total"] = sum(m.values())
+    lines = [f"{'variant':<14}" + "".join(f"{phase:>20}" for phase in phases)]
+    for r, m in zip(report.records, medians):
+        same_phases = r.stats.keys() == report.records[0].stats.keys()
+        cells: list[str] = []
+        for phase in phases:
+            if phase in m and m[phase] > 0 and phase in medians[0] and (phase != "total" or same_phases):
+                cells.append(f"{m[phase]:>12.6f} {medians[0][phase] / m[phase]:>6.2f}x")
+            else:
+                cells.append(f"{m.get(phase, float('nan')):>12.6f} {'-':>7}")
+        lines.append(f"{r.variant:<14}" + "".join(cells))
+    return "\n".join(lines)
+
+
+def compare(report: BenchReport, baseline: dict[str, Any], threshold: float) -> list[str]:
+    """
+    Compare the median times in `report` with those in `baseline` (a report loaded from JSON),
+    and return the list of phases which are slower by more than a fraction `threshold`.
+    """
+    base_stats = {(r["day"], r["variant"]): r["stats"] for r in baseline["records"]}
+    regressions: list[str] = []
+    for r in report.records:
+        old_stats = base_stats.get((r.day, r.variant), {})
+        for phase, stats in r.stats.items():
+            if phase in old_stats and stats.median > old_stats[phase]["median"] * (1 + threshold):
+                ratio = stats.median / old_stats[phase]["median"]
+                regressions.append(f"day {r.day} {r.variant} {phase}: {ratio:.2f}x slower")
+    return regressions
+
+
+def check_answers(report: BenchReport, expected: dict[str, dict[str, Any]]) -> list[str]:
+    """
+    Compare the answers in `report` with the `expected` ones, given as a map from days (as
+    strings) to a map from parts to answers. Return the list of wrong answers and errors.
+    """
+    wrong: list[str] = []
+    for r in report.records:
+        if r.error is not None:
+            wrong.append(f"day {r.day} {r.variant}: {r.error}")
+        for part, answer in r.answers.items():
+            if (exp := expected.get(str(r.day), {}).get(part)) is not None and answer != exp:
+                wrong.append(f"day {r.day} {r.variant} {part}: got {answer!r}, expected {exp!r}")
+    return wrong
+
+
+def expected_answers(report: BenchReport) -> dict[str, dict[str, Any]]:
+    """
+    Return the answers in `report` in the format used by `check_answers`.
+    """
+    expected: dict[str, dict[str, Any]] = {}
+    for r in report.records:
+        expected.setdefault(str(r.day), {}).update(r.answers)
+    return expected
+
+
+def format_report(report: BenchReport) -> str:
+    """
+    Return a human readable table with the median and minimum times of each phase.
+    """
+    lines = [f"{'day':>3} {'variant':<12} {'phase':<6} {'median':>10} {'min':>10} {'stddev':>10}"]
+    for r in report.records:
+        for phase, s in r.stats.items():
+            lines.append(f"{r.day:>3} {r.variant:<12} {phase:<6} {s.median:>10.6f} {s.min:>10.6f} {s.stddev:>10.6f}")
+        if r.error is not None:
+            lines.append(f"{r.day:>3} {r.variant:<12} error: {r.error}")
+    return "\n".join(lines)
@@ -0,0 +1,76 @@
+"""
+Cache the results of running the solutions on local disk.
+
+A result is stored in a JSON file whose name is a hash of everything it depends on: the content
+of the input file, the sources of the solutions of the day and of the `aoc` package, and the
+options of the run. Changing any of them changes the key, hence stale results are never
+returned and there is nothing to invalidate explicitly; old entries may be removed with `clear`.
+
+The cache is stored in the `.aoc_cache` directory at the root of the repository, or in the
+directory given by the `AOC_CACHE_DIR` environment variable.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Iterable
+
+CACHE_ENV = "AOC_CACHE_DIR"
+"""Environment variable selecting the cache directory."""
+
+_DEFAULT_DIRECTORY = Path(__file__).parent.parent / ".aoc_cache"
+
+
+def cache_directory() -> Path:
+    """
+    Return the directory containing the cached results.
+    """
+    directory = os.environ.get(CACHE_ENV)
+    return Path(directory) if directory else _DEFAULT_DIRECTORY
+
+
+def key(input: str | Path, sources: Iterable[str | Path], *options: Any) -> str:
+    """
+    Return the key of the result of running the given `sources` on the `input` file with the
+    given `options`, which must be representable as JSON.
+    """
+    h = hashlib.sha256()
+    h.update(Path(input).read_bytes())
+    for source in sorted(Path(s) for s in sources):
+        h.update(source.name.encode())
+        h.update(source.read_bytes())
+    h.update(json.dumps(options).encode())
+    return h.hexdigest()
+
+
+def load(key: str) -> dict[str, Any] | None:
+    """
+    Return the result stored with the given key, or None if there is none.
+    """
+    try:
+        return json.loads((cache_directory() / f"{key}.json").read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def store(key: str, result: dict[str, Any]):
+    """
+    Store a result with the given key. The file is written atomically, so that concurrent
+    runs never read a partial result.
+    """
+    directory = cache_directory()
+    directory.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    with os.fdopen(fd, "w") as f:
+        json.dump(result, f)
+    os.replace(tmp, directory / f"{key}.json")
+
+
+def clear():
+    """
+    Remove all the cached results.
+    """
+    for path in cache_directory().glob("*.json"):
+        path.unlink(missing_ok=True)
@@ -0,0 +1,473 @@
+"""
+Generators of synthetic inputs for the puzzles, used to measure how the solutions scale.
+
+For each day there is a generator which takes a size and a random number generator, and returns
+the content of a valid input file. The meaning of the size depends on the day (side of the grid,
+number of reports, robots, buyers, bits of the adder, ...) and is described in the docstring of
+each generator. Given the same size and seed, the generated input is always the same.
+"""
+
+import string
+import tempfile
+from pathlib import Path
+from random import Random
+from typing import Callable, Iterable, Iterator
+
+from aoc.runner import RunRecord, run_day
+
+type generator = Callable[[int, Random], str]
+
+GENERATORS: dict[int, generator] = {}
+"""Generators of the inputs, indexed by day."""
+
+
+def generate(day: int, size: int, seed: int = 0) -> str:
+    """
+    Generate an input of the given size for the puzzle of the given day.
+    """
+    if day not in GENERATORS:
+        raise ValueError(f"no generator for day {day}")
+    return GENERATORS[day](size, Random(seed))
+
+
+def scale(day: int, sizes: Iterable[int], variant: str | None = None, seed: int = 0,
+          memory: bool = False) -> Iterator[tuple[int, RunRecord]]:
+    """
+    Run the given variant of the solution of a day (by default, the main one) on generated
+    inputs of the given sizes, yielding each size together with the result of the run. If
+    `memory` is true, also measure the memory usage of each phase.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in sizes:
+            filename = Path(tmp) / f"day{day}_{size}"
+            filename.write_text(generate(day, size, seed))
+            yield size, run_day(day, variant, filename, memory)
+            filename.unlink()
+
+
+def _generator(day: int) -> Callable[[generator], generator]:
+    """
+    Decorator which registers a generator for the given day.
+    """
+    def register(gen: generator) -> generator:
+        GENERATORS[day] = gen
+        return gen
+    return register
+
+
+def _lines(lines: list[str]) -> str:
+    """
+    Join a list of lines into the content of a file.
+    """
+    return "\n".join(lines) + "\n"
+
+
+def _maze(size: int, rng: Random, openings: float) -> list[list[str]]:
+    """
+    Return a maze of side `size` (rounded up to an odd number), with the start in the bottom-left
+    corner and the end in the top-right corner. The maze is generated by a randomized depth-first
+    visit, hence there is a single path between two cells, then a fraction `openings` of the
+    remaining walls between two cells is removed.
+    """
+    size = max(5, size | 1)
+    m = [["#"] * size for _ in range(size)]
+    start = (size - 2, 1)
+    m[start[0]][start[1]] = "."
+    stack: list[tuple[int, int]] = [start]
+    while stack:
+        i, j = stack[-1]
+        neighbours = [(i + di, j + dj) for di, dj in ((-2, 0), (2, 0), (0, -2), (0, 2))
+                      if 0 < i + di < size - 1 and 0 < j + dj < size - 1 and m[i + di][j + dj] == "#"]
+        if neighbours:
+            i_new, j_new = rng.choice(neighbours)
+            m[(i + i_new) // 2][(j + j_new) // 2] = "."
+            m[i_new][j_new] = "."
+            stack.append((i_new, j_new))
+        else:
+            stack.pop()
+    for i in range(1, size - 1):
+        for j in range(1, size - 1):
+            if m[i][j] == "#" and (i % 2 != j % 2) and rng.random() < openings:
+                m[i][j] = "."
+    m[start[0]][start[1]] = "S"
+    m[1][size - 2] = "E"
+    return m
+
+
+@_generator(1)
+def day1(size: int, rng: Random) -> str:
+    """
+    A list of `size` pairs of location IDs.
+    """
+    return _lines([f"{rng.randrange(10000, 100000)}   {rng.randrange(10000, 100000)}" for _ in range(size)])
+
+
+@_generator(2)
+def day2(size: int, rng: Random) -> str:
+    """
+    A list of `size` reports. Most of them are monotonic, with some random errors.
+    """
+    lines: list[str] = []
+    for _ in range(size):
+        direction = rng.choice((-1, 1))
+        level = rng.randrange(30, 70)
+        levels: list[int] = []
+        for _ in range(rng.randrange(5, 9)):
+            levels.append(level)
+            level += direction * (rng.randrange(1, 4) if rng.random() < 0.9 else rng.randrange(-3, 6))
+        lines.append(" ".join(map(str, levels)))
+    return _lines(lines)
+
+
+@_generator(3)
+def day3(size: int, rng: Random) -> str:
+    """
+    A corrupted program with `size` instructions or pieces of garbage, 100 per line.
+    """
+    garbage = "mul(,)don't[]{}<>!@#$%^&*+-?/ 0123456789what()select()"
+    pieces: list[str] = []
+    for _ in range(size):
+        r = rng.random()
+        if r < 0.5:
+            pieces.append(f"mul({rng.randrange(1, 1000)},{rng.randrange(1, 1000)})")
+        elif r < 0.55:
+            pieces.append("do()")
+        elif r < 0.6:
+            pieces.append("don't()")
+        else:
+            pieces.append("".join(rng.choices(garbage, k=rng.randrange(1, 8))))
+    return _lines(["".join(pieces[i:i+100]) for i in range(0, len(pieces), 100)])
+
+
+@_generator(4)
+def day4(size: int, rng: Random) -> str:
+    """
+    A word search of side `size`.
+    """
+    return _lines(["".join(rng.choices("XMAS", k=size)) for _ in range(size)])
+
+
+@_generator(5)
+def day5(size: int, rng: Random) -> str:
+    """
+    The ordering rules for 49 pages, followed by `size` updates. About half of the updates
+    are in the right order.
+    """
+    pages = rng.sample(range(10, 100), 49)
+    rules = [f"{a}|{b}" for i, a in enumerate(pages) for b in pages[i+1:]]
+    rng.shuffle(rules)
+    updates: list[str] = []
+    for _ in range(size):
+        update = rng.sample(pages, rng.randrange(5, 24, 2))
+        if rng.random() < 0.5:
+            update.sort(key=pages.index)
+        updates.append(",".join(map(str, update)))
+    return _lines(rules + [""] + updates)
+
+
+@_generator(6)
+def day6(size: int, rng: Random) -> str:
+    """
+    A lab map of side `size`, with the guard near the center.
+    """
+    size = max(size, 3)
+    m = [["#" if rng.random() < 0.08 else "." for _ in range(size)] for _ in range(size)]
+    m[size // 2][size // 2] = "^"
+    return _lines(["".join(line) for line in m])
+
+
+@_generator(7)
+def day7(size: int, rng: Random) -> str:
+    """
+    A list of `size` equations. About two thirds of them may be made true.
+    """
+    lines: list[str] = []
+    for _ in range(size):
+        operands = [rng.randrange(1, 1000) for _ in range(rng.randrange(2, 13))]
+        result = operands[0]
+        for x in operands[1:]:
+            match rng.randrange(3):
+                case 0: result += x
+                case 1: result *= x
+                case _: result = int(f"{result}{x}")
+        if rng.random() < 0.33:
+            result += rng.randrange(1, 100)
+        lines.append(f"{result}: {' '.join(map(str, operands))}")
+    return _lines(lines)
+
+
+@_generator(8)
+def day8(size: int, rng: Random) -> str:
+    """
+    An antenna map of side `size`, with about one antenna every 50 cells.
+    """
+    frequencies = string.ascii_letters + string.digits
+    m = [["."] * size for _ in range(size)]
+    for _ in range(size * size // 50):
+        m[rng.randrange(size)][rng.randrange(size)] = rng.choice(frequencies)
+    return _lines(["".join(line) for line in m])
+
+
+@_generator(9)
+def day9(size: int, rng: Random) -> str:
+    """
+    A disk map with `size` files.
+    """
+    size = max(size, 2)
+    digits = [str(rng.randrange(1, 10)) if k % 2 == 0 else str(rng.randrange(10)) for k in range(2 * size - 1)]
+    digits[1] = str(rng.randrange(1, 10))
+    return _lines(["".join(digits)])
+
+
+@_generator(10)
+def day10(size: int, rng: Random) -> str:
+    """
+    A topographic map of side `size`, made of hills around random peaks.
+    """
+    peaks = [(rng.randrange(size), rng.randrange(size)) for _ in range(max(1, size * size // 100))]
+    height = [[0] * size for _ in range(size)]
+    for i in range(size):
+        for j in range(size):
+            distance = min(abs(i - pi) + abs(j - pj) for pi, pj in peaks)
+            height[i][j] = max(0, 9 - distance) if rng.random() < 0.9 else rng.randrange(10)
+    return _lines(["".join(map(str, line)) for line in height])
+
+
+@_generator(11)
+def day11(size: int, rng: Random) -> str:
+    """
+    A line of `size` stones.
+    """
+    return _lines([" ".join(str(rng.randrange(1000000)) for _ in range(size))])
+
+
+@_generator(12)
+def day12(size: int, rng: Random) -> str:
+    """
+    A garden of side `size`, where each plot usually extends the region above or on the left.
+    """
+    m = [[""] * size for _ in range(size)]
+    for i in range(size):
+        for j in range(size):
+            r = rng.random()
+            if r < 0.45 and i > 0:
+                m[i][j] = m[i-1][j]
+            elif r < 0.9 and j > 0:
+                m[i][j] = m[i][j-1]
+            else:
+                m[i][j] = rng.choice(string.ascii_uppercase)
+    return _lines(["".join(line) for line in m])
+
+
+@_generator(13)
+def day13(size: int, rng: Random) -> str:
+    """
+    A list of `size` claw machines. About half of them may be won, and the others have no
+    integer solution.
+    """
+    lines: list[str] = []
+    for _ in range(size):
+        winnable = rng.random() < 0.5
+        while True:
+            ax, ay, bx, by = (rng.randrange(10, 100) for _ in range(4))
+            den = ax * by - bx * ay
+            if den == 0:
+                continue
+            a, b = rng.randrange(101), rng.randrange(101)
+            posx, posy = ax * a + bx * b, ay * a + by * b
+            if winnable:
+                break
+            posx, posy = posx + rng.randrange(1, 50), posy + rng.randrange(1, 50)
+            if (ax * posy - ay * posx) % den != 0 or (posx * by - posy * bx) % den != 0:
+                break
+        lines += [f"Button A: X+{ax}, Y+{ay}", f"Button B: X+{bx}, Y+{by}", f"Prize: X={posx}, Y={posy}", ""]
+    return _lines(lines[:-1])
+
+
+@_generator(14)
+def day14(size: int, rng: Random) -> str:
+    """
+    A list of `size` robots (at least 31) in a 101x103 bathroom. At a random time, 31 of them
+    line up in a row, which the solution recognizes as a Christmas tree.
+    """
+    sizex, sizey = 101, 103
+    size = max(size, 31)
+    time = rng.randrange(101, sizex * sizey)
+    row, col = rng.randrange(sizey), rng.randrange(sizex - 31)
+    lines: list[str] = []
+    for k in range(size):
+        vx, vy = rng.randrange(-100, 101), rng.randrange(-100, 101)
+        if k < 31:
+            posx = (col + k - time * vx) % sizex
+            posy = (row - time * vy) % sizey
+        else:
+            posx, posy = rng.randrange(sizex), rng.randrange(sizey)
+        lines.append(f"p={posx},{posy} v={vx},{vy}")
+    return _lines(lines)
+
+
+@_generator(15)
+def day15(size: int, rng: Random) -> str:
+    """
+    A warehouse of side `size`, followed by 8 * `size` * `size` moves of the robot.
+    """
+    size = max(size, 3)
+    m = [["#"] * size] + [
+        ["#"] + [rng.choices("#O.", weights=(5, 25, 70))[0] for _ in range(size - 2)] + ["#"]
+        for _ in range(size - 2)
+    ] + [["#"] * size]
+    m[size // 2][size // 2] = "@"
+    moves = "".join(rng.choices("<>^v", k=8 * size * size))
+    return _lines(["".join(line) for line in m] + [""] + [moves[i:i+70] for i in range(0, len(moves), 70)])
+
+
+@_generator(16)
+def day16(size: int, rng: Random) -> str:
+    """
+    A maze of side `size` (rounded up to an odd number) with many alternative paths.
+    """
+    return _lines(["".join(line) for line in _maze(size, rng, 0.05)])
+
+
+@_generator(17)
+def day17(size: int, rng: Random) -> str:
+    """
+    A program of the same shape of the puzzle, which outputs `size` values for part 1.
+    """
+    program = [2, 4, 1, rng.randrange(8), 7, 5, 1, rng.randrange(8), 4, rng.randrange(8), 0, 3, 5, 5, 3, 0]
+    a = rng.randrange(8 ** (size - 1), 8 ** size) if size > 1 else rng.randrange(8)
+    return _lines([f"Register A: {a}", "Register B: 0", "Register C: 0", "", f"Program: {','.join(map(str, program))}"])
+
+
+@_generator(18)
+def day18(size: int, rng: Random) -> str:
+    """
+    A list of `size` bytes (at least 1024 + 71) falling in a 71x71 memory space. The path to the
+    exit is surely blocked by the last byte, since the last bytes fill an anti-diagonal.
+    """
+    side, time = 71, 1024
+    k = rng.randrange(side // 2, side + side // 2)
+    cut = [(i, k - i) for i in range(side) if 0 <= k - i < side]
+    others = [(i, j) for i in range(side) for j in range(side)
+              if i + j != k and (i, j) not in ((0, 0), (side - 1, side - 1))]
+    size = min(max(size, time + len(cut)), len(others) + len(cut))
+    drops = rng.sample(others, size - len(cut))
+    rng.shuffle(cut)
+    drops[time:time] = cut[:-1]
+    drops.append(cut[-1])
+    return _lines([f"{j},{i}" for i, j in drops])
+
+
+@_generator(19)
+def day19(size: int, rng: Random) -> str:
+    """
+    A list of 400 towels, followed by `size` designs. About half of the designs are made of
+    towels, the others are random.
+    """
+    towels = sorted({"".join(rng.choices("wubrg", k=rng.randrange(1, 9))) for _ in range(400)} - {"g"})
+    designs: list[str] = []
+    for _ in range(size):
+        if rng.random() < 0.5:
+            design = ""
+            while len(design) < 20:
+                design += rng.choice(towels)
+        else:
+            design = "".join(rng.choices("wubrg", k=rng.randrange(20, 61)))
+        designs.append(design)
+    return _lines([", ".join(towels), ""] + designs)
+
+
+@_generator(20)
+def day20(size: int, rng: Random) -> str:
+    """
+    A racetrack of side `size` (rounded up to an odd number), with a single path from start to
+    end and many dead ends.
+    """
+    return _lines(["".join(line) for line in _maze(size, rng, 0.0)])
+
+
+@_generator(21)
+def day21(size: int, rng: Random) -> str:
+    """
+    A list of `size` door codes.
+    """
+    return _lines([f"{rng.randrange(1000):03}A" for _ in range(size)])
+
+
+@_generator(22)
+def day22(size: int, rng: Random) -> str:
+    """
+    The initial secret numbers of `size` buyers.
+    """
+    return _lines([str(rng.randrange(1, 16777216)) for _ in range(size)])
+
+
+@_generator(23)
+def day23(size: int, rng: Random) -> str:
+    """
+    A network of `size` computers (from 13 to 676), each connected to about 13 others, with a
+    planted clique of 13 computers.
+    """
+    names = rng.sample([a + b for a in string.ascii_lowercase for b in string.ascii_lowercase], max(13, min(size, 676)))
+    edges: set[tuple[str, str]] = set()
+    for n in names:
+        for m in rng.sample(names, 7):
+            if n != m:
+                edges.add((min(n, m), max(n, m)))
+    clique = rng.sample(names, 13)
+    edges.update((min(n, m), max(n, m)) for n in clique for m in clique if n != m)
+    lines = [f"{n}-{m}" if rng.random() < 0.5 else f"{m}-{n}" for n, m in sorted(edges)]
+    rng.shuffle(lines)
+    return _lines(lines)
+
+
+@_generator(24)
+def day24(size: int, rng: Random) -> str:
+    """
+    A ripple carry adder of `size` bits (at least 40), with four pairs of swapped output wires.
+    These are the pairs in `puzzle24.all.SWAPS`, so that the solution is able to fix the circuit.
+    """
+    size = max(size, 40)
+    reserved = {"vvr", "bkr", "rnq", "tfb", "mqh"}
+    pool = [a + b + c for a in "abcdefghijklmnopqrstuvw" for b in string.ascii_lowercase for c in string.ascii_lowercase]
+    names = iter(rng.sample([n for n in pool if n not in reserved], 4 * size))
+    gates: dict[str, tuple[str, str, str]] = {}
+
+    def add(i1: str, op: str, i2: str, out: str | None = None) -> str:
+        out = out if out is not None else next(names)
+        gates[out] = (i1, op, i2) if rng.random() < 0.5 else (i2, op, i1)
+        return out
+
+    carry = add("x00", "AND", "y00")
+    add("x00", "XOR", "y00", "z00")
+    bit_bkr = rng.randrange(1, size)
+    for i in range(1, size):
+        x, y = f"x{i:02}", f"y{i:02}"
+        s1 = add(x, "XOR", y, "bkr" if i == bit_bkr else None)
+        c2 = add(x, "AND", y, "rnq" if i == bit_bkr else None)
+        add(s1, "XOR", carry, f"z{i:02}")
+        c1 = add(s1, "AND", carry, {8: "vvr", 28: "tfb", 39: "mqh"}.get(i))
+        carry = add(c1, "OR", c2, f"z{size:02}" if i == size - 1 else None)
+    for w1, w2 in [("vvr", "z08"), ("bkr", "rnq"), ("tfb", "z28"), ("mqh", "z39")]:
+        gates[w1], gates[w2] = gates[w2], gates[w1]
+
+    inputs = [f"{bus}{i:02}: {rng.randrange(2)}" for bus in "xy" for i in range(size)]
+    wiring = [f"{i1} {op} {i2} -> {out}" for out, (i1, op, i2) in gates.items()]
+    rng.shuffle(wiring)
+    return _lines(inputs + [""] + wiring)
+
+
+@_generator(25)
+def day25(size: int, rng: Random) -> str:
+    """
+    A list of `size` schematics of locks and keys.
+    """
+    schematics: list[str] = []
+    for _ in range(size):
+        heights = [rng.randrange(6) for _ in range(5)]
+        rows = ["".join("#" if h >= r else "." for h in heights) for r in range(1, 6)]
+        if rng.random() < 0.5:
+            schematics.append("\n".join(["#####"] + rows + ["....."]))
+        else:
+            schematics.append("\n".join(["....."] + rows[::-1] + ["#####"]))
+    return "\n\n".join(schematics) + "\n"
@@ -0,0 +1,55 @@
+"""
+Measure wall time and memory usage of a piece of code, using `tracemalloc`.
+
+Tracing memory allocations slows down the execution considerably, hence measuring is opt-in:
+wrap the code in the `measure` context manager, or pass the `--memory` flag to the `run` and
+`scale` commands to measure each phase of the solutions.
+"""
+
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Generator
+
+
+@dataclass
+class Measure:
+    """
+    The resources used by a piece of code.
+    """
+    wall: float = 0.0
+    """Wall time in seconds, including the overhead of tracing memory."""
+    peak: int = 0
+    """Peak traced memory in bytes, w.r.t. the memory in use at the beginning."""
+    allocated: int = 0
+    """Bytes allocated and still in use at the end."""
+    blocks: int = 0
+    """Number of memory blocks allocated and still in use at the end."""
+
+
+@contextmanager
+def measure() -> Generator[Measure, None, None]:
+    """
+    Context manager which measures the resources used by its body. The measure is available
+    once the body has been executed. It may not be nested, since the peak memory is global.
+    """
+    m = Measure()
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    start_memory, _ = tracemalloc.get_traced_memory()
+    start_blocks = sys.getallocatedblocks()
+    start = time.perf_counter()
+    try:
+        yield m
+    finally:
+        m.wall = time.perf_counter() - start
+        current, peak = tracemalloc.get_traced_memory()
+        m.blocks = sys.getallocatedblocks() - start_blocks
+        m.peak = peak - start_memory
+        m.allocated = current - start_memory
+        if started:
+            tracemalloc.stop()
@@ -0,0 +1,97 @@
+"""
+Profile a piece of code, producing both `cProfile` statistics and a collapsed-stack file.
+
+The collapsed-stack file is produced by a sampling profiler running in a separate thread, which
+periodically looks at the stack of the profiled thread with `sys._current_frames`. Each line of
+the file is a stack, from the outermost to the innermost frame separated by semicolons, followed
+by the number of samples: this is the format read by standard flamegraph tools, such as
+`flamegraph.pl` or speedscope.
+
+The `run` command profiles a phase of a solution when given the `--profile PHASE` flag, or when
+the `AOC_PROFILE` environment variable is set to the name of the phase.
+"""
+
+import cProfile
+import sys
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+from types import FrameType
+from typing import Generator
+
+PROFILE_ENV = "AOC_PROFILE"
+"""Environment variable selecting the phase to profile."""
+
+
+def _frame_label(frame: FrameType) -> str:
+    """
+    Return the label of a frame in the collapsed-stack file.
+    """
+    code = frame.f_code
+    return f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})"
+
+
+class StackSampler:
+    """
+    A sampling profiler which collects the stacks of a thread at regular intervals.
+    """
+
+    def __init__(self, thread_id: int, interval: float = 0.001):
+        """
+        Initialize the profiler for the thread `thread_id`, sampling every `interval` seconds.
+        Since the sampler needs the GIL, the actual interval may be longer.
+        """
+        self.thread_id = thread_id
+        self.interval = interval
+        self.samples: Counter[str] = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        """
+        Collect samples until the profiler is stopped.
+        """
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)  # pyright: ignore[reportPrivateUsage]
+            stack: list[str] = []
+            while frame is not None:
+                stack.append(_frame_label(frame))
+                frame = frame.f_back
+            if stack:
+                self.samples[";".join(reversed(stack))] += 1
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def write(self, filename: str | Path):
+        """
+        Write the samples to a file in collapsed-stack format.
+        """
+        with open(filename, "w") as f:
+            for stack, count in sorted(self.samples.items()):
+                f.write(f"{stack} {count}\n")
+
+
+@contextmanager
+def profile(prefix: str | Path, interval: float = 0.001) -> Generator[None, None, None]:
+    """
+    Context manager which profiles its body, writing the `cProfile` statistics to
+    `<prefix>.pstats` and the sampled stacks to `<prefix>.collapsed`. Both profilers run
+    at the same time, hence the sampled stacks include the overhead of `cProfile`.
+    """
+    sampler = StackSampler(threading.get_ident(), interval)
+    profiler = cProfile.Profile()
+    sampler.start()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        sampler.stop()
+        profiler.dump_stats(f"{prefix}.pstats")
+        sampler.write(f"{prefix}.collapsed")
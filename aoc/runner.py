@@ -0,0 +1,275 @@
+"""
+Load the solutions of the puzzles and run them, timing each phase separately.
+
+The solutions of the puzzle of day N are the modules in the `puzzleN` directory. Each module
+registers one or more variants with `aoc.register_variant`, providing the following functions:
+- `parse(filename)` reads the input file and returns the parsed data;
+- `part1(data)` and `part2(data)` compute the answers of the two parts of the puzzle.
+
+The `part2` function is optional, since some variants only solve the first part. The parsed
+data must not be modified by `part1` and `part2`, so that phases may be run more than once.
+"""
+
+import importlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from dataclasses import asdict, dataclass, field
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+import aoc
+from aoc import Variant, variant_registry
+from aoc import cache as result_cache
+from aoc import snapshot as snapshots
+from aoc.measure import Measure, measure
+from aoc.profiling import profile as profile_phase
+
+ROOT = Path(__file__).parent.parent
+"""Root directory of the repository, containing the `puzzleN` directories."""
+
+DAYS = range(1, 26)
+"""Days of the AoC."""
+
+PARTS = ("part1", "part2")
+"""Names of the phases which compute an answer."""
+
+
+def day_directory(day: int) -> Path:
+    """
+    Return the directory containing the solutions of the given day.
+    """
+    return ROOT / f"puzzle{day}"
+
+
+def import_day(day: int) -> dict[str, Variant]:
+    """
+    Import all the modules in the directory of the given day, and return the variants they
+    register. Since the `main` function of a solution is only called when it is executed as
+    a script, this has no side effects.
+    """
+    for path in sorted(day_directory(day).glob("*.py")):
+        importlib.import_module(f"puzzle{day}.{path.stem}")
+    return variant_registry[day]
+
+
+def variants(day: int) -> list[str]:
+    """
+    Return the names of all the variants of the solution of the given day.
+    """
+    return sorted(import_day(day))
+
+
+def default_variant(day: int) -> str:
+    """
+    Return the name of the main variant of the solution of the given day.
+    """
+    names = variants(day)
+    if not names:
+        raise ValueError(f"no solution for day {day}")
+    return "all" if "all" in names else names[0]
+
+
+def default_input(day: int) -> Path:
+    """
+    Return the path of the default input file of the given day.
+    """
+    return day_directory(day) / "input"
+
+
+def load(day: int, variant: str) -> Variant:
+    """
+    Return the given variant of the solution of a day.
+    """
+    day_variants = import_day(day)
+    if variant not in day_variants:
+        raise ValueError(f"no variant {variant} for day {day}")
+    return day_variants[variant]
+
+
+@dataclass
+class RunRecord:
+    """
+    The result of running a solution: the answers, the wall and CPU time spent in each phase
+    and, optionally, its memory usage and the counters of the search algorithms. If the
+    solution fails, `error` contains the exception which has been raised. If `cached` is true,
+    the record has been loaded from the result cache instead of running the solution. If
+    `snapshot` is true, the parsed data has been loaded from a snapshot instead of parsing the
+    input file, and the time of the parse phase is the time spent loading it.
+    """
+    day: int
+    variant: str
+    input: str
+    answers: dict[str, Any] = field(default_factory=dict[str, Any])
+    times: dict[str, float] = field(default_factory=dict[str, float])
+    cpu_times: dict[str, float] = field(default_factory=dict[str, float])
+    memory: dict[str, Measure] = field(default_factory=dict[str, Measure])
+    counters: dict[str, int] = field(default_factory=dict[str, int])
+    error: str | None = None
+    cached: bool = False
+    snapshot: bool = False
+
+    def to_json(self) -> str:
+        """
+        Return the record as a single line of JSON.
+        """
+        return json.dumps(asdict(self))
+
+    @staticmethod
+    def from_dict(d: dict[str, Any]) -> 'RunRecord':
+        """
+        Return the record represented by a dictionary, as produced by `asdict`.
+        """
+        return RunRecord(
+            day=int(d["day"]),
+            variant=str(d["variant"]),
+            input=str(d["input"]),
+            answers=dict(d["answers"]),
+            times={phase: float(t) for phase, t in d["times"].items()},
+            cpu_times={phase: float(t) for phase, t in d["cpu_times"].items()},
+            memory={phase: Measure(**m) for phase, m in d["memory"].items()},
+            counters={name: int(n) for name, n in d["counters"].items()},
+            error=d["error"],
+            cached=bool(d["cached"]),
+            snapshot=bool(d["snapshot"]),
+        )
+
+    def timed[T](self, phase: str, function: Callable[..., T], *args: Any, memory: bool = False) -> T:
+        """
+        Call `function` with arguments `args`, recording the time spent as the time of `phase`.
+        If `memory` is true, also record the memory usage.
+        """
+        if memory:
+            with measure() as m:
+                result = self.timed(phase, function, *args)
+            self.memory[phase] = m
+            return result
+        start, start_cpu = time.perf_counter(), time.process_time()
+        result = function(*args)
+        self.times[phase] = time.perf_counter() - start
+        self.cpu_times[phase] = time.process_time() - start_cpu
+        return result
+
+
+@dataclass
+class RunReport:
+    """
+    The result of running several solutions in parallel.
+    """
+    jobs: int
+    wall: float
+    records: list[RunRecord]
+
+    def to_json(self) -> str:
+        """
+        Return the report as a single line of JSON.
+        """
+        return json.dumps(asdict(self))
+
+
+def run_day(day: int, variant: str | None = None, input: str | Path | None = None,
+            memory: bool = False, profile: str | None = None, profile_output: str | Path | None = None,
+            counters: bool = False, cache: bool = False, snapshot: bool = False) -> RunRecord:
+    """
+    Run the given variant of the solution of a day (by default, the main one) on an input
+    file (by default, the `input` file in the directory of the day). If `memory` is true,
+    also measure the memory usage of each phase. If `profile` is the name of a phase, profile
+    it and write the results in files beginning with `profile_output` (by default,
+    `profile_day<N>_<variant>_<phase>` in the current directory). If `counters` is true, also
+    count the operations performed by the search algorithms in `aoc` and the hits, misses and
+    evictions of the functions memoized with `aoc.memo`. If `cache` is true,
+    return the result of a previous run with the same input, sources and options if there
+    is one, and store the result otherwise; profiled runs are never cached. If `snapshot` is
+    true, load the parsed data from a snapshot of the input file if there is one, and save
+    it to a snapshot otherwise.
+    """
+    if variant is None:
+        variant = default_variant(day)
+    filename = str(Path(input).resolve() if input is not None else default_input(day))
+    solution = load(day, variant)
+    if cache and profile is None:
+        key = cache_key(day, variant, filename, memory, counters)
+        if (cached := result_cache.load(key)) is not None:
+            return RunRecord.from_dict(cached | {"input": filename, "cached": True})
+        record = run_day(day, variant, filename, memory, counters=counters, snapshot=snapshot)
+        result_cache.store(key, asdict(record))
+        return record
+    record = RunRecord(day, variant, filename)
+    if profile_output is None:
+        profile_output = f"profile_day{day}_{variant}_{profile}"
+
+    def run_phase(phase: str, function: Callable[[Any], Any], arg: Any) -> Any:
+        with profile_phase(profile_output) if phase == profile else nullcontext():
+            return record.timed(phase, function, arg, memory=memory)
+
+    counting = aoc.counters_enabled()
+    if counters:
+        aoc.enable_counters()
+    aoc.counters.clear()
+    aoc.reset_memo_stats()
+    try:
+        path = snapshots.snapshot_path(filename, variant, cache_key(day, variant, filename)) if snapshot else None
+        if path is not None and path.exists():
+            data = run_phase("parse", snapshots.load, path)
+            record.snapshot = True
+        else:
+            data = run_phase("parse", solution.parse, filename)
+            if path is not None:
+                snapshots.store(path, data)
+        for part in PARTS:
+            solver = getattr(solution, part)
+            if solver is not None:
+                record.answers[part] = run_phase(part, solver, data)
+    finally:
+        # the counters are reported in the record, so they are not dumped again at exit
+        if aoc.counters_enabled():
+            record.counters = dict(sorted((aoc.counters + aoc.memo_counters()).items()))
+        aoc.counters.clear()
+        aoc.reset_memo_stats()
+        aoc.flush_memo_store()
+        # later runs in the same process must not pay for counting
+        aoc.enable_counters(counting)
+    return record
+
+
+def cache_key(day: int, variant: str, input: str | Path, *options: Any) -> str:
+    """
+    Return the key of the result of running a variant of the solution of a day on an input
+    file with the given options. The key depends on the sources of all the solutions of the
+    day, since they may import each other, and on the sources of the `aoc` package.
+    """
+    sources = [*day_directory(day).glob("*.py"), *Path(aoc.__file__).parent.glob("*.py")]
+    return result_cache.key(input, sources, day, variant, *options)
+
+
+def _run_job(job: tuple[int, str, bool, bool, bool, bool]) -> RunRecord:
+    """
+    Run a variant of the solution of a day on its default input, catching any exception.
+    """
+    day, variant, memory, counters, cache, snapshot = job
+    try:
+        return run_day(day, variant, memory=memory, counters=counters, cache=cache, snapshot=snapshot)
+    except Exception as e:
+        return RunRecord(day, variant, str(default_input(day)), error=f"{type(e).__name__}: {e}")
+
+
+def run_all(jobs: int | None = None, days: Iterable[int] = DAYS, memory: bool = False,
+            counters: bool = False, cache: bool = False, memo_store: str | Path | None = None,
+            snapshot: bool = False) -> RunReport:
+    """
+    Run all the variants of the solutions of the given days (by default, all of them) on their
+    default input, using a pool of `jobs` processes (by default, one per CPU). The other
+    arguments are passed to `run_day`, except `memo_store` which is the persistent memo store
+    used by the processes (see `aoc.use_memo_store`).
+    """
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+    work = [(day, variant, memory, counters, cache, snapshot) for day in days for variant in variants(day)]
+    start = time.perf_counter()
+    initializer = partial(aoc.use_memo_store, memo_store) if memo_store is not None else None
+    with ProcessPoolExecutor(jobs, initializer=initializer) as executor:
+        records = list(executor.map(_run_job, work))
+    return RunReport(jobs, time.perf_counter() - start, records)
@@ -0,0 +1,57 @@
+"""
+Save the parsed representation of an input file to a binary snapshot, and load it instead of
+parsing the file again.
+
+A snapshot is a pickle stored next to the input file, in a hidden file whose name contains the
+name of the variant of the solution and a hash of the input and of the sources of the
+solutions (see `aoc.cache.key`), so that a stale snapshot is never loaded. Storing a snapshot
+deletes the stale snapshots of the same input and variant. Since snapshots are pickles, they must only be shared with trusted
+users. Parsed data which cannot be pickled is simply not saved.
+"""
+
+import glob
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any
+
+
+def snapshot_path(input: str | Path, variant: str, key: str) -> Path:
+    """
+    Return the path of the snapshot of `input`, parsed by the given variant, with the given key.
+    """
+    input = Path(input)
+    return input.parent / f".{input.name}.{variant}.{key[:16]}.snapshot"
+
+
+def load(path: str | Path) -> Any:
+    """
+    Return the data saved in the snapshot at `path`. Raise `FileNotFoundError` if there is
+    no snapshot.
+    """
+    with open(path, "rb") as f:
+        return pickle.load(f)
+
+
+def store(path: str | Path, data: Any) -> bool:
+    """
+    Save `data` to a snapshot at `path`, and return whether it has been saved. The file is
+    written atomically, so that concurrent runs never read a partial snapshot, and the other
+    snapshots of the same input and variant, i.e. with another key, are deleted.
+    """
+    path = Path(path)
+    try:
+        content = pickle.dumps(data, pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return False
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    with os.fdopen(fd, "wb") as f:
+        f.write(content)
+    os.replace(tmp, path)
+    prefix = path.name.rsplit(".", 2)[0]
+    for stale in path.parent.glob(f"{glob.escape(prefix)}.*.snapshot"):
+        # the prefix of another variant may match the pattern
+        if stale != path and stale.name.rsplit(".", 2)[0] == prefix:
+            stale.unlink(missing_ok=True)
+    return True
@@ -0,0 +1,108 @@
+"""
+Persistent storage for the tables of memoized functions, so that they start warm across runs.
+
+The tables are stored in a SQLite database, as chunks of entries: each flush appends a new
+chunk, which is a pickled dictionary. Loading a table with many entries is much faster this
+way than with one row per entry, since the entries are unpickled at once. Since keys and
+values are pickled, the database must only be shared with trusted users, like any other pickle.
+
+Each table is identified by a name and by a hash of the source of the memoized function, so
+that changing the function starts a new table; a persisted function must depend only on its
+arguments and its source.
+
+New entries are kept in memory and written to the database by `flush`, which is called by the
+runner at the end of each run and by `aoc` at exit.
+"""
+
+import hashlib
+import os
+import pickle
+import sqlite3
+from pathlib import Path
+from typing import Any
+
+MEMO_STORE_ENV = "AOC_MEMO_STORE"
+"""Environment variable giving the path of the database of the persistent memo store."""
+
+MAX_CHUNKS = 16
+"""Number of chunks of a table above which they are merged into one when loading it."""
+
+
+def table_name(name: str, source: str) -> str:
+    """
+    Return the name of the table of a function called `name` whose source is `source`.
+    """
+    return f"{name}:{hashlib.sha256(source.encode()).hexdigest()[:16]}"
+
+
+class MemoStore:
+    """
+    A persistent store of memoization tables, backed by a SQLite database.
+    """
+
+    def __init__(self, path: str | Path):
+        """
+        Initialize the store backed by the database at `path`, which is created if needed.
+        The database is only opened when first used.
+        """
+        self.path = Path(path)
+        self._connection: sqlite3.Connection | None = None
+        self._pid: int | None = None
+        self._pending: dict[str, dict[Any, Any]] = {}
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Return the connection to the database, opening it if needed. A connection is never
+        shared between processes, since it is not safe to use it after a fork.
+        """
+        if self._connection is None or self._pid != os.getpid():
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(self.path, timeout=60)
+            self._pid = os.getpid()
+            self._connection.execute("CREATE TABLE IF NOT EXISTS memo (tab TEXT, entries BLOB)")
+            self._connection.execute("CREATE INDEX IF NOT EXISTS memo_tab ON memo (tab)")
+        return self._connection
+
+    def load(self, table: str) -> dict[Any, Any]:
+        """
+        Return all the entries of a table. If the table has too many chunks, they are merged.
+        """
+        connection = self._connect()
+        entries: dict[Any, Any] = {}
+        chunks = 0
+        for (chunk,) in connection.execute("SELECT entries FROM memo WHERE tab = ?", (table,)):
+            entries.update(pickle.loads(chunk))
+            chunks += 1
+        if chunks > MAX_CHUNKS:
+            with connection:
+                connection.execute("DELETE FROM memo WHERE tab = ?", (table,))
+                connection.execute("INSERT INTO memo VALUES (?, ?)", (table, pickle.dumps(entries)))
+        return entries
+
+    def add(self, table: str, key: Any, value: Any):
+        """
+        Add an entry to a table. It is written to the database by the next `flush`.
+        """
+        self._pending.setdefault(table, {})[key] = value
+
+    def flush(self):
+        """
+        Write the new entries to the database, as a new chunk of each table. Entries added
+        concurrently by other processes are kept, since they have the same values.
+        """
+        if not self._pending:
+            return
+        connection = self._connect()
+        with connection:
+            connection.executemany("INSERT INTO memo VALUES (?, ?)",
+                                   [(table, pickle.dumps(entries)) for table, entries in self._pending.items()])
+        self._pending.clear()
+
+    def close(self):
+        """
+        Flush the new entries and close the database.
+        """
+        self.flush()
+        if self._connection is not None and self._pid == os.getpid():
+            self._connection.close()
+        self._connection = None
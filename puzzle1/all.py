@@ -2,18 +2,19 @@
 This program solves both parts of Day 1 puzzle.
 """
 
+from array import array
 from collections import Counter
 from typing import Iterable
 
 from aoc import *
 
 
-def parse_input(content: file_content):
+def parse_input(content: text_data) -> tuple[array[int], array[int]]:
     """
-    Convert the file content into a pair of iterables.
+    Convert the file content into a pair of arrays.
     """
-    l = (map(int, line.split()) for line in content)
-    return zip(*l)
+    ints = parse_ints(content)
+    return ints[0::2], ints[1::2]
 
 
 def distance(l1: Iterable[int], l2: Iterable[int]) -> int:
@@ -31,11 +32,30 @@ def similarity(l1: Iterable[int], l2: Iterable[int]) -> int:
     return sum(x*d[x] for x in l1)
 
 
+def parse(filename: str) -> tuple[Iterable[int], Iterable[int]]:
+    """
+    Read the two lists of location IDs from the given file.
+    """
+    l1, l2 = parse_input(mapfile(filename))
+    return l1, l2
+
+
+def part1(data: tuple[Iterable[int], Iterable[int]]) -> int:
+    return distance(*data)
+
+
+def part2(data: tuple[Iterable[int], Iterable[int]]) -> int:
+    return similarity(*data)
+
+
+register_variant(1, "all", parse, part1, part2)
+
+
 def main():
-    content = readfile("example")
-    l1, l2 = parse_input(content)
-    print("part 1:", distance(l1, l2))
-    print("part 2:", similarity(l1, l2))
+    data = parse("example")
+    print("part 1:", part1(data))
+    print("part 2:", part2(data))
 
 
-main()
+if __name__ == "__main__":
+    main()
@@ -57,8 +57,27 @@ def parse_input(content: file_content) -> topomap:
     return m
 
 
-content = readfile("input")
-m = parse_input(content)
-score, rating = trail_score(m)
-print("part 1:", score)
-print("part 2:", rating)
+def parse(filename: str) -> topomap:
+    return parse_input(readfile(filename))
+
+
+def part1(m: topomap) -> int:
+    return trail_score(m)[0]
+
+
+def part2(m: topomap) -> int:
+    return trail_score(m)[1]
+
+
+register_variant(10, "all", parse, part1, part2)
+
+
+def main():
+    m = parse("input")
+    score, rating = trail_score(m)
+    print("part 1:", score)
+    print("part 2:", rating)
+
+
+if __name__ == "__main__":
+    main()
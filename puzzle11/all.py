@@ -2,12 +2,13 @@
 This program solves both parts of the Day 11 puzzle.
 """
 
-import functools
-
 from aoc import *
 
+BLINK_CACHE_SIZE = 1 << 20
+"""Maximum number of entries in the cache of `blink`."""
+
 
-@functools.cache
+@memo(maxsize=BLINK_CACHE_SIZE, persist="day11.blink")
 def blink(x: int, n: int) -> int:
     """
     Blink a single stone x for n times, and return the final number of stones.
@@ -34,15 +35,30 @@ def parse_line(line: str) -> list[int]:
     """
     Parse the input line.
     """
-    return list(map(int, line.split()))
+    return list(parse_ints(line))
+
+
+def parse(filename: str) -> list[int]:
+    return parse_line(readfile(filename)[0])
+
+
+def part1(l: list[int]) -> int:
+    return blink_line(l, 25)
+
+
+def part2(l: list[int]) -> int:
+    return blink_line(l, 75)
+
+
+register_variant(11, "all", parse, part1, part2, description="fully recursive memoized blink")
 
 
 def main():
-    content = readfile("input")
-    l = parse_line(content[0])
-    print("part 1:", blink_line(l, 25))
-    print("part 2:", blink_line(l, 75))
+    l = parse("input")
+    print("part 1:", part1(l))
+    print("part 2:", part2(l))
     print(blink.cache_info())
 
 
-main()
+if __name__ == "__main__":
+    main()
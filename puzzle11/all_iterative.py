@@ -0,0 +1,71 @@
+"""
+This program solves both parts of the Day 11 puzzle.
+
+This is the version from `recursion_iteration_comparison.ipynb` which mixes iteration and
+recursion: the `blink` function iterates on the number of steps, but recurses on the newly
+spawned stone.
+"""
+
+from aoc import *
+
+BLINK_CACHE_SIZE = 1 << 20
+"""Maximum number of entries in the cache of `blink`."""
+
+
+@memo(maxsize=BLINK_CACHE_SIZE, persist="day11.blink")
+def blink(x: int, n: int) -> int:
+    """
+    Blink a single stone x for n times, and return the final number of stones.
+    """
+    total = 1
+    for i in range(n):
+        if x == 0:
+            x = 1
+        elif (sizex := len(str(x))) % 2 == 0:
+            pow = 10 ** (sizex // 2)
+            total += blink(x % pow, n - i - 1)
+            x = x // pow
+        else:
+            x *= 2024
+    return total
+
+
+def blink_line(l: list[int], n: int) -> int:
+    """
+    Blink the line l for n times, and return the final the number of stones.
+    """
+    return sum(blink(v, n) for v in l)
+
+
+def parse_line(line: str) -> list[int]:
+    """
+    Parse the input line.
+    """
+    return list(parse_ints(line))
+
+
+def parse(filename: str) -> list[int]:
+    return parse_line(readfile(filename)[0])
+
+
+def part1(l: list[int]) -> int:
+    return blink_line(l, 25)
+
+
+def part2(l: list[int]) -> int:
+    return blink_line(l, 75)
+
+
+register_variant(11, "all_iterative", parse, part1, part2,
+                 description="memoized blink, iterating on steps and recursing on new stones")
+
+
+def main():
+    l = parse("input")
+    print("part 1:", part1(l))
+    print("part 2:", part2(l))
+    print(blink.cache_info())
+
+
+if __name__ == "__main__":
+    main()
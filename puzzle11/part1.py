@@ -27,23 +27,32 @@ def parse_line(line: str) -> list[int]:
     """
     Parse the input line.
     """
-    return list(map(int, line.split()))
+    return list(parse_ints(line))
 
 
-def main():
-    content = readfile("input")
-    line = parse_line(content[0])
+def parse(filename: str) -> list[int]:
+    return parse_line(readfile(filename)[0])
+
 
+def part1(line: list[int]) -> int:
     #print(f"step 0 length {len(line)}")
     #print(line)
     for i in range(25):
         line = blink_line(line)
         #print(f"step {i+1} length {len(line):_}")
         #if len(line) < 100: print(line)
-    print("part 1:", len(line))
+    return len(line)
     # An attemp to run 75 iterations fails at iteration 45 on my PC, since the process is
     # killed by the OOM killer.
     # At iteration 44, the line was 606_737_523 positions long
 
 
-main()
+register_variant(11, "part1", parse, part1, description="only part 1, simulating the line of stones")
+
+
+def main():
+    print("part 1:", part1(parse("input")))
+
+
+if __name__ == "__main__":
+    main()
@@ -36,13 +36,13 @@ class garden:
     A garde, comprised of a map and a sequence of regions.
     """
 
-    def __init__(self, map: list[str]):
+    def __init__(self, grid: Grid):
         """
         Initialize the garden structure and computes the regions.
         """
-        self.map: list[str] = map
-        self.nrow: int = len(map)
-        self.ncol: int = len(map[0])
+        self.map: list[bytes] | list[memoryview] = grid.rows()
+        self.nrow: int = grid.nrow
+        self.ncol: int = grid.ncol
         self.regions: list[region] = []
         self._compute_regions()
 
@@ -94,7 +94,7 @@ class garden:
             for j in range(self.ncol):
                 if not visited[i][j]:
                     self.regions.append(
-                        region(self.map[i][j], *analyze_cell(i, j)))
+                        region(chr(self.map[i][j]), *analyze_cell(i, j)))
 
     def compute_costs(self):
         """
@@ -107,11 +107,27 @@ class garden:
         return cost1, cost2
 
 
+def parse(filename: str) -> garden:
+    return garden(readgrid(filename))
+
+
+def part1(m: garden) -> int:
+    return m.compute_costs()[0]
+
+
+def part2(m: garden) -> int:
+    return m.compute_costs()[1]
+
+
+register_variant(12, "all", parse, part1, part2)
+
+
 def main():
-    m = garden(readfile("input"))
+    m = parse("input")
     cost1, cost2 = m.compute_costs()
     print("part 1:", cost1)
     print("part 2:", cost2)
 
 
-main()
+if __name__ == "__main__":
+    main()
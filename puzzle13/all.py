@@ -2,8 +2,7 @@
 This program solves both parts of the Day 13 puzzle.
 """
 
-import re
-from typing import Generator, NamedTuple
+from typing import NamedTuple
 
 from aoc import *
 
@@ -25,40 +24,11 @@ class machine(NamedTuple):
     posy: int
 
 
-def read_machines(filename: str) -> Generator[machine, None, None]:
+def read_machines(filename: str) -> list[machine]:
     """
-    Generator which reads machines from the given file.
+    Read the machines from the given file. Each machine is made of six integers.
     """
-    with openfile(filename) as f:
-        while True:
-            line = f.readline()
-            if line == "":
-                return None
-
-            m = re.match(r".*\+(\d+).*\+(\d+)", line)
-            # just to please the type checker
-            if m is None:
-                return None
-            ax, ay = int(m[1]), int(m[2])
-
-            line = f.readline()
-            m = re.match(r".*\+(\d+).*\+(\d+)", line)
-            # just to please the type checker
-            if m is None:
-                return None
-            bx, by = int(m[1]), int(m[2])
-
-            line = f.readline()
-            m = re.match(r".*=(\d+).*=(\d+)", line)
-            # just to please the type checker
-            if m is None:
-                return None
-            posx, posy = int(m[1]), int(m[2])
-
-            # skip empty line
-            f.readline()
-
-            yield machine(ax, ay, bx, by, posx, posy)
+    return [machine(*row) for row in parse_int_matrix(mapfile(filename), 6)]
 
 
 def solve_machine(m: machine) -> int | None:
@@ -84,17 +54,35 @@ def solve_machine(m: machine) -> int | None:
     return None
 
 
-def main():
-    cost1 = cost2 = 0
-    for m1 in read_machines("input"):
+def parse(filename: str) -> list[machine]:
+    return read_machines(filename)
+
+
+def part1(machines: list[machine]) -> int:
+    cost1 = 0
+    for m1 in machines:
         if cost := solve_machine(m1):
             cost1 += cost
+    return cost1
+
+
+def part2(machines: list[machine]) -> int:
+    cost2 = 0
+    for m1 in machines:
         m2 = m1._replace(posx=m1.posx + INCREASE, posy=m1.posy + INCREASE)
         if cost := solve_machine(m2):
             cost2 += cost
+    return cost2
 
-    print("part 1:", cost1)
-    print("part 2:", cost2)
+
+register_variant(13, "all", parse, part1, part2, description="solving a linear system")
+
+
+def main():
+    machines = parse("input")
+    print("part 1:", part1(machines))
+    print("part 2:", part2(machines))
 
 
-main()
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,8 @@ This program solves part 1 of the Day 13 puzzle with a brute force approach.
 from typing import TextIO, NamedTuple
 import re
 
+from aoc import *
+
 COSTA = 3
 COSTB = 1
 MAX_STEPS = 100
@@ -68,10 +70,21 @@ def solve_machine(m: machine) -> int | None:
         i += 1
     return min_cost if min_cost < MAX_COST+1 else None
 
-with open("puzzle13/input") as f:
+def parse(filename: str) -> list[machine]:
+    machines: list[machine] = []
+    with openfile(filename) as f:
+        while m := read_machine(f):
+            machines.append(m)
+    return machines
+
+def part1(machines: list[machine]) -> int:
     cost = 0
-    while m := read_machine(f):
+    for m in machines:
         if m_cost := solve_machine(m):
             cost +=  m_cost
+    return cost
+
+register_variant(13, "part1", parse, part1, description="only part 1, brute force")
 
-print("part 1:", cost)
+if __name__ == "__main__":
+    print("part 1:", part1(parse("input")))
@@ -3,12 +3,14 @@ This program solves both parts of the Day 14 puzzle.
 """
 
 import math
-import re
-from dataclasses import dataclass
-from typing import Generator
+from dataclasses import dataclass, replace
 
 from aoc import *
 
+# SIZE_X, SIZE_Y = 11, 7  # example
+SIZE_X, SIZE_Y = 101, 103
+"""Size of the bathroom."""
+
 
 @dataclass
 class robot:
@@ -69,7 +71,7 @@ class bathroom:
         return math.prod(quadrants)
 
     def __str__(self) -> str:
-        s = [[" "] * SIZE_X for _ in range(SIZE_Y)]
+        s = [[" "] * self.sizex for _ in range(self.sizey)]
         for r in self.robots:
             s[r.posy][r.posx] = "*"
         return "\n".join(["".join(line) for line in s])
@@ -78,41 +80,45 @@ class bathroom:
         """
         Return whether the robots form a Christmas tree.
         """
-        star_line = "*" * (SIZE_X // 4)
+        star_line = "*" * (self.sizex // 4)
         return str(self).find(star_line) != -1
 
 
-def parse_robots(content: file_content) -> Generator[robot, None, None]:
+def parse_robots(content: text_data) -> list[robot]:
     """
-    A generator yield the robots encoded in the given file content.
+    Return the robots encoded in the given file content. Each robot is made of four integers.
     """
-    for line in content:
-        if line == "":
-            break
-        data, = re.findall(
-            r"p=([-]?\d+),([-]?\d+) v=([-]?\d+),([-]?\d+)", line)
-        yield robot(*map(int, data))
+    return [robot(*row) for row in parse_int_matrix(content, 4)]
 
 
-def main():
-    # data = ("example", 11, 7)
-    data = ("input", 101, 103)
+def parse(filename: str) -> list[robot]:
+    return parse_robots(mapfile(filename))
+
+
+def part1(robots: list[robot]) -> int:
+    br = bathroom([replace(r) for r in robots], SIZE_X, SIZE_Y)
+    for _ in range(100):
+        br.step()
+    return br.safety_factor()
+
 
-    content = readfile(data[0])
-    robots = [r for r in parse_robots(content)]
-    br = bathroom(robots, data[1], data[2])
+def part2(robots: list[robot]) -> int:
+    br = bathroom([replace(r) for r in robots], SIZE_X, SIZE_Y)
     time: int = 0
-    tree_time = None
-    safety_factor = None
-    while time <= 100 or tree_time is None:
-        if br.is_christmas_tree() and tree_time is None:
-            tree_time = time
-        if time == 100:
-            safety_factor = br.safety_factor()
-            print("part 1:", safety_factor)
+    while not br.is_christmas_tree():
         br.step()
         time += 1
-    print("part 2:", tree_time)
+    return time
+
+
+register_variant(14, "all", parse, part1, part2, description="step by step simulation")
+
+
+def main():
+    robots = parse("input")
+    print("part 1:", part1(robots))
+    print("part 2:", part2(robots))
 
 
-main()
+if __name__ == "__main__":
+    main()
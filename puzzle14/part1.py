@@ -6,6 +6,7 @@ import re
 import math
 from typing import NamedTuple, TextIO
 
+from aoc import *
 
 SIZE_X = 101
 SIZE_Y = 103
@@ -34,10 +35,22 @@ def quadrant(x: int, y: int) -> int | None:
     else:
         return 2*(y < SIZE_Y // 2) + (x < SIZE_X // 2)
 
-with open("puzzle14/input") as f:
+def parse(filename: str) -> list[robot]:
+    robots: list[robot] = []
+    with openfile(filename) as f:
+        while r := read_robot(f):
+            robots.append(r)
+    return robots
+
+def part1(robots: list[robot]) -> int:
     quadrants = [0] * 4
-    while r := read_robot(f):
+    for r in robots:
         x, y = r.time_lapse(TIME_STEPS)
         if ((q := quadrant(x, y)) is not None):
             quadrants[q] += 1
-print("part 1:", math.prod(quadrants))
+    return math.prod(quadrants)
+
+register_variant(14, "part1", parse, part1, description="only part 1, closed-form time lapse")
+
+if __name__ == "__main__":
+    print("part 1:", part1(parse("input")))
@@ -146,16 +146,37 @@ def read_moves(f: TextIO) -> str:
     return "".join(f.read().splitlines())
 
 
-with openfile("input") as f:
-    w_map = read_map(f)
-    moves = read_moves(f)
-
-w1 = warehouse(w_map)
-for m in moves:
-    w1.move(m)
-print("part 1:", w1.score())
-
-w2 = warehouse(w_map, wide=True)
-for m in moves:
-    w2.move(m)
-print("part 2:", w2.score())
+def parse(filename: str) -> tuple[list[str], str]:
+    with openfile(filename) as f:
+        w_map = read_map(f)
+        moves = read_moves(f)
+    return w_map, moves
+
+
+def part1(data: tuple[list[str], str]) -> int:
+    w_map, moves = data
+    w1 = warehouse(w_map)
+    for m in moves:
+        w1.move(m)
+    return w1.score()
+
+
+def part2(data: tuple[list[str], str]) -> int:
+    w_map, moves = data
+    w2 = warehouse(w_map, wide=True)
+    for m in moves:
+        w2.move(m)
+    return w2.score()
+
+
+register_variant(15, "all", parse, part1, part2)
+
+
+def main():
+    data = parse("input")
+    print("part 1:", part1(data))
+    print("part 2:", part2(data))
+
+
+if __name__ == "__main__":
+    main()
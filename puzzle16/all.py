@@ -61,7 +61,7 @@ class Day16Maze(Maze):
             di, dj = dir.delta()
             i_new, j_new = i + di, j + dj
             m = [((i_new, j_new, dir), 1)
-                 ] if self.map[i_new][j_new] != "#" else []
+                 ] if self.map[i_new][j_new] != WALL else []
             m += [
                 ((i, j, dir.rotate_clockwise()), 1000),
                 ((i, j, dir.rotate_counterclockwise()), 1000)]
@@ -69,19 +69,34 @@ class Day16Maze(Maze):
 
         start = (self.i_start, self.j_start, Direction.RIGHT)
         ends = [(self.i_end, self.j_end, dir) for dir in Direction]
-        dijkstra = Dijkstra(start, moves)
-        ends_with_cost = [(end, dijkstra.dists[end]) for end in ends]
-        end, cost = min(ends_with_cost, key=lambda x: x[1])
-        nodes = {(i, j) for i, j, _ in dijkstra.nodes_in_path(end)}
+        dijkstra = Dijkstra(start, moves, targets=ends, max_weight=1000)
+        cost = min(dijkstra.dists[end] for end in ends if end in dijkstra.dists)
+        best_ends = [end for end in ends if dijkstra.dists.get(end) == cost]
+        nodes = {(i, j) for i, j, _ in dijkstra.nodes_in_path(*best_ends)}
         return cost, len(nodes)
 
 
+def parse(filename: str) -> Day16Maze:
+    return Day16Maze(readgrid(filename))
+
+
+def part1(maze: Day16Maze) -> int:
+    return maze.shortest_path_with_preds()[0]
+
+
+def part2(maze: Day16Maze) -> int:
+    return maze.shortest_path_with_preds()[1]
+
+
+register_variant(16, "all", parse, part1, part2)
+
+
 def main():
-    content = readfile("input")
-    maze = Day16Maze(content)
+    maze = parse("input")
     cost, prevs = maze.shortest_path_with_preds()
     print("part 1:", cost)
     print("part 2:", prevs)
 
 
-main()
+if __name__ == "__main__":
+    main()
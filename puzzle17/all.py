@@ -108,12 +108,30 @@ def find_num(mem: list[int], v: int, i: int) -> int | None:
         return None
 
 
-def main():
-    regs, mem = read_data("input")
-    pc = cpu(mem, regs)
+def parse(filename: str) -> tuple[list[int], list[int]]:
+    return read_data(filename)
+
+
+def part1(data: tuple[list[int], list[int]]) -> str:
+    regs, mem = data
+    pc = cpu(mem, regs.copy())
     pc.execute()
-    print("part 1:", ",".join(map(str, pc.out)))
-    print("part 2:", find_num(mem, 0, len(mem)-1))
+    return ",".join(map(str, pc.out))
+
+
+def part2(data: tuple[list[int], list[int]]) -> int | None:
+    _, mem = data
+    return find_num(mem, 0, len(mem)-1)
+
+
+register_variant(17, "all", parse, part1, part2)
+
+
+def main():
+    data = parse("input")
+    print("part 1:", part1(data))
+    print("part 2:", part2(data))
 
 
-main()
+if __name__ == "__main__":
+    main()
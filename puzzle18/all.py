@@ -4,6 +4,10 @@ This program solves both parts of the Day 18 puzzle.
 
 from aoc import *
 
+# SIZE, TIME = 7, 12  # example
+SIZE, TIME = 71, 1024
+"""Size of the memory space and number of bytes fallen for part 1."""
+
 
 class Day18Maze(Maze):
     """
@@ -12,18 +16,23 @@ class Day18Maze(Maze):
 
     def __init__(self, size: int, drops: list[tuple[int, int]]):
         """
-        Initialize the object from the map given as a list of strings.
+        Initialize an empty maze of the given size, where bytes will fall at the given positions.
         """
-        self.nrow = self.ncol = size
-        self.map = [["."] * size for _ in range(size)]
+        self.size = size
         self.i_start, self.j_start = 0, 0
         self.i_end, self.j_end = size-1, size - 1
         self.drops = drops
+        self.set_time(0)
 
     def set_time(self, t: int):
-        for i in range(t):
-            j, i = self.drops[i]
-            self.map[i][j] = "#"
+        """
+        Set the maze to its state once the first `t` bytes have fallen.
+        """
+        size = self.size
+        cells = bytearray(b".") * (size * size)
+        for j, i in self.drops[:t]:
+            cells[i * size + j] = WALL
+        self._set_cells(cells, size, size)
 
 
 def parse_input(input: list[str]) -> list[tuple[int, int]]:
@@ -33,25 +42,39 @@ def parse_input(input: list[str]) -> list[tuple[int, int]]:
     return [(int(lsplit[0]), int(lsplit[1])) for l in input for lsplit in (l.split(","),)]
 
 
-def main():
-    # data = ("example", 7, 12)
-    data = ("input", 71, 1024)
+def parse(filename: str) -> list[tuple[int, int]]:
+    return parse_input(readfile(filename))
+
 
-    drops = parse_input(readfile(data[0]))
-    m = Day18Maze(data[1], drops)
-    m.set_time(data[2])
+def part1(drops: list[tuple[int, int]]) -> int | None:
+    m = Day18Maze(SIZE, drops)
+    m.set_time(TIME)
+    return m.shortest_path()
 
-    cost = m.shortest_path()
-    print("part 1:", cost)
 
-    t = data[2] + 1
-    while True:
+def part2(drops: list[tuple[int, int]]) -> str:
+    m = Day18Maze(SIZE, drops)
+    # the end stays reachable after TIME bytes, and once blocked it stays blocked: find the
+    # first time it is blocked by bisection
+    low, high = TIME, len(drops)
+    while high - low > 1:
+        t = (low + high) // 2
         m.set_time(t)
-        cost = m.shortest_path()
-        if cost is None:
-            break
-        t += 1
-    print("part 2:",  drops[t-1])
+        if m.shortest_path() is None:
+            high = t
+        else:
+            low = t
+    return ",".join(map(str, drops[high-1]))
+
+
+register_variant(18, "all", parse, part1, part2)
+
+
+def main():
+    drops = parse("input")
+    print("part 1:", part1(drops))
+    print("part 2:", part2(drops))
 
 
-main()
+if __name__ == "__main__":
+    main()
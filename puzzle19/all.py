@@ -2,7 +2,6 @@
 This program solves both parts of the Day 20 puzzle.
 """
 
-import functools
 from operator import methodcaller
 from typing import TextIO
 
@@ -23,34 +22,67 @@ def read_designs(f: TextIO) -> list[str]:
     return f.read().splitlines()
 
 
+def design_position(design: str, towels: list[str], start: int) -> tuple[str, int]:
+    """
+    Return the cache key of `reachable_pattern`, which leaves out the towels since they
+    are the same for all the designs.
+    """
+    return design, start
+
+
+@memo(key=design_position)
+def reachable_pattern(design: str, towels: list[str], start: int) -> int:
+    """
+    Return the number of ways it is possible to produce the design from position
+    `start` with the given set of towels. The cache is keyed on the design and `start`,
+    hence it must be cleared when changing the set of towels.
+    """
+    if start == len(design):
+        return 1
+    count = 0
+    for pattern in towels:
+        plen = len(pattern)
+        if design[start:start+plen] == pattern:
+            count += reachable_pattern(design, towels, start+plen)
+    return count
+
+
 def reachable(design: str, towels: list[str]) -> int:
     """
     Return the number of ways it is possible to produce the design with the
     given set of towels.
     """
-
-    @functools.cache
-    def reachable_pattern(start: int) -> int:
-        if start == len(design):
-            return 1
-        count = 0
-        for pattern in towels:
-            plen = len(pattern)
-            if design[start:start+plen] == pattern:
-                count += reachable_pattern(start+plen)
-        return count
-
-    return reachable_pattern(0)
+    with reachable_pattern.scope():
+        return reachable_pattern(design, towels, 0)
 
 
-def main():
-    with openfile("input") as f:
+def parse(filename: str) -> tuple[list[str], list[str]]:
+    with openfile(filename) as f:
         towels = read_towels(f)
         f.readline()
         designs = read_designs(f)
+    return towels, designs
+
+
+def part1(data: tuple[list[str], list[str]]) -> int:
+    towels, designs = data
+    return sum(bool(reachable(pattern, towels)) for pattern in designs)
+
+
+def part2(data: tuple[list[str], list[str]]) -> int:
+    towels, designs = data
+    return sum(reachable(pattern, towels) for pattern in designs)
+
+
+register_variant(19, "all", parse, part1, part2)
+
+
+def main():
+    towels, designs = parse("input")
     reachables = [reachable(pattern, towels) for pattern in designs]
     print("part 1:", sum(map(bool, reachables)))
     print("part 2:", sum(reachables))
 
 
-main()
+if __name__ == "__main__":
+    main()
@@ -33,23 +33,33 @@ def is_safe(r: report) -> bool:
     return True
 
 
-def parse_input(content: file_content) -> list[report]:
+def parse_input(content: text_data) -> list[report]:
     """
     Parse the input as a list of reports.
     """
-    return [list(map(int, line.split())) for line in content]
+    return parse_int_matrix(content, typecode=None)
+
+
+def parse(filename: str) -> list[report]:
+    return parse_input(mapfile(filename))
+
+
+def part1(data: list[report]) -> int:
+    return sum(is_safe(r) for r in data)
+
+
+def part2(data: list[report]) -> int:
+    return sum(is_safe_with_dampener(r) for r in data)
+
+
+register_variant(2, "all", parse, part1, part2)
 
 
 def main():
-    content = readfile("input")
-    data = parse_input(content)
-    count = 0
-    count_dampener = 0
-    for report in data:
-        count += is_safe(report)
-        count_dampener += is_safe_with_dampener(report)
-    print("part 1:", count)
-    print("part 2:", count_dampener)
-
-
-main()
+    data = parse("input")
+    print("part 1:", part1(data))
+    print("part 2:", part2(data))
+
+
+if __name__ == "__main__":
+    main()
@@ -22,7 +22,7 @@ class Day20Maze(Maze):
             for i_new in range(i-steps, i+steps+1)
             for j_new in range(j-steps+abs(i_new - i), j+steps+1-abs(i_new - i))
             if 0 <= i_new < self.nrow and 0 <= j_new < self.ncol
-            if self.map[i_new][j_new] != "#"
+            if self.map[i_new][j_new] != WALL
         ]
 
     def shortest_path_with_cheat(self, steps: int) -> int | None:
@@ -30,20 +30,22 @@ class Day20Maze(Maze):
         Return the number of cheats of length `steps` or less which makes you
         gain 100 picoseconds or more.
         """
-        pos_end = self.i_end, self.j_end
-        dijkstra1 = self.dijkstra()
-        dijkstra2 = self.dijkstra(pos_end)
-        path = dijkstra1.path_compute(pos_end)
-        if path is None:
+        ncol, node_ids = self.ncol, self.node_ids
+        dists1 = self.distance_field((self.i_start, self.j_start))
+        dists2 = self.distance_field((self.i_end, self.j_end))
+        length = dists1[self.node((self.i_end, self.j_end))]
+        if length == Dijkstra.UNREACHABLE:
             return None
-        length = dijkstra1.dists[pos_end]
         gains = [0] * length
-        for pos in path:
-            cheats = self.cheats(pos, steps)
-            for cheat_pos in cheats:
-                first_piece = dijkstra1.dists[pos]
-                second_piece = dijkstra2.dists.get(cheat_pos, None)
-                if second_piece is not None:
+        # the positions on the race track are the ones on a shortest path
+        track = [node for node, (first_piece, second_piece) in enumerate(zip(dists1, dists2))
+                 if first_piece != Dijkstra.UNREACHABLE and first_piece + second_piece == length]
+        for node in track:
+            first_piece = dists1[node]
+            pos = self.node_position(node)
+            for cheat_pos in self.cheats(pos, steps):
+                second_piece = dists2[node_ids[cheat_pos[0] * ncol + cheat_pos[1]]]
+                if second_piece != Dijkstra.UNREACHABLE:
                     gain = length - first_piece - second_piece - \
                         (abs(cheat_pos[0]-pos[0])+abs(cheat_pos[1]-pos[1]))
                     if gain >= 0:
@@ -51,11 +53,26 @@ class Day20Maze(Maze):
         return sum(gains[100:])
 
 
+def parse(filename: str) -> Day20Maze:
+    return Day20Maze(readgrid(filename))
+
+
+def part1(maze: Day20Maze) -> int | None:
+    return maze.shortest_path_with_cheat(2)
+
+
+def part2(maze: Day20Maze) -> int | None:
+    return maze.shortest_path_with_cheat(20)
+
+
+register_variant(20, "all", parse, part1, part2)
+
+
 def main():
-    content = readfile("input")
-    maze = Day20Maze(content)
-    print("part 1:", maze.shortest_path_with_cheat(2))
-    print("part 2:", maze.shortest_path_with_cheat(20))
+    maze = parse("input")
+    print("part 1:", part1(maze))
+    print("part 2:", part2(maze))
 
 
-main()
+if __name__ == "__main__":
+    main()
@@ -2,8 +2,6 @@
 This program solves both parts of the Day 21 puzzle.
 """
 
-import functools
-
 from aoc import *
 
 type keypad = dict[str, tuple[int, int]]
@@ -55,7 +53,7 @@ def keyboard_command(code: str, n: int) -> int:
     return moves
 
 
-@functools.cache
+@memo(persist="day21.direction_command")
 def direction_command(code: str, n: int) -> int:
     """
     Return the number of keys needed to type the directional code `code` with `n`
@@ -89,13 +87,26 @@ def complexity(code: str, length: int) -> int:
     return length * num
 
 
-def main():
-    codes = readfile("input")
-    part1 = sum(complexity(code, 2) for code in codes)
-    print("part 1:", part1)
+def parse(filename: str) -> list[str]:
+    return readfile(filename)
+
+
+def part1(codes: list[str]) -> int:
+    return sum(complexity(code, 2) for code in codes)
+
 
-    part2 = sum(complexity(code, 25) for code in codes)
-    print("part 2:", part2)
+def part2(codes: list[str]) -> int:
+    return sum(complexity(code, 25) for code in codes)
+
+
+register_variant(21, "all", parse, part1, part2)
+
+
+def main():
+    codes = parse("input")
+    print("part 1:", part1(codes))
+    print("part 2:", part2(codes))
 
 
-main()
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,7 @@ This program solves both parts of the Day 22 puzzle.
 
 from collections import Counter
 from functools import reduce
+from typing import Iterable
 
 from aoc import *
 
@@ -13,7 +14,7 @@ STEPS = 2000
 """Number of steps of the negotiation."""
 
 
-def parse_input(content: list[str]) -> list[int]:
+def parse_input(content: Iterable[str]) -> list[int]:
     """
     Parse the input and return a list of secret numbers.
     """
@@ -65,13 +66,28 @@ def merge_gains(buyer_gains: list[Counter[prize_changes]]) -> Counter[prize_chan
     return counter
 
 
-def main():
-    content = readfile("input")
-    secrets = parse_input(content)
-    print("part 1:", sum(simulate(secret, STEPS) for secret in secrets))
+def parse(filename: str) -> list[int]:
+    return parse_input(iterlines(filename))
+
+
+def part1(secrets: list[int]) -> int:
+    return sum(simulate(secret, STEPS) for secret in secrets)
+
+
+def part2(secrets: list[int]) -> int:
     buyer_gains = [compute_gains(secret, STEPS) for secret in secrets]
     total_gains = merge_gains(buyer_gains)
-    print("part 2:", max(total_gains.values()))
+    return max(total_gains.values())
+
+
+register_variant(22, "all", parse, part1, part2)
+
+
+def main():
+    secrets = parse("input")
+    print("part 1:", part1(secrets))
+    print("part 2:", part2(secrets))
 
 
-main()
+if __name__ == "__main__":
+    main()
@@ -78,11 +78,26 @@ class computer_graph:
         return oldcliques[0]
 
 
+def parse(filename: str) -> computer_graph:
+    return computer_graph(readfile(filename))
+
+
+def part1(graph: computer_graph) -> int:
+    return len(graph.filtered_triples())
+
+
+def part2(graph: computer_graph) -> str:
+    return ",".join(graph.lan_party())
+
+
+register_variant(23, "all", parse, part1, part2)
+
+
 def main():
-    content = readfile("input")
-    graph = computer_graph(content)
-    print("part 1:", len(graph.filtered_triples()))
-    print("part 2:", ",".join(graph.lan_party()))
+    graph = parse("input")
+    print("part 1:", part1(graph))
+    print("part 2:", part2(graph))
 
 
-main()
+if __name__ == "__main__":
+    main()
@@ -211,16 +211,34 @@ class logic_circuit:
             raise ValueError(f"i=last carry: {carry}")
 
 
-def main():
-    content = readfile("input")
+SWAPS = [("vvr", "z08"), ("bkr", "rnq"), ("tfb", "z28"), ("mqh", "z39")]
+"""The swaps which fix the circuit in my input, found with the help of `adder_match`."""
+
+
+def parse(filename: str) -> file_content:
+    return readfile(filename)
+
+
+def part1(content: file_content) -> int:
     c = logic_circuit(content, [])
-    print("part 1:", c.bus_value("z"))
+    return c.bus_value("z")
+
 
-    swaps = [("vvr", "z08"), ("bkr", "rnq"), ("tfb", "z28"), ("mqh", "z39")]
-    c = logic_circuit(content, swaps)
+def part2(content: file_content) -> str:
+    c = logic_circuit(content, SWAPS)
     c.adder_match()
-    flat_swaps = [x for pair in swaps for x in pair]
-    print("part 2:", ",".join(sorted(flat_swaps)))
+    flat_swaps = [x for pair in SWAPS for x in pair]
+    return ",".join(sorted(flat_swaps))
+
+
+register_variant(24, "all", parse, part1, part2)
+
+
+def main():
+    content = parse("input")
+    print("part 1:", part1(content))
+    print("part 2:", part2(content))
 
 
-main()
+if __name__ == "__main__":
+    main()
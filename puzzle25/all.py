@@ -2,45 +2,47 @@
 This program solves the Day 25 puzzle.
 """
 
+from itertools import chain
+from typing import Iterable
+
 from aoc import *
 
 
-def parse_key(l: list[str], i: int) -> tuple[bool, list[int], int]:
+def parse_key(block: list[str]) -> tuple[bool, list[int]]:
     """
-    Parse a single key or lock, starting at row `i` of the input.
+    Parse a single key or lock, given as the list of its rows.
 
     Returns:
         - a boolean (which is True for locks and False for keys)
         - the key/lock
-        - the length of the ley
     """
-    res: list[int] = [0] * len(l[i])
-    t = l[i][0]
-    i += 1
-    lenkey = 1
-    while i < len(l) and l[i] != "":
-        lenkey += 1
-        for j in range(len(l[i])):
-            if l[i][j] == t:
+    res: list[int] = [0] * len(block[0])
+    t = block[0][0]
+    for line in block[1:]:
+        for j in range(len(line)):
+            if line[j] == t:
                 res[j] += 1
-        i += 1
-    return (t == "#", res, lenkey)
+    return (t == "#", res)
 
 
-def parse_input(content: list[str]) -> tuple[list[list[int]], list[list[int]]]:
+def parse_input(content: Iterable[str]) -> tuple[list[list[int]], list[list[int]]]:
     """
-    Parse the file content into a list of keys and locks.
+    Parse the file content into a list of keys and locks. Keys and locks are separated
+    by empty lines.
     """
     keys: list[list[int]] = []
     locks: list[list[int]] = []
-    i = 0
-    while i < len(content):
-        t, val, lenkey = parse_key(content, i)
-        if t:
-            locks.append(val)
-        else:
-            keys.append(val)
-        i += lenkey + 1
+    block: list[str] = []
+    for line in chain(content, [""]):
+        if line != "":
+            block.append(line)
+        elif block:
+            t, val = parse_key(block)
+            if t:
+                locks.append(val)
+            else:
+                keys.append(val)
+            block = []
     return keys, locks
 
 def count_fits(keys: list[list[int]], locks: list[list[int]]) -> int:
@@ -54,10 +56,22 @@ def count_fits(keys: list[list[int]], locks: list[list[int]]) -> int:
                 count += 1
     return count
 
+def parse(filename: str) -> tuple[list[list[int]], list[list[int]]]:
+    return parse_input(iterlines(filename))
+
+
+def part1(data: tuple[list[list[int]], list[list[int]]]) -> int:
+    return count_fits(*data)
+
+
+register_variant(25, "all", parse, part1)
+
+
 def main():
-    content = readfile("input")
-    keys, locks = parse_input(content)
+    keys, locks = parse("input")
     print("part 1:", count_fits(keys, locks))
     print("part 2: gift!!!")
 
-main()
\ No newline at end of file
+
+if __name__ == "__main__":
+    main()
@@ -70,13 +70,37 @@ class Computer:
                 self.mul(int(m[1]), int(m[2]))
 
 
-def main():
+def run_program(content: file_content) -> Computer:
+    """
+    Return a computer which has executed the corrupted program in `content`.
+    """
     computer = Computer()
-    content = readfile("input")
     for line in content:
         computer.parse(line)
+    return computer
+
+
+def parse(filename: str) -> file_content:
+    return readfile(filename)
+
+
+def part1(content: file_content) -> int:
+    return run_program(content).total
+
+
+def part2(content: file_content) -> int:
+    return run_program(content).guarded_total
+
+
+register_variant(3, "all", parse, part1, part2)
+
+
+def main():
+    content = parse("input")
+    computer = run_program(content)
     print("part 1:", computer.total)
     print("part 2:", computer.guarded_total)
 
 
-main()
+if __name__ == "__main__":
+    main()
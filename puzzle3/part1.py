@@ -5,7 +5,7 @@ This program solves part 1 of Day 3 puzzle.
 from aoc import *
 
 
-def parse(s: str):
+def parse_line(s: str) -> int:
     """
     Find the mul instructions in `s` and returns the result of the their execution.
     """
@@ -17,12 +17,20 @@ def parse(s: str):
     return total
 
 
+def parse(filename: str) -> file_content:
+    return readfile(filename)
+
+
+def part1(content: file_content) -> int:
+    return sum(parse_line(line) for line in content)
+
+
+register_variant(3, "part1", parse, part1, description="only part 1, mul instructions only")
+
+
 def main():
-    total = 0
-    content = readfile("input")
-    for line in content:
-        total += parse(line)
-    print(total)
+    print(part1(parse("input")))
 
 
-main()
+if __name__ == "__main__":
+    main()
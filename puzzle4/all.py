@@ -52,10 +52,26 @@ def search_x_word(m: list[str], word: str):
     return count
 
 
+def parse(filename: str) -> file_content:
+    return readfile(filename)
+
+
+def part1(matrix: file_content) -> int:
+    return search_word(matrix, "XMAS")
+
+
+def part2(matrix: file_content) -> int:
+    return search_x_word(matrix, "MAS")
+
+
+register_variant(4, "all", parse, part1, part2)
+
+
 def main():
-    matrix = readfile("input")
-    print("part 1:", search_word(matrix, "XMAS"))
-    print("part 2:", search_x_word(matrix, "MAS"))
+    matrix = parse("input")
+    print("part 1:", part1(matrix))
+    print("part 2:", part2(matrix))
 
 
-main()
+if __name__ == "__main__":
+    main()
@@ -6,7 +6,7 @@ defined class which extends int with a new ordering.
 """
 
 from itertools import pairwise
-from typing import Callable, TextIO
+from typing import Callable, Iterable, TextIO
 
 from aoc import *
 
@@ -35,7 +35,7 @@ def read_constraints(file: TextIO) -> multidict[int, int]:
     return constraints
 
 
-def check_constraints(file: TextIO, constraints: multidict[int, int]) -> tuple[int, int]:
+def check_constraints(file: Iterable[str], constraints: multidict[int, int]) -> tuple[int, int]:
     """
     Check that sequences read from `file` satisfy `constraints`.
     """
@@ -52,12 +52,34 @@ def check_constraints(file: TextIO, constraints: multidict[int, int]) -> tuple[i
     return count1, count2
 
 
-def main():
-    with openfile("input") as file:
+def parse(filename: str) -> tuple[multidict[int, int], list[str]]:
+    """
+    Read the page ordering and the list of updates from the specified file.
+    """
+    with openfile(filename) as file:
         constraints = read_constraints(file)
-        count1, count2 = check_constraints(file, constraints)
+        return constraints, file.readlines()
+
+
+def part1(data: tuple[multidict[int, int], list[str]]) -> int:
+    constraints, updates = data
+    return check_constraints(updates, constraints)[0]
+
+
+def part2(data: tuple[multidict[int, int], list[str]]) -> int:
+    constraints, updates = data
+    return check_constraints(updates, constraints)[1]
+
+
+register_variant(5, "all2", parse, part1, part2, description="sorting with a dynamically defined subclass of int")
+
+
+def main():
+    constraints, updates = parse("input")
+    count1, count2 = check_constraints(updates, constraints)
     print("part 1:", count1)
     print("part 2:", count2)
 
 
-main()
+if __name__ == "__main__":
+    main()
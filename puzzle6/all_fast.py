@@ -4,8 +4,6 @@ This program solves both parts of the Day 6 puzzle.
 This uses less abstractions and is faster of the other solution.
 """
 
-import time
-
 from aoc import *
 
 type vector2d = tuple[int, int]
@@ -121,16 +119,30 @@ def find_loops(g: guard) -> int:
     return num_loops
 
 
-def main():
-    content = readfile("input")
-    g = guard(content)
+def parse(filename: str) -> guard:
+    return guard(readfile(filename))
+
+
+def part1(g: guard) -> int:
+    g.clear()
+    g.run()
+    return g.count_visited()
+
+
+def part2(g: guard) -> int:
+    g.clear()
     g.run()
-    print("part 1:", g.count_visited())
-    print("part 2:", find_loops(g))
+    return find_loops(g)
+
+
+register_variant(6, "all_fast", parse, part1, part2, description="less abstractions")
+
+
+def main():
+    g = parse("input")
+    print("part 1:", part1(g))
+    print("part 2:", part2(g))
 
 
-# import cProfile
-# cProfile.run('main()')
-start_time = time.time()
-main()
-print(f"--- {(time.time() - start_time)} seconds ---")
+if __name__ == "__main__":
+    main()
@@ -27,26 +27,33 @@ def feasible(operands: list[int], pos: int, result: int, allow_concatenation: bo
     return False
 
 
-def parse_line(line: str) -> tuple[list[int], int]:
+def parse(filename: str) -> list[tuple[list[int], int]]:
     """
-    Parse a single line of the file in a pair made of a sequence of operand and the sought result.
+    Parse the file in a list of pairs made of a sequence of operands and the sought result.
+    Results may not fit in 64 bits, hence they are parsed as lists.
     """
-    l1, l2 = line.split(":")
-    return list(map(int, l2.split())), int(l1)
+    return [(row[1:], row[0]) for row in parse_int_matrix(mapfile(filename), typecode=None)]
+
+
+def part1(equations: list[tuple[list[int], int]]) -> int:
+    return sum(result for operands, result in equations
+               if feasible(operands, len(operands) - 1, result))
+
+
+def part2(equations: list[tuple[list[int], int]]) -> int:
+    return sum(result for operands, result in equations
+               if feasible(operands, len(operands) - 1, result)
+               or feasible(operands, len(operands) - 1, result, allow_concatenation=True))
+
+
+register_variant(7, "all", parse, part1, part2)
 
 
 def main():
-    part1 = part2 = 0
-    content = readfile("input")
-    for line in content:
-        operands, result = parse_line(line)
-        if feasible(operands, len(operands) - 1, result):
-            part1 += result
-            part2 += result
-        elif feasible(operands, len(operands) - 1, result, allow_concatenation=True):
-            part2 += result
-    print("part 1:", part1)
-    print("part 2:", part2)
-
-
-main()
+    equations = parse("input")
+    print("part 1:", part1(equations))
+    print("part 2:", part2(equations))
+
+
+if __name__ == "__main__":
+    main()
@@ -109,13 +109,26 @@ class antinodes:
         return out
 
 
+def parse(filename: str) -> antennas_disposition:
+    return antennas_disposition(readfile(filename))
+
+
+def part1(ad: antennas_disposition) -> int:
+    return antinodes(ad).size()
+
+
+def part2(ad: antennas_disposition) -> int:
+    return antinodes(ad, True).size()
+
+
+register_variant(8, "all", parse, part1, part2)
+
+
 def main():
-    content = readfile("input")
-    ad = antennas_disposition(content)
-    an1 = antinodes(ad)
-    an2 = antinodes(ad, True)
-    print("part 1:", an1.size())
-    print("part 2:", an2.size())
+    ad = parse("input")
+    print("part 1:", part1(ad))
+    print("part 2:", part2(ad))
 
 
-main()
+if __name__ == "__main__":
+    main()
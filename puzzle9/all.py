@@ -114,16 +114,30 @@ def compute_checksum(um: uncompressed_map) -> int:
     return sum(i * v for i, v in enumerate(um) if v != -1)
 
 
-def main():
-    content = readfile("input")
-    cm = read_compressed_map(content[0])
+def parse(filename: str) -> compressed_map:
+    return read_compressed_map(readfile(filename)[0])
+
 
+def part1(cm: compressed_map) -> int:
     um = uncompress_map(cm)
     defragment_map(um)
-    print("part 1:", compute_checksum(um))
+    return compute_checksum(um)
 
+
+def part2(cm: compressed_map) -> int:
+    cm = cm.copy()
     defragment_map_block(cm)
-    print("part 2:", compute_checksum(uncompress_map(cm)))
+    return compute_checksum(uncompress_map(cm))
+
+
+register_variant(9, "all", parse, part1, part2)
+
+
+def main():
+    cm = parse("input")
+    print("part 1:", part1(cm))
+    print("part 2:", part2(cm))
 
 
-main()
+if __name__ == "__main__":
+    main()
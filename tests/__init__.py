@@ -0,0 +1,3 @@
+"""
+Tests of the `aoc` package, run from the root of the repository with `python -m unittest`.
+"""
@@ -0,0 +1,118 @@
+"""
+Tests of the functions reading and parsing the input files.
+"""
+
+import os
+import tempfile
+import types
+import unittest
+from array import array
+from pathlib import Path
+from unittest import mock
+
+import aoc
+from aoc import Grid, iterlines, mapfile, parse_int_matrix, parse_ints, readfile, readgrid
+
+
+class InputTest(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+
+    def write(self, content: bytes, name: str = "input") -> str:
+        """
+        Write `content` to a file of the temporary directory and return its absolute path.
+        """
+        path = self.directory / name
+        path.write_bytes(content)
+        return str(path)
+
+    def test_paths(self):
+        filename = self.write(b"a\nb\n")
+        self.assertEqual(readfile(filename), ["a", "b"])
+        # in an interactive session, there is no main script and relative names are taken
+        # in the current directory
+        with mock.patch.object(aoc, "__main__", types.ModuleType("__main__")):
+            cwd = os.getcwd()
+            os.chdir(self.directory)
+            self.addCleanup(os.chdir, cwd)
+            self.assertEqual(readfile("input"), ["a", "b"])
+
+    def test_readgrid(self):
+        rows = [b"#.#", b"..#"]
+        contents = [
+            b"#.#\n..#\n",
+            b"#.#\r\n..#\r\n",
+            b"#.#\n..#",
+            b"#.#\r\n..#",
+            b"#.#\n..#\n\n1 2\n",
+            b"#.#\r\n..#\r\n\r\n1 2\r\n",
+        ]
+        for content in contents:
+            grid = readgrid(self.write(content))
+            self.assertEqual((grid.nrow, grid.ncol), (2, 3), content)
+            self.assertEqual([bytes(row) for row in grid.rows()], rows, content)
+            self.assertEqual(grid[1, 2], ord("#"), content)
+            self.assertEqual(grid.find("#", 1), (0, 2), content)
+            self.assertEqual(grid.find(ord("."), 2), (1, 0), content)
+            self.assertEqual(str(grid), "#.#\n..#", content)
+            copy = grid.copy()
+            copy[1, 0] = ord("#")
+            self.assertEqual(bytes(copy.row(1)), b"#.#", content)
+            self.assertEqual(grid[1, 0], ord("."), content)
+        self.assertEqual(readgrid(self.write(b"")).nrow, 0)
+        self.assertEqual(str(Grid.from_lines(["ab", "cd"])), "ab\ncd")
+
+    def test_iterlines(self):
+        # the CRLF after "ab" is split across the chunks of 3 bytes, and the second line is
+        # longer than a chunk
+        content = b"ab\r\ncdefghij\r\n\r\nk\nlast"
+        lines = ["ab", "cdefghij", "", "k", "last"]
+        filename = self.write(content)
+        for chunk_size in range(1, len(content) + 2):
+            self.assertEqual(list(iterlines(filename, chunk_size)), lines, chunk_size)
+            self.assertEqual(list(iterlines(filename, chunk_size, binary=True)),
+                             [line.encode() for line in lines], chunk_size)
+        self.assertEqual(list(iterlines(self.write(content + b"\r\n"), 3)), lines)
+        self.assertEqual(list(iterlines(self.write(b"a\n\n"), 1)), ["a", ""])
+        self.assertEqual(list(iterlines(self.write(b""))), [])
+
+
+    def test_parse_ints(self):
+        self.assertEqual(list(parse_ints("1 -2\n-3,x4\n\n")), [1, -2, -3, 4])
+        self.assertEqual(parse_ints(b"-5 6", None), [-5, 6])
+        # dashes which are not minus signs
+        self.assertEqual(list(parse_ints("3-4 a-b 7")), [3, -4, 7])
+        self.assertEqual(parse_ints("a-b 1-", None), [1])
+        self.assertEqual(parse_int_matrix("3-4\na-b\n5 6"), [array("q", [3, -4]), array("q", [5, 6])])
+        # integers which do not fit in 64 bits
+        large = [2 ** 63, -2 ** 63 - 1, 10 ** 30]
+        text = " ".join(map(str, large))
+        with self.assertRaises(OverflowError):
+            parse_ints(text)
+        self.assertEqual(parse_ints(text, None), large)
+        self.assertEqual(parse_ints(text.replace(" ", "-"), None), [large[0], large[1], -large[2]])
+        self.assertEqual(parse_int_matrix(text + "\n1", typecode=None), [large, [1]])
+        self.assertEqual(parse_int_matrix(text + " 1", 2, typecode=None), [large[:2], [large[2], 1]])
+
+    def test_parse_int_matrix(self):
+        # lines of 2 integers and records of 3, over several chunks of 1 MiB
+        values = [(i * 7919) % 100003 - 50000 for i in range(400000)]
+        content = "".join(f"{a}  {b}\n" for a, b in zip(values[::2], values[1::2]))
+        self.assertGreater(len(content), 2 << 20)
+        data = mapfile(self.write(content.encode()))
+        self.assertEqual(parse_ints(data), array("q", values))
+        self.assertEqual(parse_int_matrix(data), [array("q", values[i:i + 2]) for i in range(0, len(values), 2)])
+        records = parse_int_matrix(data, 4)
+        self.assertEqual(records, [array("q", values[i:i + 4]) for i in range(0, len(values), 4)])
+        self.assertEqual(parse_int_matrix(data, 5, typecode=None), [values[i:i + 5] for i in range(0, len(values), 5)])
+        with self.assertRaises(ValueError):
+            parse_int_matrix(data, 3)
+        with self.assertRaises(ValueError):
+            parse_int_matrix(data, 3, typecode=None)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+"""
+Tests of the `aoc.memo` decorator.
+"""
+
+import sqlite3
+import tempfile
+import unittest
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Literal
+
+from aoc import flush_memo_store, memo, use_memo_store
+from aoc.store import MAX_CHUNKS, MemoStore, table_name
+
+
+class MemoTest(unittest.TestCase):
+
+    def test_hits_and_misses(self):
+        calls: list[int] = []
+
+        @memo
+        def square(n: int) -> int:
+            calls.append(n)
+            return n * n
+
+        self.assertEqual([square(n) for n in (2, 3, 2, 2)], [4, 9, 4, 4])
+        self.assertEqual(calls, [2, 3])
+        info = square.cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (2, 2, 2))
+        square.cache_clear()
+        self.assertEqual(square(2), 4)
+        self.assertEqual(square.cache_info().misses, 1)
+
+    def test_keyword_arguments(self):
+        @memo
+        def arguments(*args: Any, **kwargs: Any) -> tuple[tuple[Any, ...], dict[str, Any]]:
+            return args, kwargs
+
+        self.assertEqual(arguments(1, ("a", 2)), ((1, ("a", 2)), {}))
+        self.assertEqual(arguments(1, a=2), ((1,), {"a": 2}))
+        self.assertEqual(arguments(b=1, a=2), arguments(a=2, b=1))
+        self.assertEqual(arguments.cache_info().misses, 3)
+
+    def test_eviction_policies(self):
+        policies: list[tuple[Literal["lru", "fifo"], set[int]]] = [("lru", {1, 3}), ("fifo", {2, 3})]
+        for policy, kept in policies:
+            @memo(maxsize=2, policy=policy)
+            def identity(n: int) -> int:
+                return n
+
+            for n in (1, 2, 1, 3):
+                identity(n)
+            info = identity.cache_info()
+            self.assertEqual((info.currsize, info.evictions), (2, 1))
+            identity.reset_stats()
+            for n in kept:
+                identity(n)
+            self.assertEqual(identity.cache_info().hits, 2, policy)
+        unknown: Any = "random"
+        with self.assertRaises(ValueError):
+            memo(policy=unknown)
+
+    def test_key_and_scope(self):
+        calls: list[tuple[str, int]] = []
+
+        def position(text: str, start: int) -> int:
+            return start
+
+        @memo(key=position)
+        def suffix(text: str, start: int) -> str:
+            calls.append((text, start))
+            return text[start:]
+
+        with suffix.scope():
+            self.assertEqual(suffix("abc", 1), "bc")
+            self.assertEqual(suffix("xyz", 1), "bc")
+        self.assertEqual(suffix.cache_info().currsize, 0)
+        self.assertEqual(suffix("xyz", 1), "yz")
+        self.assertEqual(calls, [("abc", 1), ("xyz", 1)])
+
+
+class MemoStoreTest(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = Path(directory.name) / "memo.db"
+
+    def test_persist(self):
+        calls: list[int] = []
+
+        @memo(persist="test.cube")
+        def cube(n: int) -> int:
+            calls.append(n)
+            return n ** 3
+
+        use_memo_store(self.path)
+        self.addCleanup(use_memo_store, None)
+        self.assertEqual(cube(3), 27)
+        flush_memo_store()
+        # a new process would start with an empty cache and load the table from the store
+        use_memo_store(self.path)
+        cube.reset_stats()
+        self.assertEqual((cube(3), cube(4)), (27, 64))
+        info = cube.cache_info()
+        self.assertEqual((info.store_hits, info.misses), (1, 1))
+        self.assertEqual(calls, [3, 4])
+
+    def test_chunks_merged(self):
+        store = MemoStore(self.path)
+        self.addCleanup(store.close)
+        table = table_name("test.table", "source")
+        for k in range(MAX_CHUNKS + 1):
+            store.add(table, k, k * k)
+            store.flush()
+        self.assertEqual(store.load(table), {k: k * k for k in range(MAX_CHUNKS + 1)})
+        with closing(sqlite3.connect(self.path)) as connection:
+            self.assertEqual(connection.execute("SELECT COUNT(*) FROM memo").fetchone(), (1,))
+        self.assertEqual(store.load(table_name("test.table", "changed source")), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
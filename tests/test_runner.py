@@ -0,0 +1,88 @@
+"""
+Tests of the result cache and of the snapshots of the runner.
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from aoc import cache, snapshot
+from aoc.runner import run_day
+
+EXAMPLE = "3   4\n4   3\n2   5\n1   3\n3   9\n3   3\n"
+"""The example input of Day 1."""
+
+ANSWERS = {"part1": 11, "part2": 31}
+"""The answers of Day 1 for the example."""
+
+
+class CacheTest(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+        self.input = self.directory / "input"
+        self.input.write_text(EXAMPLE)
+        patch = mock.patch.dict("os.environ", {cache.CACHE_ENV: str(self.directory / "cache")})
+        patch.start()
+        self.addCleanup(patch.stop)
+
+    def test_cached_result(self):
+        first = run_day(1, input=self.input, cache=True)
+        second = run_day(1, input=self.input, cache=True)
+        self.assertEqual((first.cached, second.cached), (False, True))
+        self.assertEqual(first.answers, ANSWERS)
+        self.assertEqual(second.answers, ANSWERS)
+        self.assertEqual(second.times, first.times)
+
+    def test_changed_input(self):
+        run_day(1, input=self.input, cache=True)
+        self.input.write_text(EXAMPLE + "1   1\n")
+        record = run_day(1, input=self.input, cache=True)
+        self.assertFalse(record.cached)
+        self.assertEqual(record.answers, {"part1": 11, "part2": 33})
+        cache.clear()
+        self.assertFalse(run_day(1, input=self.input, cache=True).cached)
+
+
+class SnapshotTest(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+
+    def test_snapshot(self):
+        # Day 1 parses the input into arrays, Day 16 into a maze
+        maze = "#####\n#..E#\n#.#.#\n#S..#\n#####\n"
+        for day, content, answers in ((1, EXAMPLE, ANSWERS), (16, maze, {"part1": 1004, "part2": 5})):
+            input = self.directory / f"input{day}"
+            input.write_text(content)
+            first = run_day(day, input=input, snapshot=True)
+            second = run_day(day, input=input, snapshot=True)
+            self.assertEqual((first.snapshot, second.snapshot), (False, True))
+            self.assertEqual(first.answers, answers)
+            self.assertEqual(second.answers, answers)
+            self.assertEqual(len(list(self.directory.glob(f".input{day}.*.snapshot"))), 1)
+
+    def test_stale_snapshots(self):
+        input = self.directory / "input"
+        paths = [snapshot.snapshot_path(input, variant, key)
+                 for variant, key in (("all", "old"), ("all", "new"), ("all.fast", "old"), ("fast", "old"))]
+        for path in paths:
+            self.assertTrue(snapshot.store(path, path.name))
+        self.assertEqual(sorted(self.directory.glob(".input.*.snapshot")), sorted(paths[1:]))
+        self.assertEqual(snapshot.load(paths[1]), paths[1].name)
+
+    def test_unpicklable(self):
+        path = self.directory / "snapshot"
+        self.assertFalse(snapshot.store(path, lambda: None))
+        self.assertFalse(path.exists())
+        self.assertTrue(snapshot.store(path, [1, 2]))
+        self.assertEqual(snapshot.load(path), [1, 2])
+
+
+if __name__ == "__main__":
+    unittest.main()
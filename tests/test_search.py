@@ -0,0 +1,460 @@
+"""
+Tests of the priority queues and of the search algorithms of `aoc`, compared with the
+Bellman-Ford algorithm on small random graphs.
+"""
+
+import pickle
+import random
+import tempfile
+import unittest
+from array import array
+from pathlib import Path
+from typing import Callable
+
+from aoc import WALL, AStar, Dijkstra, Maze, Queue, ShortestPathDAG, bucket_queue, indexed_heap, priority_queue
+from aoc.runner import run_day
+
+type graph = dict[int, list[tuple[int, int]]]
+
+SEEDS = range(40)
+"""The seeds of the random graphs of each test."""
+
+
+def random_graph(seed: int, size: int = 12, max_weight: int = 5, density: float = 0.25) -> graph:
+    """
+    Return a random directed graph over `range(size)`, whose edges have weights between 1 and
+    `max_weight`, each edge being present with probability `density`.
+    """
+    rng = random.Random(seed)
+    return {src: [(dst, rng.randint(1, max_weight)) for dst in range(size) if dst != src and rng.random() < density]
+            for src in range(size)}
+
+
+def reference_distances(g: graph, start: int) -> dict[int, int]:
+    """
+    Return the distances from `start` to the nodes of `g` reachable from it, computed with
+    the Bellman-Ford algorithm.
+    """
+    dists = {start: 0}
+    for _ in range(len(g)):
+        for src, edges in g.items():
+            if src in dists:
+                for dst, w in edges:
+                    if dst not in dists or dists[src] + w < dists[dst]:
+                        dists[dst] = dists[src] + w
+    return dists
+
+
+def shortest_paths(g: graph, start: int, end: int) -> list[list[int]]:
+    """
+    Return all the shortest paths from `start` to `end` in `g`, whose weights are positive,
+    by enumerating all the simple paths.
+    """
+    dists = reference_distances(g, start)
+    if end not in dists:
+        return []
+    paths: list[list[int]] = []
+    stack = [([start], 0)]
+    while stack:
+        path, length = stack.pop()
+        if path[-1] == end:
+            if length == dists[end]:
+                paths.append(path)
+            continue
+        stack.extend((path + [dst], length + w) for dst, w in g[path[-1]]
+                     if dst not in path and length + w <= dists[end])
+    return paths
+
+
+def to_csr(g: graph) -> tuple[array[int], array[int], array[int]]:
+    """
+    Return a graph over `range(len(g))` in compressed sparse row format, as arrays of offsets,
+    targets and weights.
+    """
+    offsets, targets, weights = array("i", [0]), array("i"), array("i")
+    for node in range(len(g)):
+        for dst, w in g[node]:
+            targets.append(dst)
+            weights.append(w)
+        offsets.append(len(targets))
+    return offsets, targets, weights
+
+
+def random_maze(seed: int) -> list[str]:
+    """
+    Return the rows of a random maze with a start at the top left and an end at the bottom right.
+    """
+    rng = random.Random(seed)
+    nrow, ncol = rng.randint(1, 9), rng.randint(2, 9)
+    rows = [[rng.choice("#..") for _ in range(ncol)] for _ in range(nrow)]
+    rows[0][0], rows[-1][-1] = "S", "E"
+    return ["".join(row) for row in rows]
+
+
+def maze_distances(rows: list[str], start: tuple[int, int]) -> dict[tuple[int, int], int]:
+    """
+    Return the distances from `start` to the positions of a maze reachable from it, computed
+    with a breadth-first search.
+    """
+    dists = {start: 0}
+    frontier = [start]
+    while frontier:
+        next_frontier: list[tuple[int, int]] = []
+        for i, j in frontier:
+            for pos in ((i-1, j), (i+1, j), (i, j-1), (i, j+1)):
+                if 0 <= pos[0] < len(rows) and 0 <= pos[1] < len(rows[0]) and rows[pos[0]][pos[1]] != "#" \
+                        and pos not in dists:
+                    dists[pos] = dists[(i, j)] + 1
+                    next_frontier.append(pos)
+        frontier = next_frontier
+    return dists
+
+
+def sorted_prevs(prevs: dict[int, list[int]]) -> dict[int, list[int]]:
+    """
+    Return the predecessors of a Dijkstra search, in a canonical order.
+    """
+    return {node: sorted(p) for node, p in prevs.items()}
+
+
+class compaction_counter(priority_queue[int]):
+    """
+    A priority queue counting its compactions.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.compactions = 0
+
+    def compact(self):
+        self.compactions += 1
+        super().compact()
+
+
+class QueueTest(unittest.TestCase):
+
+    def test_priority_queue_compaction(self):
+        rng = random.Random(0)
+        pq = compaction_counter()
+        # the reference model maps each value in the queue to its priority and sequence number
+        model: dict[int, tuple[int, int]] = {}
+        for seq in range(5000):
+            value = rng.randrange(100)
+            operation = rng.random()
+            if operation < 0.6:
+                priority = rng.randrange(1000)
+                pq.add(value, priority)
+                model[value] = (priority, seq)
+            elif operation < 0.8:
+                if value in model:
+                    pq.remove(value)
+                    del model[value]
+                else:
+                    with self.assertRaises(KeyError):
+                        pq.remove(value)
+            elif model:
+                first = min(model, key=model.__getitem__)
+                self.assertEqual(pq.pop(), first)
+                del model[first]
+            else:
+                self.assertIsNone(pq.pop())
+            self.assertEqual(len(pq), len(model))
+            self.assertEqual(pq.removed, len(pq.heap) - len(model))
+        self.assertGreater(pq.compactions, 3)
+        expected = sorted(model, key=model.__getitem__)
+        self.assertEqual(list(iter(pq.pop, None)), expected)
+        self.assertEqual((len(pq), pq.removed), (0, 0))
+
+    def test_indexed_heap_order(self):
+        rng = random.Random(0)
+        pq = indexed_heap[int]()
+        priorities: dict[int, int] = {}
+        for _ in range(200):
+            value, priority = rng.randrange(50), rng.randrange(100)
+            pq.add(value, priority)
+            priorities[value] = priority
+        popped = list(iter(pq.pop, None))
+        self.assertEqual(sorted(popped), sorted(priorities))
+        self.assertEqual([priorities[v] for v in popped], sorted(priorities.values()))
+
+    def test_indexed_heap_dijkstra(self):
+        for seed in SEEDS:
+            g = random_graph(seed)
+            dijkstra = Dijkstra(0, g.__getitem__, queue=indexed_heap)
+            self.assertEqual(dijkstra.dists, reference_distances(g, 0))
+            self.assertEqual(sorted_prevs(dijkstra.prevs),
+                             sorted_prevs(Dijkstra(0, g.__getitem__, queue=priority_queue).prevs))
+
+    def test_bucket_queue_order(self):
+        pq = bucket_queue[str](2)
+        pq.add("a", 1)
+        pq.add("b", 0)
+        pq.add("c", 1)
+        pq.add("b", 2)
+        self.assertEqual(list(iter(pq.pop, None)), ["a", "c", "b"])
+        with self.assertRaises(ValueError):
+            pq.add("d", 5)
+
+    def test_bucket_queue_dijkstra(self):
+        for seed in SEEDS:
+            g = random_graph(seed)
+            dists = reference_distances(g, 0)
+            self.assertEqual(Dijkstra(0, g.__getitem__, max_weight=5).dists, dists)
+            self.assertEqual(Dijkstra(0, g.__getitem__, queue=bucket_queue, max_weight=7).dists, dists)
+        with self.assertRaises(ValueError):
+            Dijkstra(0, random_graph(0).__getitem__, queue=bucket_queue)
+
+
+class DijkstraTest(unittest.TestCase):
+
+    def test_targets(self):
+        for seed in SEEDS:
+            g = random_graph(seed)
+            full = Dijkstra(0, g.__getitem__)
+            rng = random.Random(seed)
+            targets = rng.sample(sorted(full.dists), min(3, len(full.dists)))
+            bound = max(full.dists[target] for target in targets)
+            partial = Dijkstra(0, g.__getitem__, targets=targets)
+            self.assertEqual(partial.dists, {n: d for n, d in full.dists.items() if d <= bound})
+            for target in targets:
+                self.assertEqual(sorted(partial.prevs[target]), sorted(full.prevs[target]))
+
+    def test_unreachable_target(self):
+        g: graph = {0: [(1, 1)], 1: [(0, 1)], 2: []}
+        self.assertEqual(Dijkstra(0, g.__getitem__, targets=[2]).dists, {0: 0, 1: 1})
+
+    def test_bidirectional(self):
+        for seed in SEEDS:
+            g = random_graph(seed)
+            reverse: graph = {node: [] for node in g}
+            for src, edges in g.items():
+                for dst, w in edges:
+                    reverse[dst].append((src, w))
+            weights = {(src, dst): w for src, edges in g.items() for dst, w in edges}
+            dists = reference_distances(g, 0)
+            queues: list[tuple[Callable[..., Queue[int]] | None, int | None]] = [
+                (None, None), (indexed_heap, None), (None, 5)]
+            for target in g:
+                for queue, max_weight in queues:
+                    result = Dijkstra.bidirectional(0, target, g.__getitem__, reverse.__getitem__,
+                                                    queue=queue, max_weight=max_weight)
+                    if target not in dists:
+                        self.assertIsNone(result)
+                        continue
+                    assert result is not None
+                    cost, path = result
+                    self.assertEqual(cost, dists[target])
+                    self.assertEqual((path[0], path[-1]), (0, target))
+                    self.assertEqual(sum(weights[edge] for edge in zip(path, path[1:])), cost)
+
+    def test_dense_distances(self):
+        for seed in SEEDS:
+            g = random_graph(seed)
+            dists = reference_distances(g, 0)
+            expected = [dists.get(node, Dijkstra.UNREACHABLE) for node in range(len(g))]
+            self.assertEqual(list(Dijkstra.dense_distances(0, g.__getitem__, len(g))), expected)
+            self.assertEqual(list(Dijkstra.dense_distances(0, g.__getitem__, len(g), max_weight=5)), expected)
+
+    def test_dense_distances_sources(self):
+        for seed in SEEDS:
+            g = random_graph(seed)
+            sources = {0: 3, 1: 0, 2: 7}
+            fields = {source: reference_distances(g, source) for source in sources}
+            expected = [min((offset + fields[source][node] for source, offset in sources.items()
+                             if node in fields[source]), default=Dijkstra.UNREACHABLE)
+                        for node in range(len(g))]
+            self.assertEqual(list(Dijkstra.dense_distances(sources, g.__getitem__, len(g))), expected)
+
+    def test_csr_distances(self):
+        for seed in SEEDS:
+            g = random_graph(seed)
+            offsets, targets, weights = to_csr(g)
+            self.assertEqual(Dijkstra.csr_distances(0, offsets, targets, weights),
+                             Dijkstra.dense_distances(0, g.__getitem__, len(g)))
+            self.assertEqual(Dijkstra.csr_distances(0, offsets, targets, weights, max_weight=5),
+                             Dijkstra.dense_distances(0, g.__getitem__, len(g)))
+
+    def test_from_csr(self):
+        for seed in SEEDS:
+            g = random_graph(seed)
+            offsets, targets, weights = to_csr(g)
+            dijkstra = Dijkstra(0, g.__getitem__)
+            csr = Dijkstra.from_csr(0, offsets, targets, weights)
+            self.assertEqual(csr.dists, dijkstra.dists)
+            self.assertEqual(sorted_prevs(csr.prevs), sorted_prevs(dijkstra.prevs))
+            ends = list(g)[-2:]
+            self.assertEqual(Dijkstra.from_csr(0, offsets, targets, weights, ends=ends).dists,
+                             Dijkstra(0, g.__getitem__, targets=ends).dists)
+            dists = reference_distances(g, 0)
+            for target in g:
+                astar = AStar.from_csr(0, target, offsets, targets, lambda _: 0, weights, bound=5 * len(g))
+                self.assertEqual(astar.distance, dists.get(target))
+
+
+class ShortestPathDAGTest(unittest.TestCase):
+
+    def test_paths(self):
+        for seed in SEEDS:
+            # few distinct weights, so that there are many shortest paths
+            g = random_graph(seed, size=9, max_weight=2, density=0.4)
+            dag = Dijkstra(0, g.__getitem__).dag
+            for end in g:
+                expected = shortest_paths(g, 0, end)
+                self.assertEqual(dag.count_paths(end), len(expected))
+                self.assertEqual(sorted(dag.paths(end)), sorted(expected))
+                self.assertEqual(dag.nodes(end), {node for path in expected for node in path})
+
+    def test_cycle_of_weight_zero(self):
+        g: graph = {0: [(1, 0)], 1: [(2, 0)], 2: [(1, 0), (3, 1)], 3: []}
+        dag: ShortestPathDAG[int] = Dijkstra(0, g.__getitem__).dag
+        self.assertEqual(list(dag.paths(3)), [[0, 1, 2, 3]])
+        self.assertEqual(dag.nodes(3), {0, 1, 2, 3})
+        with self.assertRaises(ValueError):
+            dag.count_paths(3)
+
+    def test_day16_examples(self):
+        # the paths of the reindeer maze go through all the nodes of the shortest paths
+        examples = {
+            "###############\n#.......#....E#\n#.#.###.#.###.#\n#.....#.#...#.#\n#.###.#####.#.#\n"
+            "#.#.#.......#.#\n#.#.#####.###.#\n#...........#.#\n###.#.#####.#.#\n#...#.....#.#.#\n"
+            "#.#.#.###.#.#.#\n#.....#...#.#.#\n#.###.#.#.#.#.#\n#S..#.....#...#\n###############\n":
+            {"part1": 7036, "part2": 45},
+            "#################\n#...#...#...#..E#\n#.#.#.#.#.#.#.#.#\n#.#.#.#...#...#.#\n#.#.#.#.###.#.#.#\n"
+            "#...#.#.#.....#.#\n#.#.#.#.#.#####.#\n#.#...#.#.#.....#\n#.#.#####.#.###.#\n#.#.#.......#...#\n"
+            "#.#.###.#####.###\n#.#.#...#.....#.#\n#.#.#.#####.###.#\n#.#.#.........#.#\n#.#.#.#########.#\n"
+            "#S#.............#\n#################\n":
+            {"part1": 11048, "part2": 64},
+        }
+        with tempfile.TemporaryDirectory() as directory:
+            for k, (maze, answers) in enumerate(examples.items()):
+                path = Path(directory) / f"example{k}"
+                path.write_text(maze)
+                record = run_day(16, input=path)
+                self.assertIsNone(record.error)
+                self.assertEqual(record.answers, answers)
+
+
+class AStarTest(unittest.TestCase):
+
+    def test_zero_heuristic(self):
+        for seed in SEEDS:
+            g = random_graph(seed)
+            weights = {(src, dst): w for src, edges in g.items() for dst, w in edges}
+            dists = reference_distances(g, 0)
+            for target in g:
+                astar = AStar(0, target, g.__getitem__, lambda _: 0)
+                self.assertEqual(astar.distance, dists.get(target))
+                path = astar.path_compute()
+                if target in dists:
+                    assert path is not None
+                    self.assertEqual(sum(weights[edge] for edge in zip(path, path[1:])), dists[target])
+                else:
+                    self.assertIsNone(path)
+
+    def test_manhattan_heuristic(self):
+        # a grid with random weights at least 1, where the Manhattan distance is admissible
+        rng = random.Random(0)
+        size = 8
+        cost = {(i, j): rng.randint(1, 4) for i in range(size) for j in range(size)}
+
+        def moves(pos: tuple[int, int]) -> list[tuple[tuple[int, int], int]]:
+            i, j = pos
+            return [(p, cost[p]) for p in ((i-1, j), (i+1, j), (i, j-1), (i, j+1)) if p in cost]
+
+        reference = Dijkstra((0, 0), moves).dists
+        for target in cost:
+            def heuristic(pos: tuple[int, int]) -> int:
+                return abs(pos[0] - target[0]) + abs(pos[1] - target[1])
+            for queue in (priority_queue, indexed_heap):
+                for bound in (None, 4 * size * size):
+                    astar = AStar((0, 0), target, moves, heuristic, queue=queue, bound=bound)
+                    self.assertEqual(astar.distance, reference[target])
+
+    def test_bucket_queue_rejected(self):
+        g = random_graph(0)
+        queue: Callable[..., Queue[int]] = bucket_queue
+        with self.assertRaises(ValueError):
+            AStar(0, 1, g.__getitem__, lambda _: 0, queue=queue)
+
+
+class MazeTest(unittest.TestCase):
+
+    def test_multi_source_distances(self):
+        for seed in SEEDS:
+            rows = random_maze(seed)
+            maze = Maze(rows)
+            rng = random.Random(seed)
+            open_positions = [maze.node_position(node) for node in range(len(maze.open_cells))]
+            sources = {pos: rng.randrange(3) for pos in rng.sample(open_positions, min(3, len(open_positions)))}
+            fields = {pos: maze_distances(rows, pos) for pos in sources}
+            distances = maze.multi_source_distances(sources)
+            for pos in open_positions:
+                expected = min((offset + fields[source][pos] for source, offset in sources.items()
+                                if pos in fields[source]), default=Dijkstra.UNREACHABLE)
+                self.assertEqual(distances[maze.node(pos)], expected)
+
+    def test_distance_field(self):
+        maze = Maze(["S..", ".#.", "..E"])
+        field = maze.distance_field((0, 0))
+        self.assertIs(maze.distance_field((0, 0)), field)
+        self.assertEqual(field[maze.node((2, 2))], 4)
+        maze.map[0][1] = WALL
+        maze.cache_clear()
+        self.assertEqual(maze.distance_field((0, 0))[maze.node((2, 2))], 4)
+        self.assertEqual(maze.distance_field((0, 0))[maze.node((0, 2))], 6)
+
+    def test_adjacency(self):
+        for seed in SEEDS:
+            rows = random_maze(seed)
+            maze = Maze(rows)
+            for i, row in enumerate(rows):
+                for j, cell in enumerate(row):
+                    if cell == "#":
+                        self.assertEqual(maze.node_ids[i * maze.ncol + j], -1)
+                        with self.assertRaises(ValueError):
+                            maze.node((i, j))
+                        continue
+                    self.assertEqual(maze.node_position(maze.node((i, j))), (i, j))
+                    expected = [pos for pos in ((i-1, j), (i+1, j), (i, j-1), (i, j+1))
+                                if 0 <= pos[0] < len(rows) and 0 <= pos[1] < len(row) and rows[pos[0]][pos[1]] != "#"]
+                    self.assertEqual(maze.adjacent_positions((i, j)), expected)
+
+    def test_searches(self):
+        for seed in SEEDS:
+            rows = random_maze(seed)
+            maze = Maze(rows)
+            dists = maze_distances(rows, (0, 0))
+            end = (maze.nrow - 1, maze.ncol - 1)
+            self.assertEqual({maze.node_position(node): d for node, d in maze.dijkstra().dists.items()}, dists)
+            self.assertEqual(maze.shortest_path(), dists.get(end))
+            astar = maze.astar()
+            self.assertEqual(astar.distance, dists.get(end))
+            path = astar.path_compute()
+            if end in dists:
+                assert path is not None
+                positions = [maze.node_position(node) for node in path]
+                self.assertEqual((positions[0], positions[-1]), ((0, 0), end))
+                self.assertEqual(len(path) - 1, dists[end])
+                for (i, j), pos in zip(positions, positions[1:]):
+                    self.assertIn(pos, maze.adjacent_positions((i, j)))
+
+    def test_walls_added(self):
+        maze = Maze(["S.#", "..#", "#.E"])
+        self.assertEqual(maze.shortest_path(), 4)
+        maze.map[2][1] = WALL
+        self.assertEqual(maze.cells[7], WALL)
+        maze.cache_clear()
+        self.assertIsNone(maze.shortest_path())
+
+    def test_pickle(self):
+        maze = Maze(random_maze(1))
+        maze.adjacency
+        copy: Maze = pickle.loads(pickle.dumps(maze))
+        self.assertEqual(copy.cells, maze.cells)
+        self.assertEqual(copy.shortest_path(), maze.shortest_path())
+        copy.map[0][1] = WALL
+        self.assertEqual(copy.cells[1], WALL)
+
+
+if __name__ == "__main__":
+    unittest.main()